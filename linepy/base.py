@@ -199,10 +199,10 @@ class BaseClient:
             self.token_manager.auth_token = auth_token
 
         # Save login result (for refresh token etc.)
-        if save and hasattr(self.login_handler, "_last_login_response"):
-            self.token_manager.save_login_result(
-                self.login_handler._last_login_response
-            )
+        if save:
+            login_response = self.login_handler.last_login_response
+            if login_response is not None:
+                self.token_manager.save_login_result(login_response)
 
         # Get profile
         self.profile = self.get_profile()
@@ -283,6 +283,7 @@ class BaseClient:
 
     def close(self):
         """Close client connections"""
+        self.login_handler.close()
         self.request.close()
 
     def __enter__(self):
@@ -376,7 +377,7 @@ class BaseClient:
         if on_event:
             self.push.on_event = on_event
 
-        self.push.start(services=[3], fetch_type=fetch_type)  # Square only
+        self.push.start(services=(3,), fetch_type=fetch_type)  # Square only
         pass
 
     def stop_push(self):
@@ -386,7 +387,13 @@ class BaseClient:
 
     # ========== Polling (High-frequency alternative) ==========
 
-    def start_polling(self, chat_mids: List[str], on_event: Callable = None, fetch_type: int = 2):
+    def start_polling(
+        self,
+        chat_mids: List[str],
+        on_event: Callable = None,
+        fetch_type: int = 2,
+        use_async: bool = False,
+    ):
         """
         Start high-frequency polling for Square events.
 
@@ -397,11 +404,16 @@ class BaseClient:
             chat_mids: Square chat MIDs to watch
             on_event: Callback function(service_type, event_data)
             fetch_type: 1=Default, 2=Prefetch By Server (recommended)
+            use_async: Poll all chats as asyncio tasks over one HTTP/2
+                       connection instead of one thread per chat
         """
-        from .polling import PollingManager
+        from .polling import AsyncPollingManager, PollingManager
 
         if not hasattr(self, 'polling') or self.polling is None:
-            self.polling = PollingManager(self)
+            if use_async:
+                self.polling = AsyncPollingManager(self)
+            else:
+                self.polling = PollingManager(self)
 
         self.polling.start(
             watched_chats=chat_mids,
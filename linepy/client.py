@@ -184,7 +184,7 @@ class Client:
         if on_event:
             self.push.on_event = on_event
 
-        self.push.start(services=[3], fetch_type=fetch_type)  # Square only
+        self.push.start(services=(3,), fetch_type=fetch_type)  # Square only
 
     def send_video(self, to: str, path: str) -> str:
         """
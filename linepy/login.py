@@ -10,11 +10,19 @@ Handles various login methods:
 
 import binascii
 import hashlib
+import io
+import logging
 import os
 import base64
+import random
 import re
+import threading
+import time
+import urllib.parse
 from typing import Optional, Tuple, Dict, Any, List
 
+import httpx
+
 from .thrift import TType
 from .config import Device, is_v3_support
 from .models.login import (
@@ -34,10 +42,26 @@ from pydantic import BaseModel
 
 T = TypeVar("T", bound=BaseModel)  # Loginクラス内で使うため定義
 
+logger = logging.getLogger("linepy.login")
+
 
 # Regex patterns (from linejs)
 EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
-PASSWORD_REGEX = re.compile(r"^.{6,}$")  # At least 6 characters
+PASSWORD_MIN_LENGTH = 6
+
+# Log a progress line every N expired long-polls while waiting for the user
+POLL_PROGRESS_EVERY = 5
+
+
+def _poll_backoff(errors: int, deadline: float) -> float:
+    """
+    Delay before retrying a failed verification poll.
+
+    Exponential (2s, 4s, 8s ... capped at 30s) with up to 1s of jitter,
+    never sleeping past the polling deadline.
+    """
+    delay = min(30.0, 2.0 ** errors) + random.uniform(0, 1)
+    return max(0.0, min(delay, deadline - time.monotonic()))
 
 
 class LoginError(Exception):
@@ -65,11 +89,39 @@ class Login:
     E2EE_VERIFY_ENDPOINT = "/LF1"
     LEGACY_VERIFY_ENDPOINT = "/Q"
 
+    # Static headers for PIN verification polls (x-line-access added per call)
+    VERIFY_HEADERS = {
+        "x-lal": "ja_JP",
+        "x-lpv": "1",
+        "x-lhm": "GET",
+    }
+
     def __init__(self, client: "BaseClient"):
         self.client = client
         self._cert_cache: Dict[str, str] = {}
         self._qr_cert: Optional[str] = None
 
+        # Persistent client for PIN verification long-polls (reuses TLS session)
+        self._http = httpx.Client(http2=True, timeout=120.0)
+        self._verify_urls: Dict[str, str] = {}
+
+        # Last qrCodeLoginV2 response (see last_login_response)
+        self._last_login_response_raw: Optional[BaseModel] = None
+        self._last_login_response: Optional[Dict] = None
+
+    def close(self):
+        """Close verification HTTP client"""
+        self._http.close()
+
+    @property
+    def last_login_response(self) -> Optional[Dict]:
+        """Last QR login response as a dict (for storage), or None"""
+        if self._last_login_response is None and self._last_login_response_raw:
+            self._last_login_response = self._last_login_response_raw.model_dump(
+                by_alias=True
+            )
+        return self._last_login_response
+
     # ========== Certificate Management ==========
 
     def register_cert(self, email: str, cert: str):
@@ -113,7 +165,7 @@ class Login:
 
         return response
 
-    def _encrypt_rsa(self, message: str, nvalue: str, evalue: str) -> str:
+    def _encrypt_rsa(self, message: bytes, nvalue: str, evalue: str) -> str:
         """
         Encrypt message with RSA public key.
 
@@ -134,7 +186,7 @@ class Login:
         cipher = PKCS1_v1_5.new(key)
 
         # Encrypt
-        encrypted = cipher.encrypt(message.encode("utf-8"))
+        encrypted = cipher.encrypt(bytes(message))
         return binascii.hexlify(encrypted).decode()
 
     # ========== E2EE Helpers ==========
@@ -151,25 +203,24 @@ class Login:
             Tuple of (secret_key_bytes, url_params_string)
         """
         try:
-            from nacl.public import PrivateKey
+            from nacl.bindings import crypto_box_keypair
         except ImportError:
             raise ImportError(
                 "pynacl is required for E2EE. Install with: pip install pynacl"
             )
 
         # Generate Curve25519 key pair (matching linejs nacl.box.keyPair())
-        private_key = PrivateKey.generate()
-        public_key = private_key.public_key
-
-        # Encode public key to base64 and URL-encode it
-        import urllib.parse
+        # The raw binding returns bytes directly, no PrivateKey/PublicKey wrappers
+        public_key, private_key = crypto_box_keypair()
 
-        public_key_b64 = base64.b64encode(bytes(public_key)).decode()
-        secret_param = urllib.parse.quote(public_key_b64)
+        # Encode public key to base64 and URL-encode it. The standard alphabet
+        # is kept (the app decodes it like linejs' encodeURIComponent output),
+        # quoting the base64 bytes directly without an intermediate str.
+        secret_param = urllib.parse.quote_from_bytes(base64.b64encode(public_key))
         version = 1
 
         # Return (secretKey, URL params string)
-        return bytes(private_key), f"?secret={secret_param}&e2eeVersion={version}"
+        return private_key, f"?secret={secret_param}&e2eeVersion={version}"
 
     def _sha256(self, *args) -> bytes:
         """Calculate SHA256 hash of concatenated inputs"""
@@ -218,9 +269,9 @@ class Login:
             Auth token
         """
         # Validate inputs
-        if not EMAIL_REGEX.match(email):
+        if "@" not in email or not EMAIL_REGEX.match(email):
             raise LoginError("Invalid email format")
-        if not PASSWORD_REGEX.match(password):
+        if len(password) < PASSWORD_MIN_LENGTH:
             raise LoginError("Password must be at least 6 characters")
         if len(pincode) != 6:
             raise LoginError("PIN code must be 6 digits")
@@ -232,15 +283,12 @@ class Login:
         keynm = rsa_key.keynm
         session_key = rsa_key.sessionKey
 
-        # Build message: chr(len) + data for each field
-        message = (
-            chr(len(session_key))
-            + session_key
-            + chr(len(email))
-            + email
-            + chr(len(password))
-            + password
-        )
+        # Build message: len byte + UTF-8 data for each field
+        message = bytearray()
+        for field in (session_key, email, password):
+            data = field.encode("utf-8")
+            message.append(len(data))
+            message += data
 
         # Encrypt with RSA
         encrypted = self._encrypt_rsa(
@@ -293,16 +341,16 @@ class Login:
         # Determine login type
         login_type = 2 if secret else 0
 
-        # Build loginV2/loginZ request
-        response = self._login_v2(
+        # Build loginV2/loginZ request (params are reused for the verifier retry)
+        params = self._build_login_params(
             keynm=keynm,
             encrypted=encrypted,
             device_name=self.client.system_name,
             verifier=None,
             secret=secret,
             cert=cert,
-            method="loginZ",
         )
+        response = self._login_v2(params, method="loginZ")
 
         # Check if verification needed
         auth_token = response.auth_token
@@ -315,26 +363,23 @@ class Login:
 
             if e2ee and secret_key:
                 # E2EE verification
-                e2ee_info = self._check_e2ee_verification(verifier)
+                e2ee_info = self._check_verification(
+                    verifier, self.E2EE_VERIFY_ENDPOINT
+                )
                 # TODO: Decrypt E2EE key and create device secret
                 e2ee_login = verifier  # Simplified
             else:
                 # Legacy verification
-                verify_result = self._check_legacy_verification(verifier)
+                verify_result = self._check_verification(
+                    verifier, self.LEGACY_VERIFY_ENDPOINT
+                )
                 # verify_result is now VerificationResponse
                 # VerificationResponse.result is a dict
                 e2ee_login = verify_result.result.get("verifier", verifier)
 
             # Retry with verifier
-            response = self._login_v2(
-                keynm=keynm,
-                encrypted=encrypted,
-                device_name=self.client.system_name,
-                verifier=e2ee_login,
-                secret=secret,
-                cert=cert,
-                method="loginZ",
-            )
+            self._set_login_verifier(params, e2ee_login)
+            response = self._login_v2(params, method="loginZ")
             auth_token = response.auth_token
 
         # Save certificate
@@ -363,16 +408,16 @@ class Login:
 
         Based on linejs requestEmailLoginV2.
         """
-        # Build loginV2 request
-        response = self._login_v2(
+        # Build loginV2 request (params are reused for the verifier retry)
+        params = self._build_login_params(
             keynm=keynm,
             encrypted=encrypted,
             device_name=self.client.system_name,
             verifier=None,
             secret=secret,
             cert=cert,
-            method="loginV2",
         )
+        response = self._login_v2(params, method="loginV2")
 
         # Check for v3 token response
         token_info = response.token_info
@@ -383,20 +428,15 @@ class Login:
             self.client.emit("pincall", pincode)
 
             # E2EE verification (required for v2)
-            e2ee_info = self._check_e2ee_verification(verifier)
+            e2ee_info = self._check_verification(
+                verifier, self.E2EE_VERIFY_ENDPOINT
+            )
             # TODO: Full E2EE key exchange
             e2ee_login = verifier  # Simplified
 
             # Retry with verifier
-            response = self._login_v2(
-                keynm=keynm,
-                encrypted=encrypted,
-                device_name=self.client.system_name,
-                verifier=e2ee_login,
-                secret=secret,
-                cert=cert,
-                method="loginV2",
-            )
+            self._set_login_verifier(params, e2ee_login)
+            response = self._login_v2(params, method="loginV2")
             token_info = response.token_info
 
         # Save certificate
@@ -412,7 +452,18 @@ class Login:
 
         return auth_token
 
-    def _login_v2(
+    # Indexes into the loginRequest struct built by _build_login_params
+    _LOGIN_TYPE_SLOT = 0
+    _LOGIN_VERIFIER_SLOT = 8
+
+    # Constant loginRequest fields, shared between requests
+    _LOGIN_IDENTITY_PROVIDER = (8, 2, 1)  # identityProvider = LINE
+    _LOGIN_KEEP_LOGGED_IN = (2, 5, False)  # keepLoggedIn
+    _LOGIN_ACCESS_LOCATION = (11, 6, "")  # accessLocation
+    _LOGIN_UNKNOWN_11 = (8, 11, 1)  # ?
+    _LOGIN_MODEL_NAME = (11, 12, "System Product Name")  # modelName
+
+    def _build_login_params(
         self,
         keynm: str,
         encrypted: str,
@@ -420,42 +471,56 @@ class Login:
         verifier: Optional[str],
         secret: Optional[bytes],
         cert: Optional[str],
-        method: str = "loginV2",
-    ) -> LoginResponse:
+    ) -> List:
         """
-        Send login request.
+        Build loginV2/loginZ params.
 
-        Based on linejs loginV2 implementation.
+        The returned list is reused across verifier retries
+        (see _set_login_verifier).
         """
-        # Determine login type
-        login_type = 2  # E2EE
-        if not secret:
-            login_type = 0  # Normal
-        if verifier:
-            login_type = 1  # Verifier
+        # Normalize optional fields once (Thrift strings must not be None)
+        cert = cert or ""
+        verifier = verifier or ""
+        secret = secret or b""
+
+        # Determine login type: 1=Verifier, 2=E2EE, 0=Normal
+        login_type = 1 if verifier else (2 if secret else 0)
 
         # Build params in linejs format: [[type, id, value], ...]
-        params = [
+        return [
             [
                 12,
                 2,
                 [  # Struct at field 2
                     [8, 1, login_type],  # loginType
-                    [8, 2, 1],  # identityProvider = LINE
+                    self._LOGIN_IDENTITY_PROVIDER,
                     [11, 3, keynm],  # keynm
                     [11, 4, encrypted],  # encryptedMessage
-                    [2, 5, False],  # keepLoggedIn
-                    [11, 6, ""],  # accessLocation
+                    self._LOGIN_KEEP_LOGGED_IN,
+                    self._LOGIN_ACCESS_LOCATION,
                     [11, 7, device_name],  # systemName
-                    [11, 8, cert or ""],  # certificate
-                    [11, 9, verifier or ""],  # verifier
-                    [11, 10, secret or b""],  # secret
-                    [8, 11, 1],  # ?
-                    [11, 12, "System Product Name"],  # modelName
+                    [11, 8, cert],  # certificate
+                    [11, 9, verifier],  # verifier
+                    [11, 10, secret],  # secret
+                    self._LOGIN_UNKNOWN_11,
+                    self._LOGIN_MODEL_NAME,
                 ],
             ]
         ]
 
+    def _set_login_verifier(self, params: List, verifier: Optional[str]):
+        """Update login params in place for a verifier retry"""
+        fields = params[0][2]
+        if verifier:
+            fields[self._LOGIN_TYPE_SLOT][2] = 1  # Verifier
+        fields[self._LOGIN_VERIFIER_SLOT][2] = verifier or ""
+
+    def _login_v2(self, params: List, method: str = "loginV2") -> LoginResponse:
+        """
+        Send login request.
+
+        Based on linejs loginV2 implementation.
+        """
         return self._request(
             path=self.AUTH_ENDPOINT,
             method=method,
@@ -464,34 +529,24 @@ class Login:
             response_model=LoginResponse,
         )
 
-    def _check_e2ee_verification(self, verifier: str) -> VerificationResponse:
-        """Check E2EE PIN verification via /LF1 endpoint"""
-        import httpx
-
-        headers = {
-            "x-line-access": verifier,
-            "x-lal": "ja_JP",
-            "x-lpv": "1",
-            "x-lhm": "GET",
-        }
-
-        url = f"https://{self.client.request.HOST}{self.E2EE_VERIFY_ENDPOINT}"
-        response = httpx.get(url, headers=headers, timeout=120)
-        return VerificationResponse.model_validate(response.json())
+    def _verify_url(self, endpoint: str) -> str:
+        """Get (cached) absolute URL for a verification endpoint"""
+        url = self._verify_urls.get(endpoint)
+        if url is None:
+            url = f"https://{self.client.request.HOST}{endpoint}"
+            self._verify_urls[endpoint] = url
+        return url
 
-    def _check_legacy_verification(self, verifier: str) -> VerificationResponse:
-        """Check legacy PIN verification via /Q endpoint"""
-        import httpx
-
-        headers = {
-            "x-line-access": verifier,
-            "x-lal": "ja_JP",
-            "x-lpv": "1",
-            "x-lhm": "GET",
-        }
+    def _check_verification(self, verifier: str, endpoint: str) -> VerificationResponse:
+        """
+        Check PIN verification.
 
-        url = f"https://{self.client.request.HOST}{self.LEGACY_VERIFY_ENDPOINT}"
-        response = httpx.get(url, headers=headers, timeout=120)
+        Args:
+            verifier: Verifier returned by the login request
+            endpoint: E2EE_VERIFY_ENDPOINT (/LF1) or LEGACY_VERIFY_ENDPOINT (/Q)
+        """
+        headers = {**self.VERIFY_HEADERS, "x-line-access": verifier}
+        response = self._http.get(self._verify_url(endpoint), headers=headers)
         return VerificationResponse.model_validate(response.json())
 
     # ========== QR Code Login ==========
@@ -542,20 +597,8 @@ class Login:
 
         print(f"[Login] QR Code URL: {url}")
 
-        # Try to print QR code
-        try:
-            import qrcode
-
-            qr = qrcode.QRCode(border=1)
-            qr.add_data(url)
-            qr.make(fit=True)
-            qr.print_ascii(invert=True)
-            print("[Login] Please scan the QR code above.")
-        except ImportError:
-            # print("[Login] 'qrcode' library not found. QR code cannot be displayed.")
-            pass
-        except Exception:
-            pass
+        # Render QR code in the background so the first long-poll starts now
+        threading.Thread(target=self._render_qr, args=(url,), daemon=True).start()
         self.client.emit("qrcall", url)
 
         # Wait for QR code verification
@@ -624,23 +667,8 @@ class Login:
 
         print(f"[Login] QR Code URL: {url}")
 
-        # Try to print QR code
-        try:
-            print("[DEBUG] Importing qrcode...")
-            import qrcode
-
-            print("[DEBUG] qrcode imported. Creating QRCode object...")
-            qr = qrcode.QRCode(border=1)
-            qr.add_data(url)
-            print("[DEBUG] Making QR code...")
-            qr.make(fit=True)
-            print("[DEBUG] Printing QR code ascii...")
-            qr.print_ascii(invert=True)
-            print("[Login] Please scan the QR code above.")
-        except ImportError:
-            print("[Login] 'qrcode' library not found. QR code cannot be displayed.")
-        except Exception as e:
-            print(f"[Login] Failed to display QR code: {e}")
+        # Render QR code in the background so the first long-poll starts now
+        threading.Thread(target=self._render_qr, args=(url,), daemon=True).start()
 
         self.client.emit("qrcall", url)
 
@@ -663,14 +691,12 @@ class Login:
             # V2 login
             response = self._qr_code_login_v2(sqr)
 
-            # Save response for storage (convert to dict for storage compatibility)
-            self._last_login_response = (
-                response.model_dump(by_alias=True)
-                if hasattr(response, "model_dump")
-                else response
-            )
+            # Keep response for storage (dumped to a dict lazily on access)
+            self._last_login_response_raw = response
+            self._last_login_response = None
 
-            print(f"[DEBUG] qrCodeLoginV2 response: {response}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("qrCodeLoginV2 response: %s", response)
 
             # Extract token using Pydantic model attributes
             token_info = response.token_info
@@ -690,16 +716,38 @@ class Login:
 
         raise LoginError("QR code verification timeout")
 
+    def _render_qr(self, url: str):
+        """
+        Print QR code for url to the terminal.
+
+        Runs on a background thread; the ASCII art is built first and
+        written in one call so it is not interleaved with polling output.
+        """
+        try:
+            import qrcode
+
+            qr = qrcode.QRCode(border=1)
+            qr.add_data(url)
+            qr.make(fit=True)
+            out = io.StringIO()
+            qr.print_ascii(out=out, invert=True)
+            print(f"\n{out.getvalue()}[Login] Please scan the QR code above.")
+            logger.debug("QR code rendered")
+        except ImportError:
+            print("[Login] 'qrcode' library not found. QR code cannot be displayed.")
+        except Exception as e:
+            print(f"[Login] Failed to display QR code: {e}")
+
     def _check_qr_verified(self, sqr: str) -> bool:
         """Wait for QR code verification"""
-        import time
+        deadline = time.monotonic() + 300  # 5 minutes total timeout
+        errors = 0
 
-        start_time = time.time()
-        timeout = 300  # 5 minutes total timeout
+        polls = 0
 
-        print("[Login] Waiting for QR code scan...", end="", flush=True)
+        print("[Login] Waiting for QR code scan...")
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
                 self._request(
                     path=self.SECONDARY_QR_LP_ENDPOINT,
@@ -712,30 +760,33 @@ class Login:
                         "x-line-access": sqr,
                     },
                 )
-                print("\n[Login] QR code scanned!")
+                print("[Login] QR code scanned!")
                 return True
+            except httpx.TimeoutException:
+                # Long-poll expired without a scan; poll again
+                errors = 0
+                polls += 1
+                if polls % POLL_PROGRESS_EVERY == 0:
+                    logger.debug("Still waiting for QR code scan (%d polls)", polls)
             except Exception as e:
-                # Retry on timeout
-                if "timed out" in str(e) or "ReadTimeout" in str(e):
-                    print(".", end="", flush=True)
-                    continue
-                # Ignore other errors during polling?
-                print(f"\n[Login] Polling error: {e}")
-                time.sleep(2)
-
-        print("\n[Login] QR verification timed out.")
+                # Back off on other errors instead of hammering the server
+                logger.warning("QR polling error: %s", e)
+                errors += 1
+                time.sleep(_poll_backoff(errors, deadline))
+
+        print("[Login] QR verification timed out.")
         return False
 
     def _check_pin_verified(self, sqr: str) -> bool:
         """Wait for PIN code verification"""
-        import time
+        deadline = time.monotonic() + 300  # 5 minutes
+        errors = 0
 
-        start_time = time.time()
-        timeout = 300  # 5 minutes
+        polls = 0
 
-        print("[Login] Waiting for PIN code verification...", end="", flush=True)
+        print("[Login] Waiting for PIN code verification...")
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
                 self._request(
                     path=self.SECONDARY_QR_LP_ENDPOINT,
@@ -748,16 +799,19 @@ class Login:
                         "x-line-access": sqr,
                     },
                 )
-                print("\n[Login] PIN verified!")
+                print("[Login] PIN verified!")
                 return True
+            except httpx.TimeoutException:
+                errors = 0
+                polls += 1
+                if polls % POLL_PROGRESS_EVERY == 0:
+                    logger.debug("Still waiting for PIN verification (%d polls)", polls)
             except Exception as e:
-                if "timed out" in str(e) or "ReadTimeout" in str(e):
-                    print(".", end="", flush=True)
-                    continue
-                print(f"\n[Login] PIN polling error: {e}")
-                time.sleep(2)
+                logger.warning("PIN polling error: %s", e)
+                errors += 1
+                time.sleep(_poll_backoff(errors, deadline))
 
-        print("\n[Login] PIN verification timed out.")
+        print("[Login] PIN verification timed out.")
         return False
 
     def _verify_certificate(self, sqr: str, cert: Optional[str]):
@@ -1,6 +1,21 @@
 # -*- coding: utf-8 -*-
 """Pydantic models for LINEPY API responses."""
 
-from .timeline import *
+from . import square
 from .login import *
-from .square import *
+from .timeline import *
+
+# Square models are loaded lazily by .square, so they are listed here
+# rather than star-imported; `from linepy.models import *` resolves them
+# through __getattr__ below.
+__all__ = [name for name in globals() if not name.startswith("_")]
+__all__ += [name for name in square.__all__ if name not in globals()]
+
+
+def __getattr__(name: str):
+    # Forward lookups so `linepy.models.SquareEvent` keeps working
+    return getattr(square, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
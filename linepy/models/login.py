@@ -9,10 +9,16 @@ from __future__ import annotations
 
 from typing import Optional, Dict, Any, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class RSAKeyInfo(BaseModel):
+class _LoginModel(BaseModel):
+    """Shared config for login models (one config instead of one per class)."""
+
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+
+class RSAKeyInfo(_LoginModel):
     """RSA key info for credential encryption."""
 
     keynm: str
@@ -20,11 +26,8 @@ class RSAKeyInfo(BaseModel):
     evalue: str
     sessionKey: str = Field(alias="session_key", default="")
 
-    class Config:
-        populate_by_name = True
 
-
-class TokenInfo(BaseModel):
+class TokenInfo(_LoginModel):
     """Token info from login response (v3 format)."""
 
     auth_token: Optional[str] = Field(alias="1", default=None)
@@ -32,11 +35,8 @@ class TokenInfo(BaseModel):
     token_issue_time: Optional[int] = Field(alias="3", default=None)
     token_expire_time: Optional[int] = Field(alias="4", default=None)
 
-    class Config:
-        populate_by_name = True
-
 
-class LoginResponse(BaseModel):
+class LoginResponse(_LoginModel):
     """Response from email/password login (loginZ/loginV2)."""
 
     auth_token: Optional[str] = Field(alias="1", default=None)
@@ -46,50 +46,35 @@ class LoginResponse(BaseModel):
     # For loginV2 (v3 devices)
     token_info: Optional[TokenInfo] = Field(alias="9", default=None)
 
-    class Config:
-        populate_by_name = True
-
 
-class QRSessionResponse(BaseModel):
+class QRSessionResponse(_LoginModel):
     """Response from createSession (QR login)."""
 
     sqr: str = Field(alias="1")
 
-    class Config:
-        populate_by_name = True
 
-
-class QRCodeResponse(BaseModel):
+class QRCodeResponse(_LoginModel):
     """Response from createQrCode."""
 
     url: str = Field(alias="1")
     call_url: Optional[Union[str, int]] = Field(alias="2", default=None)
 
-    class Config:
-        populate_by_name = True
-
 
-class PinCodeResponse(BaseModel):
+class PinCodeResponse(_LoginModel):
     """Response from createPinCode."""
 
     pincode: str = Field(alias="1")
 
-    class Config:
-        populate_by_name = True
-
 
-class QRCodeLoginResponse(BaseModel):
+class QRCodeLoginResponse(_LoginModel):
     """Response from qrCodeLogin (legacy)."""
 
     certificate: Optional[str] = Field(alias="1", default=None)
     auth_token: Optional[str] = Field(alias="2", default=None)
     mid: Optional[str] = Field(alias="3", default=None)
 
-    class Config:
-        populate_by_name = True
 
-
-class QRCodeLoginV2TokenInfo(BaseModel):
+class QRCodeLoginV2TokenInfo(_LoginModel):
     """Token info for qrCodeLoginV2."""
 
     auth_token: str = Field(alias="1")
@@ -98,11 +83,8 @@ class QRCodeLoginV2TokenInfo(BaseModel):
     token_expire_time: Optional[int] = Field(alias="4", default=None)
     app_type: Optional[str] = Field(alias="5", default=None)
 
-    class Config:
-        populate_by_name = True
-
 
-class QRCodeLoginV2Response(BaseModel):
+class QRCodeLoginV2Response(_LoginModel):
     """Response from qrCodeLoginV2."""
 
     certificate: Optional[str] = Field(alias="1", default=None)
@@ -111,11 +93,8 @@ class QRCodeLoginV2Response(BaseModel):
     last_bound_time: Optional[int] = Field(alias="4", default=None)
     metadata: Optional[Dict[str, Any]] = Field(alias="5", default=None)
 
-    class Config:
-        populate_by_name = True
-
 
-class E2EEKeyInfo(BaseModel):
+class E2EEKeyInfo(_LoginModel):
     """E2EE key info from verification."""
 
     version: Optional[int] = None
@@ -124,7 +103,7 @@ class E2EEKeyInfo(BaseModel):
     encrypted_key_chain: Optional[str] = None
 
 
-class VerificationResponse(BaseModel):
+class VerificationResponse(_LoginModel):
     """Response from PIN verification endpoints."""
 
     result: Dict[str, Any] = Field(default_factory=dict)
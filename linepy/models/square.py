@@ -1,20 +1,62 @@
 from __future__ import annotations
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field
-from enum import IntEnum
 
-# Import all auto-generated models from square_structs.py (Snake Case)
-from .square_structs import *
+import functools
+import importlib
+from typing import Any
+
+from .square_struct_names import NAMES as _STRUCT_NAMES
+
+# All auto-generated models live in square_structs.py (Snake Case).
+# Building its several hundred classes is a large part of `import linepy`,
+# so it is loaded on first attribute access instead (PEP 562):
+# `from linepy.models.square import SquareEvent` works as before.
 
 # Manual definitions for types that are missing/incomplete in Thrift
 # MessageStatusType is an empty enum in chrline.thrift, so we treat it as int
 MessageStatusType = int
 _any = Any
 
-# Rebuild models to resolve forward references
-FetchMyEventsResponse.model_rebuild()
-FetchSquareChatEventsResponse.model_rebuild()
-SquareEvent.model_rebuild()
-SquareEventPayload.model_rebuild()
+__all__ = ["MessageStatusType", *_STRUCT_NAMES]
+
+# Models whose forward references are resolved on first access
+_REBUILD = frozenset(
+    {
+        "FetchMyEventsResponse",
+        "FetchSquareChatEventsResponse",
+        "SquareEvent",
+        "SquareEventPayload",
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _structs():
+    return importlib.import_module(".square_structs", __package__)
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_rebuilt(cls):
+    # Only rebuild when forward refs are still unresolved; structs are
+    # generated with defer_build, so this is also their first schema build
+    if not cls.__pydantic_complete__:
+        cls.model_rebuild()
+    return cls
+
+
+def __getattr__(name: str):
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(_structs(), name)
+    except AttributeError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    if name in _REBUILD:
+        _ensure_rebuilt(value)
+    globals()[name] = value
+    return value
+
 
-# Note: All other models like SquareEvent, FetchMyEventsResponse are imported from square_structs.py
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,631 @@
+# -*- coding: utf-8 -*-
+# AUTO-GENERATED BY tools/generate_models.py
+
+NAMES = (
+    "AcceptSpeakersRequest",
+    "AcceptSpeakersResponse",
+    "AcceptToChangeRoleRequest",
+    "AcceptToChangeRoleResponse",
+    "AcceptToListenRequest",
+    "AcceptToListenResponse",
+    "AcceptToSpeakRequest",
+    "AcceptToSpeakResponse",
+    "AcquireLiveTalkRequest",
+    "AcquireLiveTalkResponse",
+    "AdScreen",
+    "AgreeToTermsRequest",
+    "AgreeToTermsResponse",
+    "AllNonMemberLiveTalkParticipants",
+    "ApprovalValue",
+    "ApproveSquareMembersRequest",
+    "ApproveSquareMembersResponse",
+    "BooleanState",
+    "ButtonContent",
+    "CancelToSpeakRequest",
+    "CancelToSpeakResponse",
+    "Category",
+    "CheckJoinCodeRequest",
+    "CheckJoinCodeResponse",
+    "CodeValue",
+    "ContentType",
+    "ContentsAttribute",
+    "CreateSquareChatAnnouncementRequest",
+    "CreateSquareChatAnnouncementResponse",
+    "CreateSquareChatRequest",
+    "CreateSquareChatResponse",
+    "CreateSquareRequest",
+    "CreateSquareResponse",
+    "DeleteSquareChatAnnouncementRequest",
+    "DeleteSquareChatAnnouncementResponse",
+    "DeleteSquareChatRequest",
+    "DeleteSquareChatResponse",
+    "DeleteSquareRequest",
+    "DeleteSquareResponse",
+    "DestroyMessageRequest",
+    "DestroyMessageResponse",
+    "DestroyMessagesRequest",
+    "DestroyMessagesResponse",
+    "ErrorExtraInfo",
+    "FetchDirection",
+    "FetchLiveTalkEventsRequest",
+    "FetchLiveTalkEventsResponse",
+    "FetchMyEventsRequest",
+    "FetchMyEventsResponse",
+    "FetchSquareChatEventsRequest",
+    "FetchSquareChatEventsResponse",
+    "FetchType",
+    "FindLiveTalkByInvitationTicketRequest",
+    "FindLiveTalkByInvitationTicketResponse",
+    "FindSquareByEmidRequest",
+    "FindSquareByEmidResponse",
+    "FindSquareByInvitationTicketRequest",
+    "FindSquareByInvitationTicketResponse",
+    "FindSquareByInvitationTicketV2Request",
+    "FindSquareByInvitationTicketV2Response",
+    "ForceEndLiveTalkRequest",
+    "ForceEndLiveTalkResponse",
+    "GeolocationAccuracy",
+    "GetGoogleAdOptionsRequest",
+    "GetGoogleAdOptionsResponse",
+    "GetInvitationTicketUrlRequest",
+    "GetInvitationTicketUrlResponse",
+    "GetJoinableSquareChatsRequest",
+    "GetJoinableSquareChatsResponse",
+    "GetJoinedSquareChatsRequest",
+    "GetJoinedSquareChatsResponse",
+    "GetJoinedSquaresRequest",
+    "GetJoinedSquaresResponse",
+    "GetLiveTalkInfoForNonMemberRequest",
+    "GetLiveTalkInfoForNonMemberResponse",
+    "GetLiveTalkInvitationUrlRequest",
+    "GetLiveTalkInvitationUrlResponse",
+    "GetLiveTalkSpeakersForNonMemberRequest",
+    "GetLiveTalkSpeakersForNonMemberResponse",
+    "GetMessageReactionsRequest",
+    "GetMessageReactionsResponse",
+    "GetNoteStatusRequest",
+    "GetNoteStatusResponse",
+    "GetPopularKeywordsRequest",
+    "GetPopularKeywordsResponse",
+    "GetSquareAuthoritiesRequest",
+    "GetSquareAuthoritiesResponse",
+    "GetSquareAuthorityRequest",
+    "GetSquareAuthorityResponse",
+    "GetSquareCategoriesRequest",
+    "GetSquareCategoriesResponse",
+    "GetSquareChatAnnouncementsRequest",
+    "GetSquareChatAnnouncementsResponse",
+    "GetSquareChatEmidRequest",
+    "GetSquareChatEmidResponse",
+    "GetSquareChatFeatureSetRequest",
+    "GetSquareChatFeatureSetResponse",
+    "GetSquareChatMemberRequest",
+    "GetSquareChatMemberResponse",
+    "GetSquareChatMembersRequest",
+    "GetSquareChatMembersResponse",
+    "GetSquareChatRequest",
+    "GetSquareChatResponse",
+    "GetSquareChatStatusRequest",
+    "GetSquareChatStatusResponse",
+    "GetSquareEmidRequest",
+    "GetSquareEmidResponse",
+    "GetSquareFeatureSetRequest",
+    "GetSquareFeatureSetResponse",
+    "GetSquareInfoByChatMidRequest",
+    "GetSquareInfoByChatMidResponse",
+    "GetSquareMemberRelationRequest",
+    "GetSquareMemberRelationResponse",
+    "GetSquareMemberRelationsRequest",
+    "GetSquareMemberRelationsResponse",
+    "GetSquareMemberRequest",
+    "GetSquareMemberResponse",
+    "GetSquareMembersBySquareRequest",
+    "GetSquareMembersBySquareResponse",
+    "GetSquareMembersRequest",
+    "GetSquareMembersResponse",
+    "GetSquareRequest",
+    "GetSquareResponse",
+    "GetSquareStatusRequest",
+    "GetSquareStatusResponse",
+    "GetSquareThreadMidRequest",
+    "GetSquareThreadMidResponse",
+    "GetSquareThreadRequest",
+    "GetSquareThreadResponse",
+    "GetUserSettingsRequest",
+    "GetUserSettingsResponse",
+    "HideSquareMemberContentsRequest",
+    "HideSquareMemberContentsResponse",
+    "InviteIntoSquareChatRequest",
+    "InviteIntoSquareChatResponse",
+    "InviteToChangeRoleRequest",
+    "InviteToChangeRoleResponse",
+    "InviteToListenRequest",
+    "InviteToListenResponse",
+    "InviteToLiveTalkRequest",
+    "InviteToLiveTalkResponse",
+    "InviteToSpeakRequest",
+    "InviteToSpeakResponse",
+    "InviteToSquareRequest",
+    "InviteToSquareResponse",
+    "JoinLiveTalkRequest",
+    "JoinLiveTalkResponse",
+    "JoinSquareChatRequest",
+    "JoinSquareChatResponse",
+    "JoinSquareRequest",
+    "JoinSquareResponse",
+    "JoinSquareThreadRequest",
+    "JoinSquareThreadResponse",
+    "KickOutLiveTalkParticipantsRequest",
+    "KickOutLiveTalkParticipantsResponse",
+    "LeaveSquareChatRequest",
+    "LeaveSquareChatResponse",
+    "LeaveSquareRequest",
+    "LeaveSquareResponse",
+    "LeaveSquareThreadRequest",
+    "LeaveSquareThreadResponse",
+    "LiveTalk",
+    "LiveTalkAttribute",
+    "LiveTalkEvent",
+    "LiveTalkEventNotifiedUpdateLiveTalkAllowRequestToSpeak",
+    "LiveTalkEventNotifiedUpdateLiveTalkAnnouncement",
+    "LiveTalkEventNotifiedUpdateLiveTalkTitle",
+    "LiveTalkEventNotifiedUpdateSquareMember",
+    "LiveTalkEventNotifiedUpdateSquareMemberRole",
+    "LiveTalkEventPayload",
+    "LiveTalkEventType",
+    "LiveTalkExtraInfo",
+    "LiveTalkKickOutTarget",
+    "LiveTalkParticipant",
+    "LiveTalkReportType",
+    "LiveTalkRole",
+    "LiveTalkSpeaker",
+    "LiveTalkSpeakerSetting",
+    "LiveTalkType",
+    "Location",
+    "MIDType",
+    "ManualRepairRequest",
+    "ManualRepairResponse",
+    "MarkAsReadRequest",
+    "MarkAsReadResponse",
+    "MarkChatsAsReadRequest",
+    "MarkChatsAsReadResponse",
+    "MarkThreadsAsReadRequest",
+    "MarkThreadsAsReadResponse",
+    "Mentionable",
+    "MentionableBot",
+    "MentionableSquareMember",
+    "Message",
+    "MessageReactionType",
+    "MessageStatusContents",
+    "MessageSummaryReportType",
+    "MessageVisibility",
+    "NoteStatus",
+    "NotificationPostType",
+    "NotifiedMessageType",
+    "OkButton",
+    "Pb1_B",
+    "Pb1_D6",
+    "Pb1_E7",
+    "Pb1_EnumC13015h6",
+    "Pb1_EnumC13050k",
+    "PopularKeyword",
+    "ReactToMessageRequest",
+    "ReactToMessageResponse",
+    "Reaction",
+    "ReactionType",
+    "RefreshSubscriptionsRequest",
+    "RefreshSubscriptionsResponse",
+    "RejectSpeakersRequest",
+    "RejectSpeakersResponse",
+    "RejectSquareMembersRequest",
+    "RejectSquareMembersResponse",
+    "RejectToSpeakRequest",
+    "RejectToSpeakResponse",
+    "RemoveLiveTalkSubscriptionRequest",
+    "RemoveLiveTalkSubscriptionResponse",
+    "RemoveSubscriptionsRequest",
+    "RemoveSubscriptionsResponse",
+    "ReportLiveTalkRequest",
+    "ReportLiveTalkResponse",
+    "ReportLiveTalkSpeakerRequest",
+    "ReportLiveTalkSpeakerResponse",
+    "ReportMessageSummaryRequest",
+    "ReportMessageSummaryResponse",
+    "ReportSquareChatRequest",
+    "ReportSquareChatResponse",
+    "ReportSquareMemberRequest",
+    "ReportSquareMemberResponse",
+    "ReportSquareMessageRequest",
+    "ReportSquareMessageResponse",
+    "ReportSquareRequest",
+    "ReportSquareResponse",
+    "ReportType",
+    "RequestToListenRequest",
+    "RequestToListenResponse",
+    "RequestToSpeakRequest",
+    "RequestToSpeakResponse",
+    "SearchSquareChatMembersRequest",
+    "SearchSquareChatMembersResponse",
+    "SearchSquareChatMentionablesRequest",
+    "SearchSquareChatMentionablesResponse",
+    "SearchSquareMembersRequest",
+    "SearchSquareMembersResponse",
+    "SearchSquaresRequest",
+    "SearchSquaresResponse",
+    "SendMessageRequest",
+    "SendMessageResponse",
+    "SendSquareThreadMessageRequest",
+    "SendSquareThreadMessageResponse",
+    "Square",
+    "SquareAttribute",
+    "SquareAuthority",
+    "SquareAuthorityAttribute",
+    "SquareChat",
+    "SquareChatAnnouncement",
+    "SquareChatAnnouncementContents",
+    "SquareChatAttribute",
+    "SquareChatFeature",
+    "SquareChatFeatureControlState",
+    "SquareChatFeatureSet",
+    "SquareChatMember",
+    "SquareChatMemberAttribute",
+    "SquareChatMemberSearchOption",
+    "SquareChatMembershipState",
+    "SquareChatMentionableSearchOption",
+    "SquareChatState",
+    "SquareChatStatus",
+    "SquareChatStatusWithoutMessage",
+    "SquareChatType",
+    "SquareEmblem",
+    "SquareErrorCode",
+    "SquareEvent",
+    "SquareEventChatPopup",
+    "SquareEventMutateMessage",
+    "SquareEventNotificationJoinRequest",
+    "SquareEventNotificationLiveTalk",
+    "SquareEventNotificationMemberUpdate",
+    "SquareEventNotificationMessage",
+    "SquareEventNotificationMessageReaction",
+    "SquareEventNotificationNewChatMember",
+    "SquareEventNotificationPost",
+    "SquareEventNotificationPostAnnouncement",
+    "SquareEventNotificationSquareChatDelete",
+    "SquareEventNotificationSquareDelete",
+    "SquareEventNotificationThreadMessage",
+    "SquareEventNotificationThreadMessageReaction",
+    "SquareEventNotifiedAddBot",
+    "SquareEventNotifiedCreateSquareChatMember",
+    "SquareEventNotifiedCreateSquareMember",
+    "SquareEventNotifiedDeleteSquareChat",
+    "SquareEventNotifiedDestroyMessage",
+    "SquareEventNotifiedInviteIntoSquareChat",
+    "SquareEventNotifiedJoinSquareChat",
+    "SquareEventNotifiedKickoutFromSquare",
+    "SquareEventNotifiedLeaveSquareChat",
+    "SquareEventNotifiedMarkAsRead",
+    "SquareEventNotifiedRemoveBot",
+    "SquareEventNotifiedShutdownSquare",
+    "SquareEventNotifiedSystemMessage",
+    "SquareEventNotifiedUpdateLiveTalk",
+    "SquareEventNotifiedUpdateLiveTalkInfo",
+    "SquareEventNotifiedUpdateMessageStatus",
+    "SquareEventNotifiedUpdateReadonlyChat",
+    "SquareEventNotifiedUpdateSquare",
+    "SquareEventNotifiedUpdateSquareAuthority",
+    "SquareEventNotifiedUpdateSquareChat",
+    "SquareEventNotifiedUpdateSquareChatAnnouncement",
+    "SquareEventNotifiedUpdateSquareChatFeatureSet",
+    "SquareEventNotifiedUpdateSquareChatMaxMemberCount",
+    "SquareEventNotifiedUpdateSquareChatMember",
+    "SquareEventNotifiedUpdateSquareChatProfileImage",
+    "SquareEventNotifiedUpdateSquareChatProfileName",
+    "SquareEventNotifiedUpdateSquareChatStatus",
+    "SquareEventNotifiedUpdateSquareFeatureSet",
+    "SquareEventNotifiedUpdateSquareMember",
+    "SquareEventNotifiedUpdateSquareMemberProfile",
+    "SquareEventNotifiedUpdateSquareMemberRelation",
+    "SquareEventNotifiedUpdateSquareNoteStatus",
+    "SquareEventNotifiedUpdateSquareStatus",
+    "SquareEventNotifiedUpdateThread",
+    "SquareEventNotifiedUpdateThreadMember",
+    "SquareEventNotifiedUpdateThreadRootMessage",
+    "SquareEventNotifiedUpdateThreadRootMessageStatus",
+    "SquareEventNotifiedUpdateThreadStatus",
+    "SquareEventPayload",
+    "SquareEventReceiveMessage",
+    "SquareEventSendMessage",
+    "SquareEventStatus",
+    "SquareEventType",
+    "SquareException",
+    "SquareExtraInfo",
+    "SquareFeature",
+    "SquareFeatureControlState",
+    "SquareFeatureSet",
+    "SquareFeatureSetAttribute",
+    "SquareJoinMethod",
+    "SquareJoinMethodType",
+    "SquareJoinMethodValue",
+    "SquareMember",
+    "SquareMemberAttribute",
+    "SquareMemberRelation",
+    "SquareMemberRelationState",
+    "SquareMemberRole",
+    "SquareMemberSearchOption",
+    "SquareMembershipState",
+    "SquareMessage",
+    "SquareMessageReaction",
+    "SquareMessageReactionStatus",
+    "SquareMessageState",
+    "SquareMessageStatus",
+    "SquareMessageThreadInfo",
+    "SquarePreference",
+    "SquarePreferenceAttribute",
+    "SquareService_acceptSpeakers_args",
+    "SquareService_acceptSpeakers_result",
+    "SquareService_acceptToChangeRole_args",
+    "SquareService_acceptToChangeRole_result",
+    "SquareService_acceptToListen_args",
+    "SquareService_acceptToListen_result",
+    "SquareService_acceptToSpeak_args",
+    "SquareService_acceptToSpeak_result",
+    "SquareService_acquireLiveTalk_args",
+    "SquareService_acquireLiveTalk_result",
+    "SquareService_agreeToTerms_args",
+    "SquareService_agreeToTerms_result",
+    "SquareService_approveSquareMembers_args",
+    "SquareService_approveSquareMembers_result",
+    "SquareService_cancelToSpeak_args",
+    "SquareService_cancelToSpeak_result",
+    "SquareService_checkJoinCode_args",
+    "SquareService_checkJoinCode_result",
+    "SquareService_createSquareChatAnnouncement_args",
+    "SquareService_createSquareChatAnnouncement_result",
+    "SquareService_createSquareChat_args",
+    "SquareService_createSquareChat_result",
+    "SquareService_createSquare_args",
+    "SquareService_createSquare_result",
+    "SquareService_deleteSquareChatAnnouncement_args",
+    "SquareService_deleteSquareChatAnnouncement_result",
+    "SquareService_deleteSquareChat_args",
+    "SquareService_deleteSquareChat_result",
+    "SquareService_deleteSquare_args",
+    "SquareService_deleteSquare_result",
+    "SquareService_destroyMessage_args",
+    "SquareService_destroyMessage_result",
+    "SquareService_destroyMessages_args",
+    "SquareService_destroyMessages_result",
+    "SquareService_fetchLiveTalkEvents_args",
+    "SquareService_fetchLiveTalkEvents_result",
+    "SquareService_fetchMyEvents_args",
+    "SquareService_fetchMyEvents_result",
+    "SquareService_fetchSquareChatEvents_args",
+    "SquareService_fetchSquareChatEvents_result",
+    "SquareService_findLiveTalkByInvitationTicket_args",
+    "SquareService_findLiveTalkByInvitationTicket_result",
+    "SquareService_findSquareByEmid_args",
+    "SquareService_findSquareByEmid_result",
+    "SquareService_findSquareByInvitationTicketV2_args",
+    "SquareService_findSquareByInvitationTicketV2_result",
+    "SquareService_findSquareByInvitationTicket_args",
+    "SquareService_findSquareByInvitationTicket_result",
+    "SquareService_forceEndLiveTalk_args",
+    "SquareService_forceEndLiveTalk_result",
+    "SquareService_getCategories_args",
+    "SquareService_getCategories_result",
+    "SquareService_getGoogleAdOptions_args",
+    "SquareService_getGoogleAdOptions_result",
+    "SquareService_getInvitationTicketUrl_args",
+    "SquareService_getInvitationTicketUrl_result",
+    "SquareService_getJoinableSquareChats_args",
+    "SquareService_getJoinableSquareChats_result",
+    "SquareService_getJoinedSquareChats_args",
+    "SquareService_getJoinedSquareChats_result",
+    "SquareService_getJoinedSquares_args",
+    "SquareService_getJoinedSquares_result",
+    "SquareService_getLiveTalkInfoForNonMember_args",
+    "SquareService_getLiveTalkInfoForNonMember_result",
+    "SquareService_getLiveTalkInvitationUrl_args",
+    "SquareService_getLiveTalkInvitationUrl_result",
+    "SquareService_getLiveTalkSpeakersForNonMember_args",
+    "SquareService_getLiveTalkSpeakersForNonMember_result",
+    "SquareService_getMessageReactions_args",
+    "SquareService_getMessageReactions_result",
+    "SquareService_getNoteStatus_args",
+    "SquareService_getNoteStatus_result",
+    "SquareService_getPopularKeywords_args",
+    "SquareService_getPopularKeywords_result",
+    "SquareService_getSquareAuthorities_args",
+    "SquareService_getSquareAuthorities_result",
+    "SquareService_getSquareAuthority_args",
+    "SquareService_getSquareAuthority_result",
+    "SquareService_getSquareChatAnnouncements_args",
+    "SquareService_getSquareChatAnnouncements_result",
+    "SquareService_getSquareChatEmid_args",
+    "SquareService_getSquareChatEmid_result",
+    "SquareService_getSquareChatFeatureSet_args",
+    "SquareService_getSquareChatFeatureSet_result",
+    "SquareService_getSquareChatMember_args",
+    "SquareService_getSquareChatMember_result",
+    "SquareService_getSquareChatMembers_args",
+    "SquareService_getSquareChatMembers_result",
+    "SquareService_getSquareChatStatus_args",
+    "SquareService_getSquareChatStatus_result",
+    "SquareService_getSquareChat_args",
+    "SquareService_getSquareChat_result",
+    "SquareService_getSquareEmid_args",
+    "SquareService_getSquareEmid_result",
+    "SquareService_getSquareFeatureSet_args",
+    "SquareService_getSquareFeatureSet_result",
+    "SquareService_getSquareInfoByChatMid_args",
+    "SquareService_getSquareInfoByChatMid_result",
+    "SquareService_getSquareMemberRelation_args",
+    "SquareService_getSquareMemberRelation_result",
+    "SquareService_getSquareMemberRelations_args",
+    "SquareService_getSquareMemberRelations_result",
+    "SquareService_getSquareMember_args",
+    "SquareService_getSquareMember_result",
+    "SquareService_getSquareMembersBySquare_args",
+    "SquareService_getSquareMembersBySquare_result",
+    "SquareService_getSquareMembers_args",
+    "SquareService_getSquareMembers_result",
+    "SquareService_getSquareStatus_args",
+    "SquareService_getSquareStatus_result",
+    "SquareService_getSquareThreadMid_args",
+    "SquareService_getSquareThreadMid_result",
+    "SquareService_getSquareThread_args",
+    "SquareService_getSquareThread_result",
+    "SquareService_getSquare_args",
+    "SquareService_getSquare_result",
+    "SquareService_getUserSettings_args",
+    "SquareService_getUserSettings_result",
+    "SquareService_hideSquareMemberContents_args",
+    "SquareService_hideSquareMemberContents_result",
+    "SquareService_inviteIntoSquareChat_args",
+    "SquareService_inviteIntoSquareChat_result",
+    "SquareService_inviteToChangeRole_args",
+    "SquareService_inviteToChangeRole_result",
+    "SquareService_inviteToListen_args",
+    "SquareService_inviteToListen_result",
+    "SquareService_inviteToLiveTalk_args",
+    "SquareService_inviteToLiveTalk_result",
+    "SquareService_inviteToSpeak_args",
+    "SquareService_inviteToSpeak_result",
+    "SquareService_inviteToSquare_args",
+    "SquareService_inviteToSquare_result",
+    "SquareService_joinLiveTalk_args",
+    "SquareService_joinLiveTalk_result",
+    "SquareService_joinSquareChat_args",
+    "SquareService_joinSquareChat_result",
+    "SquareService_joinSquareThread_args",
+    "SquareService_joinSquareThread_result",
+    "SquareService_joinSquare_args",
+    "SquareService_joinSquare_result",
+    "SquareService_kickOutLiveTalkParticipants_args",
+    "SquareService_kickOutLiveTalkParticipants_result",
+    "SquareService_leaveSquareChat_args",
+    "SquareService_leaveSquareChat_result",
+    "SquareService_leaveSquareThread_args",
+    "SquareService_leaveSquareThread_result",
+    "SquareService_leaveSquare_args",
+    "SquareService_leaveSquare_result",
+    "SquareService_manualRepair_args",
+    "SquareService_manualRepair_result",
+    "SquareService_markAsRead_args",
+    "SquareService_markAsRead_result",
+    "SquareService_markChatsAsRead_args",
+    "SquareService_markChatsAsRead_result",
+    "SquareService_markThreadsAsRead_args",
+    "SquareService_markThreadsAsRead_result",
+    "SquareService_reactToMessage_args",
+    "SquareService_reactToMessage_result",
+    "SquareService_refreshSubscriptions_args",
+    "SquareService_refreshSubscriptions_result",
+    "SquareService_rejectSpeakers_args",
+    "SquareService_rejectSpeakers_result",
+    "SquareService_rejectSquareMembers_args",
+    "SquareService_rejectSquareMembers_result",
+    "SquareService_rejectToSpeak_args",
+    "SquareService_rejectToSpeak_result",
+    "SquareService_removeLiveTalkSubscription_args",
+    "SquareService_removeLiveTalkSubscription_result",
+    "SquareService_removeSubscriptions_args",
+    "SquareService_removeSubscriptions_result",
+    "SquareService_reportLiveTalkSpeaker_args",
+    "SquareService_reportLiveTalkSpeaker_result",
+    "SquareService_reportLiveTalk_args",
+    "SquareService_reportLiveTalk_result",
+    "SquareService_reportMessageSummary_args",
+    "SquareService_reportMessageSummary_result",
+    "SquareService_reportSquareChat_args",
+    "SquareService_reportSquareChat_result",
+    "SquareService_reportSquareMember_args",
+    "SquareService_reportSquareMember_result",
+    "SquareService_reportSquareMessage_args",
+    "SquareService_reportSquareMessage_result",
+    "SquareService_reportSquare_args",
+    "SquareService_reportSquare_result",
+    "SquareService_requestToListen_args",
+    "SquareService_requestToListen_result",
+    "SquareService_requestToSpeak_args",
+    "SquareService_requestToSpeak_result",
+    "SquareService_searchSquareChatMembers_args",
+    "SquareService_searchSquareChatMembers_result",
+    "SquareService_searchSquareChatMentionables_args",
+    "SquareService_searchSquareChatMentionables_result",
+    "SquareService_searchSquareMembers_args",
+    "SquareService_searchSquareMembers_result",
+    "SquareService_searchSquares_args",
+    "SquareService_searchSquares_result",
+    "SquareService_sendMessage_args",
+    "SquareService_sendMessage_result",
+    "SquareService_sendSquareThreadMessage_args",
+    "SquareService_sendSquareThreadMessage_result",
+    "SquareService_syncSquareMembers_args",
+    "SquareService_syncSquareMembers_result",
+    "SquareService_unhideSquareMemberContents_args",
+    "SquareService_unhideSquareMemberContents_result",
+    "SquareService_unsendMessage_args",
+    "SquareService_unsendMessage_result",
+    "SquareService_updateLiveTalkAttrs_args",
+    "SquareService_updateLiveTalkAttrs_result",
+    "SquareService_updateSquareAuthority_args",
+    "SquareService_updateSquareAuthority_result",
+    "SquareService_updateSquareChatMember_args",
+    "SquareService_updateSquareChatMember_result",
+    "SquareService_updateSquareChat_args",
+    "SquareService_updateSquareChat_result",
+    "SquareService_updateSquareFeatureSet_args",
+    "SquareService_updateSquareFeatureSet_result",
+    "SquareService_updateSquareMemberRelation_args",
+    "SquareService_updateSquareMemberRelation_result",
+    "SquareService_updateSquareMember_args",
+    "SquareService_updateSquareMember_result",
+    "SquareService_updateSquareMembers_args",
+    "SquareService_updateSquareMembers_result",
+    "SquareService_updateSquare_args",
+    "SquareService_updateSquare_result",
+    "SquareService_updateUserSettings_args",
+    "SquareService_updateUserSettings_result",
+    "SquareState",
+    "SquareStatus",
+    "SquareThread",
+    "SquareThreadMember",
+    "SquareThreadMembershipState",
+    "SquareThreadState",
+    "SquareType",
+    "SquareUserSettings",
+    "SubscriptionState",
+    "SyncSquareMembersRequest",
+    "SyncSquareMembersResponse",
+    "TermsAgreement",
+    "TermsAgreementExtraInfo",
+    "TextButton",
+    "TextMessageAnnouncementContents",
+    "TryAgainLaterExtraInfo",
+    "UnhideSquareMemberContentsRequest",
+    "UnhideSquareMemberContentsResponse",
+    "UnsendMessageRequest",
+    "UnsendMessageResponse",
+    "UpdateLiveTalkAttrsRequest",
+    "UpdateLiveTalkAttrsResponse",
+    "UpdateSquareAuthorityRequest",
+    "UpdateSquareAuthorityResponse",
+    "UpdateSquareChatMemberRequest",
+    "UpdateSquareChatMemberResponse",
+    "UpdateSquareChatRequest",
+    "UpdateSquareChatResponse",
+    "UpdateSquareFeatureSetRequest",
+    "UpdateSquareFeatureSetResponse",
+    "UpdateSquareMemberRelationRequest",
+    "UpdateSquareMemberRelationResponse",
+    "UpdateSquareMemberRequest",
+    "UpdateSquareMemberResponse",
+    "UpdateSquareMembersRequest",
+    "UpdateSquareMembersResponse",
+    "UpdateSquareRequest",
+    "UpdateSquareResponse",
+    "UpdateUserSettingsRequest",
+    "UpdateUserSettingsResponse",
+    "UrlButton",
+    "UserRestrictionExtraInfo",
+)
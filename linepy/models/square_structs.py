@@ -12,12 +12,14 @@ class AcceptSpeakersRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AcceptSpeakersResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AcceptToChangeRoleRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -26,12 +28,14 @@ class AcceptToChangeRoleRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AcceptToChangeRoleResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AcceptToListenRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -40,12 +44,14 @@ class AcceptToListenRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AcceptToListenResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AcceptToSpeakRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -54,12 +60,14 @@ class AcceptToSpeakRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AcceptToSpeakResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AcquireLiveTalkRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -69,12 +77,14 @@ class AcquireLiveTalkRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AcquireLiveTalkResponse(BaseModel):
     liveTalk: Optional["LiveTalk"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AdScreen(IntEnum):
     CHATROOM = 1
@@ -91,24 +101,28 @@ class AgreeToTermsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AgreeToTermsResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class AllNonMemberLiveTalkParticipants(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ApprovalValue(BaseModel):
     message: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ApproveSquareMembersRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -116,6 +130,7 @@ class ApproveSquareMembersRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ApproveSquareMembersResponse(BaseModel):
     approvedMembers: List["SquareMember"] = Field(alias="1", default_factory=list)
@@ -123,6 +138,7 @@ class ApproveSquareMembersResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class BooleanState(IntEnum):
     NONE = 0
@@ -136,6 +152,7 @@ class ButtonContent(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class CancelToSpeakRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -143,12 +160,14 @@ class CancelToSpeakRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class CancelToSpeakResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class Category(BaseModel):
     id_: int = Field(alias="1", default=0)
@@ -156,6 +175,7 @@ class Category(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class CheckJoinCodeRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -163,18 +183,21 @@ class CheckJoinCodeRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class CheckJoinCodeResponse(BaseModel):
     joinToken: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class CodeValue(BaseModel):
     code: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ContentType(IntEnum):
     NONE = 0
@@ -212,12 +235,14 @@ class CreateSquareChatAnnouncementRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class CreateSquareChatAnnouncementResponse(BaseModel):
     announcement: Optional["SquareChatAnnouncement"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class CreateSquareChatRequest(BaseModel):
     reqSeq: int = Field(alias="1", default=0)
@@ -226,6 +251,7 @@ class CreateSquareChatRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class CreateSquareChatResponse(BaseModel):
     squareChat: Optional["SquareChat"] = Field(alias="1", default=None)
@@ -235,6 +261,7 @@ class CreateSquareChatResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class CreateSquareRequest(BaseModel):
     reqSeq: int = Field(alias="1", default=0)
@@ -243,6 +270,7 @@ class CreateSquareRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class CreateSquareResponse(BaseModel):
     square: Optional["Square"] = Field(alias="1", default=None)
@@ -258,6 +286,7 @@ class CreateSquareResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class DeleteSquareChatAnnouncementRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="2", default=None)
@@ -265,12 +294,14 @@ class DeleteSquareChatAnnouncementRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class DeleteSquareChatAnnouncementResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class DeleteSquareChatRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="2", default=None)
@@ -278,12 +309,14 @@ class DeleteSquareChatRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class DeleteSquareChatResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class DeleteSquareRequest(BaseModel):
     mid: Optional[str] = Field(alias="2", default=None)
@@ -291,12 +324,14 @@ class DeleteSquareRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class DeleteSquareResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class DestroyMessageRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="2", default=None)
@@ -305,12 +340,14 @@ class DestroyMessageRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class DestroyMessageResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class DestroyMessagesRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="2", default=None)
@@ -319,12 +356,14 @@ class DestroyMessagesRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class DestroyMessagesResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ErrorExtraInfo(BaseModel):
     preconditionFailedExtraInfo: int = Field(alias="1", default=0)
@@ -335,6 +374,7 @@ class ErrorExtraInfo(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FetchDirection(IntEnum):
     FORWARD = 1
@@ -348,6 +388,7 @@ class FetchLiveTalkEventsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FetchLiveTalkEventsResponse(BaseModel):
     events: List["LiveTalkEvent"] = Field(alias="1", default_factory=list)
@@ -356,6 +397,7 @@ class FetchLiveTalkEventsResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FetchMyEventsRequest(BaseModel):
     subscriptionId: int = Field(alias="1", default=0)
@@ -365,6 +407,7 @@ class FetchMyEventsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FetchMyEventsResponse(BaseModel):
     subscription: Optional["SubscriptionState"] = Field(alias="1", default=None)
@@ -374,6 +417,7 @@ class FetchMyEventsResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FetchSquareChatEventsRequest(BaseModel):
     subscriptionId: int = Field(alias="1", default=0)
@@ -388,6 +432,7 @@ class FetchSquareChatEventsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FetchSquareChatEventsResponse(BaseModel):
     subscription: Optional["SubscriptionState"] = Field(alias="1", default=None)
@@ -397,6 +442,7 @@ class FetchSquareChatEventsResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FetchType(IntEnum):
     DEFAULT = 1
@@ -408,6 +454,7 @@ class FindLiveTalkByInvitationTicketRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FindLiveTalkByInvitationTicketResponse(BaseModel):
     chatInvitationTicket: Optional[str] = Field(alias="1", default=None)
@@ -419,12 +466,14 @@ class FindLiveTalkByInvitationTicketResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FindSquareByEmidRequest(BaseModel):
     emid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FindSquareByEmidResponse(BaseModel):
     square: Optional["Square"] = Field(alias="1", default=None)
@@ -436,12 +485,14 @@ class FindSquareByEmidResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FindSquareByInvitationTicketRequest(BaseModel):
     invitationTicket: Optional[str] = Field(alias="2", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FindSquareByInvitationTicketResponse(BaseModel):
     square: Optional["Square"] = Field(alias="1", default=None)
@@ -455,12 +506,14 @@ class FindSquareByInvitationTicketResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FindSquareByInvitationTicketV2Request(BaseModel):
     invitationTicket: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class FindSquareByInvitationTicketV2Response(BaseModel):
     square: Optional["Square"] = Field(alias="1", default=None)
@@ -474,6 +527,7 @@ class FindSquareByInvitationTicketV2Response(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ForceEndLiveTalkRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -481,12 +535,14 @@ class ForceEndLiveTalkRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ForceEndLiveTalkResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GeolocationAccuracy(BaseModel):
     radiusMeters: float = Field(alias="1", default=0.0)
@@ -498,6 +554,7 @@ class GeolocationAccuracy(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetGoogleAdOptionsRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -506,6 +563,7 @@ class GetGoogleAdOptionsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetGoogleAdOptionsResponse(BaseModel):
     showAd: bool = Field(alias="1", default=False)
@@ -515,18 +573,21 @@ class GetGoogleAdOptionsResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetInvitationTicketUrlRequest(BaseModel):
     mid: Optional[str] = Field(alias="2", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetInvitationTicketUrlResponse(BaseModel):
     invitationURL: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetJoinableSquareChatsRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -535,6 +596,7 @@ class GetJoinableSquareChatsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetJoinableSquareChatsResponse(BaseModel):
     squareChats: List["SquareChat"] = Field(alias="1", default_factory=list)
@@ -544,6 +606,7 @@ class GetJoinableSquareChatsResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetJoinedSquareChatsRequest(BaseModel):
     continuationToken: Optional[str] = Field(alias="2", default=None)
@@ -551,6 +614,7 @@ class GetJoinedSquareChatsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetJoinedSquareChatsResponse(BaseModel):
     chats: List["SquareChat"] = Field(alias="1", default_factory=list)
@@ -560,6 +624,7 @@ class GetJoinedSquareChatsResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetJoinedSquaresRequest(BaseModel):
     continuationToken: Optional[str] = Field(alias="2", default=None)
@@ -567,6 +632,7 @@ class GetJoinedSquaresRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetJoinedSquaresResponse(BaseModel):
     squares: List["Square"] = Field(alias="1", default_factory=list)
@@ -578,6 +644,7 @@ class GetJoinedSquaresResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetLiveTalkInfoForNonMemberRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -586,6 +653,7 @@ class GetLiveTalkInfoForNonMemberRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetLiveTalkInfoForNonMemberResponse(BaseModel):
     chatName: Optional[str] = Field(alias="1", default=None)
@@ -596,6 +664,7 @@ class GetLiveTalkInfoForNonMemberResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetLiveTalkInvitationUrlRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -603,12 +672,14 @@ class GetLiveTalkInvitationUrlRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetLiveTalkInvitationUrlResponse(BaseModel):
     invitationUrl: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetLiveTalkSpeakersForNonMemberRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -617,12 +688,14 @@ class GetLiveTalkSpeakersForNonMemberRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetLiveTalkSpeakersForNonMemberResponse(BaseModel):
     speakers: List["LiveTalkSpeaker"] = Field(alias="1", default_factory=list)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetMessageReactionsRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -634,6 +707,7 @@ class GetMessageReactionsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetMessageReactionsResponse(BaseModel):
     reactions: List["SquareMessageReaction"] = Field(alias="1", default_factory=list)
@@ -642,12 +716,14 @@ class GetMessageReactionsResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetNoteStatusRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetNoteStatusResponse(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -655,12 +731,14 @@ class GetNoteStatusResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetPopularKeywordsRequest(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetPopularKeywordsResponse(BaseModel):
     popularKeywords: List["PopularKeyword"] = Field(alias="1", default_factory=list)
@@ -668,78 +746,91 @@ class GetPopularKeywordsResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareAuthoritiesRequest(BaseModel):
     squareMids: List[str] = Field(alias="2", default_factory=list)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareAuthoritiesResponse(BaseModel):
     authorities: Dict[str, "SquareAuthority"] = Field(alias="1", default_factory=dict)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareAuthorityRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareAuthorityResponse(BaseModel):
     authority: Optional["SquareAuthority"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareCategoriesRequest(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareCategoriesResponse(BaseModel):
     categoryList: List["Category"] = Field(alias="1", default_factory=list)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatAnnouncementsRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="2", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatAnnouncementsResponse(BaseModel):
     announcements: List["SquareChatAnnouncement"] = Field(alias="1", default_factory=list)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatEmidRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatEmidResponse(BaseModel):
     squareChatEmid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatFeatureSetRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="2", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatFeatureSetResponse(BaseModel):
     squareChatFeatureSet: Optional["SquareChatFeatureSet"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatMemberRequest(BaseModel):
     squareMemberMid: Optional[str] = Field(alias="2", default=None)
@@ -747,12 +838,14 @@ class GetSquareChatMemberRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatMemberResponse(BaseModel):
     squareChatMember: Optional["SquareChatMember"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatMembersRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -761,6 +854,7 @@ class GetSquareChatMembersRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatMembersResponse(BaseModel):
     squareChatMembers: List["SquareMember"] = Field(alias="1", default_factory=list)
@@ -769,12 +863,14 @@ class GetSquareChatMembersResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatResponse(BaseModel):
     squareChat: Optional["SquareChat"] = Field(alias="1", default=None)
@@ -783,48 +879,56 @@ class GetSquareChatResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatStatusRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="2", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareChatStatusResponse(BaseModel):
     chatStatus: Optional["SquareChatStatus"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareEmidRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareEmidResponse(BaseModel):
     squareEmid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareFeatureSetRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareFeatureSetResponse(BaseModel):
     squareFeatureSet: Optional["SquareFeatureSet"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareInfoByChatMidRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareInfoByChatMidResponse(BaseModel):
     defaultChatMid: Optional[str] = Field(alias="1", default=None)
@@ -833,6 +937,7 @@ class GetSquareInfoByChatMidResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareMemberRelationRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -840,6 +945,7 @@ class GetSquareMemberRelationRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareMemberRelationResponse(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -848,6 +954,7 @@ class GetSquareMemberRelationResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareMemberRelationsRequest(BaseModel):
     state: Optional["SquareMemberRelationState"] = Field(alias="2", default=None)
@@ -856,6 +963,7 @@ class GetSquareMemberRelationsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareMemberRelationsResponse(BaseModel):
     squareMembers: List["SquareMember"] = Field(alias="1", default_factory=list)
@@ -864,12 +972,14 @@ class GetSquareMemberRelationsResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareMemberRequest(BaseModel):
     squareMemberMid: Optional[str] = Field(alias="2", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareMemberResponse(BaseModel):
     squareMember: Optional["SquareMember"] = Field(alias="1", default=None)
@@ -879,6 +989,7 @@ class GetSquareMemberResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareMembersBySquareRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -886,6 +997,7 @@ class GetSquareMembersBySquareRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareMembersBySquareResponse(BaseModel):
     members: List["SquareMember"] = Field(alias="1", default_factory=list)
@@ -893,24 +1005,28 @@ class GetSquareMembersBySquareResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareMembersRequest(BaseModel):
     mids: List[str] = Field(alias="2", default_factory=list)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareMembersResponse(BaseModel):
     members: Dict[str, "SquareMember"] = Field(alias="1", default_factory=dict)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareRequest(BaseModel):
     mid: Optional[str] = Field(alias="2", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareResponse(BaseModel):
     square: Optional["Square"] = Field(alias="1", default=None)
@@ -923,18 +1039,21 @@ class GetSquareResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareStatusRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareStatusResponse(BaseModel):
     squareStatus: Optional["SquareStatus"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareThreadMidRequest(BaseModel):
     chatMid: Optional[str] = Field(alias="1", default=None)
@@ -942,12 +1061,14 @@ class GetSquareThreadMidRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareThreadMidResponse(BaseModel):
     threadMid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareThreadRequest(BaseModel):
     threadMid: Optional[str] = Field(alias="1", default=None)
@@ -955,6 +1076,7 @@ class GetSquareThreadRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetSquareThreadResponse(BaseModel):
     squareThread: Optional["SquareThread"] = Field(alias="1", default=None)
@@ -963,12 +1085,14 @@ class GetSquareThreadResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetUserSettingsRequest(BaseModel):
     requestedAttrs: List[Any] = Field(alias="1", default_factory=list)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class GetUserSettingsResponse(BaseModel):
     requestedAttrs: List[int] = Field(alias="1", default_factory=list)
@@ -976,18 +1100,21 @@ class GetUserSettingsResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class HideSquareMemberContentsRequest(BaseModel):
     squareMemberMid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class HideSquareMemberContentsResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteIntoSquareChatRequest(BaseModel):
     inviteeMids: List[str] = Field(alias="1", default_factory=list)
@@ -995,12 +1122,14 @@ class InviteIntoSquareChatRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteIntoSquareChatResponse(BaseModel):
     inviteeMids: List[str] = Field(alias="1", default_factory=list)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteToChangeRoleRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1010,12 +1139,14 @@ class InviteToChangeRoleRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteToChangeRoleResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteToListenRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1024,12 +1155,14 @@ class InviteToListenRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteToListenResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteToLiveTalkRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1038,12 +1171,14 @@ class InviteToLiveTalkRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteToLiveTalkResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteToSpeakRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1052,12 +1187,14 @@ class InviteToSpeakRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteToSpeakResponse(BaseModel):
     inviteRequestId: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteToSquareRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -1066,12 +1203,14 @@ class InviteToSquareRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class InviteToSquareResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class JoinLiveTalkRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1081,6 +1220,7 @@ class JoinLiveTalkRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class JoinLiveTalkResponse(BaseModel):
     hostMemberMid: Optional[str] = Field(alias="1", default=None)
@@ -1101,12 +1241,14 @@ class JoinLiveTalkResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class JoinSquareChatRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class JoinSquareChatResponse(BaseModel):
     squareChat: Optional["SquareChat"] = Field(alias="1", default=None)
@@ -1115,6 +1257,7 @@ class JoinSquareChatResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class JoinSquareRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -1125,6 +1268,7 @@ class JoinSquareRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class JoinSquareResponse(BaseModel):
     square: Optional["Square"] = Field(alias="1", default=None)
@@ -1139,6 +1283,7 @@ class JoinSquareResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class JoinSquareThreadRequest(BaseModel):
     chatMid: Optional[str] = Field(alias="1", default=None)
@@ -1146,12 +1291,14 @@ class JoinSquareThreadRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class JoinSquareThreadResponse(BaseModel):
     threadMember: Optional["SquareThreadMember"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class KickOutLiveTalkParticipantsRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1160,12 +1307,14 @@ class KickOutLiveTalkParticipantsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class KickOutLiveTalkParticipantsResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LeaveSquareChatRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="2", default=None)
@@ -1174,24 +1323,28 @@ class LeaveSquareChatRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LeaveSquareChatResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LeaveSquareRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LeaveSquareResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LeaveSquareThreadRequest(BaseModel):
     chatMid: Optional[str] = Field(alias="1", default=None)
@@ -1199,12 +1352,14 @@ class LeaveSquareThreadRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LeaveSquareThreadResponse(BaseModel):
     threadMember: Optional["SquareThreadMember"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalk(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1221,6 +1376,7 @@ class LiveTalk(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkAttribute(IntEnum):
     TITLE = 1
@@ -1233,24 +1389,28 @@ class LiveTalkEvent(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkEventNotifiedUpdateLiveTalkAllowRequestToSpeak(BaseModel):
     allowRequestToSpeak: bool = Field(alias="1", default=False)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkEventNotifiedUpdateLiveTalkAnnouncement(BaseModel):
     announcement: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkEventNotifiedUpdateLiveTalkTitle(BaseModel):
     title: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkEventNotifiedUpdateSquareMember(BaseModel):
     squareMemberMid: Optional[str] = Field(alias="1", default=None)
@@ -1260,6 +1420,7 @@ class LiveTalkEventNotifiedUpdateSquareMember(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkEventNotifiedUpdateSquareMemberRole(BaseModel):
     squareMemberMid: Optional[str] = Field(alias="1", default=None)
@@ -1267,6 +1428,7 @@ class LiveTalkEventNotifiedUpdateSquareMemberRole(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkEventPayload(BaseModel):
     notifiedUpdateLiveTalkTitle: Optional["LiveTalkEventNotifiedUpdateLiveTalkTitle"] = Field(alias="1", default=None)
@@ -1277,6 +1439,7 @@ class LiveTalkEventPayload(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkEventType(IntEnum):
     NOTIFIED_UPDATE_LIVE_TALK_TITLE = 1
@@ -1290,6 +1453,7 @@ class LiveTalkExtraInfo(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkKickOutTarget(BaseModel):
     liveTalkParticipant: Optional["LiveTalkParticipant"] = Field(alias="1", default=None)
@@ -1297,12 +1461,14 @@ class LiveTalkKickOutTarget(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkParticipant(BaseModel):
     mid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkReportType(IntEnum):
     ADVERTISING = 1
@@ -1325,6 +1491,7 @@ class LiveTalkSpeaker(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class LiveTalkSpeakerSetting(IntEnum):
     APPROVAL = 1
@@ -1347,6 +1514,7 @@ class Location(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class MIDType(IntEnum):
     USER = 0
@@ -1365,6 +1533,7 @@ class ManualRepairRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ManualRepairResponse(BaseModel):
     events: List["SquareEvent"] = Field(alias="1", default_factory=list)
@@ -1373,6 +1542,7 @@ class ManualRepairResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class MarkAsReadRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="2", default=None)
@@ -1381,36 +1551,42 @@ class MarkAsReadRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class MarkAsReadResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class MarkChatsAsReadRequest(BaseModel):
     chatMids: List[str] = Field(alias="2", default_factory=list)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class MarkChatsAsReadResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class MarkThreadsAsReadRequest(BaseModel):
     chatMid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class MarkThreadsAsReadResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class Mentionable(BaseModel):
     squareMember: Optional["MentionableSquareMember"] = Field(alias="1", default=None)
@@ -1418,6 +1594,7 @@ class Mentionable(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class MentionableBot(BaseModel):
     mid: Optional[str] = Field(alias="1", default=None)
@@ -1427,6 +1604,7 @@ class MentionableBot(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class MentionableSquareMember(BaseModel):
     mid: Optional[str] = Field(alias="1", default=None)
@@ -1437,6 +1615,7 @@ class MentionableSquareMember(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class Message(BaseModel):
     from_: Optional[str] = Field(alias="1", default=None)
@@ -1462,6 +1641,7 @@ class Message(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class MessageReactionType(IntEnum):
     ALL = 0
@@ -1478,6 +1658,7 @@ class MessageStatusContents(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class MessageSummaryReportType(IntEnum):
     LEGAL_VIOLATION = 1
@@ -1494,6 +1675,7 @@ class MessageVisibility(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class NoteStatus(BaseModel):
     noteCount: int = Field(alias="1", default=0)
@@ -1501,6 +1683,7 @@ class NoteStatus(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class NotificationPostType(IntEnum):
     POST_MENTION = 2
@@ -1519,6 +1702,7 @@ class OkButton(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class Pb1_B(IntEnum):
     SIRI = 1
@@ -1557,6 +1741,7 @@ class PopularKeyword(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReactToMessageRequest(BaseModel):
     reqSeq: int = Field(alias="1", default=0)
@@ -1567,6 +1752,7 @@ class ReactToMessageRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReactToMessageResponse(BaseModel):
     reaction: Optional["SquareMessageReaction"] = Field(alias="1", default=None)
@@ -1574,6 +1760,7 @@ class ReactToMessageResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class Reaction(BaseModel):
     fromUserMid: Optional[str] = Field(alias="1", default=None)
@@ -1582,18 +1769,21 @@ class Reaction(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReactionType(BaseModel):
     predefinedReactionType: Optional["MessageReactionType"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RefreshSubscriptionsRequest(BaseModel):
     subscriptions: List[int] = Field(alias="2", default_factory=list)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RefreshSubscriptionsResponse(BaseModel):
     ttlMillis: int = Field(alias="1", default=0)
@@ -1601,6 +1791,7 @@ class RefreshSubscriptionsResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RejectSpeakersRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1609,12 +1800,14 @@ class RejectSpeakersRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RejectSpeakersResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RejectSquareMembersRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -1622,6 +1815,7 @@ class RejectSquareMembersRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RejectSquareMembersResponse(BaseModel):
     rejectedMembers: List["SquareMember"] = Field(alias="1", default_factory=list)
@@ -1629,6 +1823,7 @@ class RejectSquareMembersResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RejectToSpeakRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1637,12 +1832,14 @@ class RejectToSpeakRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RejectToSpeakResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RemoveLiveTalkSubscriptionRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1650,24 +1847,28 @@ class RemoveLiveTalkSubscriptionRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RemoveLiveTalkSubscriptionResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RemoveSubscriptionsRequest(BaseModel):
     unsubscriptions: List[int] = Field(alias="2", default_factory=list)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RemoveSubscriptionsResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportLiveTalkRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1676,12 +1877,14 @@ class ReportLiveTalkRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportLiveTalkResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportLiveTalkSpeakerRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1691,12 +1894,14 @@ class ReportLiveTalkSpeakerRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportLiveTalkSpeakerResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportMessageSummaryRequest(BaseModel):
     chatEmid: Optional[str] = Field(alias="1", default=None)
@@ -1705,12 +1910,14 @@ class ReportMessageSummaryRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportMessageSummaryResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportSquareChatRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -1720,12 +1927,14 @@ class ReportSquareChatRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportSquareChatResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportSquareMemberRequest(BaseModel):
     squareMemberMid: Optional[str] = Field(alias="2", default=None)
@@ -1736,12 +1945,14 @@ class ReportSquareMemberRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportSquareMemberResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportSquareMessageRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -1753,12 +1964,14 @@ class ReportSquareMessageRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportSquareMessageResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportSquareRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -1767,12 +1980,14 @@ class ReportSquareRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportSquareResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class ReportType(IntEnum):
     ADVERTISING = 1
@@ -1789,12 +2004,14 @@ class RequestToListenRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RequestToListenResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RequestToSpeakRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1802,12 +2019,14 @@ class RequestToSpeakRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class RequestToSpeakResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SearchSquareChatMembersRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1817,6 +2036,7 @@ class SearchSquareChatMembersRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SearchSquareChatMembersResponse(BaseModel):
     members: List["SquareMember"] = Field(alias="1", default_factory=list)
@@ -1825,6 +2045,7 @@ class SearchSquareChatMembersResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SearchSquareChatMentionablesRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -1834,6 +2055,7 @@ class SearchSquareChatMentionablesRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SearchSquareChatMentionablesResponse(BaseModel):
     mentionables: List["Mentionable"] = Field(alias="1", default_factory=list)
@@ -1841,6 +2063,7 @@ class SearchSquareChatMentionablesResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SearchSquareMembersRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -1850,6 +2073,7 @@ class SearchSquareMembersRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SearchSquareMembersResponse(BaseModel):
     members: List["SquareMember"] = Field(alias="1", default_factory=list)
@@ -1859,6 +2083,7 @@ class SearchSquareMembersResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SearchSquaresRequest(BaseModel):
     query: Optional[str] = Field(alias="2", default=None)
@@ -1867,6 +2092,7 @@ class SearchSquaresRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SearchSquaresResponse(BaseModel):
     squares: List["Square"] = Field(alias="1", default_factory=list)
@@ -1877,6 +2103,7 @@ class SearchSquaresResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SendMessageRequest(BaseModel):
     reqSeq: int = Field(alias="1", default=0)
@@ -1885,12 +2112,14 @@ class SendMessageRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SendMessageResponse(BaseModel):
     createdSquareMessage: Optional["SquareMessage"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SendSquareThreadMessageRequest(BaseModel):
     reqSeq: int = Field(alias="1", default=0)
@@ -1900,12 +2129,14 @@ class SendSquareThreadMessageRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SendSquareThreadMessageResponse(BaseModel):
     createdThreadMessage: Optional["SquareMessage"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class Square(BaseModel):
     mid: Optional[str] = Field(alias="1", default=None)
@@ -1928,6 +2159,7 @@ class Square(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareAttribute(IntEnum):
     NAME = 1
@@ -1963,6 +2195,7 @@ class SquareAuthority(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareAuthorityAttribute(IntEnum):
     UPDATE_SQUARE_PROFILE = 1
@@ -1994,6 +2227,7 @@ class SquareChat(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareChatAnnouncement(BaseModel):
     announcementSeq: int = Field(alias="1", default=0)
@@ -2004,12 +2238,14 @@ class SquareChatAnnouncement(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareChatAnnouncementContents(BaseModel):
     textMessageAnnouncementContents: Optional["TextMessageAnnouncementContents"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareChatAttribute(IntEnum):
     NAME = 2
@@ -2026,6 +2262,7 @@ class SquareChatFeature(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareChatFeatureControlState(IntEnum):
     DISABLED = 1
@@ -2039,6 +2276,7 @@ class SquareChatFeatureSet(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareChatMember(BaseModel):
     squareMemberMid: Optional[str] = Field(alias="1", default=None)
@@ -2050,6 +2288,7 @@ class SquareChatMember(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareChatMemberAttribute(IntEnum):
     MEMBERSHIP_STATE = 4
@@ -2064,6 +2303,7 @@ class SquareChatMemberSearchOption(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareChatMembershipState(IntEnum):
     JOINED = 1
@@ -2074,6 +2314,7 @@ class SquareChatMentionableSearchOption(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareChatState(IntEnum):
     ALIVE = 0
@@ -2087,6 +2328,7 @@ class SquareChatStatus(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareChatStatusWithoutMessage(BaseModel):
     memberCount: int = Field(alias="1", default=0)
@@ -2098,6 +2340,7 @@ class SquareChatStatusWithoutMessage(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareChatType(IntEnum):
     OPEN = 1
@@ -2132,6 +2375,7 @@ class SquareEvent(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventChatPopup(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2141,6 +2385,7 @@ class SquareEventChatPopup(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventMutateMessage(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2151,6 +2396,7 @@ class SquareEventMutateMessage(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationJoinRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2160,6 +2406,7 @@ class SquareEventNotificationJoinRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationLiveTalk(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2169,6 +2416,7 @@ class SquareEventNotificationLiveTalk(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationMemberUpdate(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2177,6 +2425,7 @@ class SquareEventNotificationMemberUpdate(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationMessage(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2190,6 +2439,7 @@ class SquareEventNotificationMessage(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationMessageReaction(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2202,6 +2452,7 @@ class SquareEventNotificationMessageReaction(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationNewChatMember(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2209,6 +2460,7 @@ class SquareEventNotificationNewChatMember(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationPost(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2219,6 +2471,7 @@ class SquareEventNotificationPost(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationPostAnnouncement(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2228,6 +2481,7 @@ class SquareEventNotificationPostAnnouncement(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationSquareChatDelete(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2236,6 +2490,7 @@ class SquareEventNotificationSquareChatDelete(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationSquareDelete(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2244,6 +2499,7 @@ class SquareEventNotificationSquareDelete(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationThreadMessage(BaseModel):
     threadMid: Optional[str] = Field(alias="1", default=None)
@@ -2256,6 +2512,7 @@ class SquareEventNotificationThreadMessage(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotificationThreadMessageReaction(BaseModel):
     threadMid: Optional[str] = Field(alias="1", default=None)
@@ -2267,6 +2524,7 @@ class SquareEventNotificationThreadMessageReaction(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedAddBot(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2276,6 +2534,7 @@ class SquareEventNotifiedAddBot(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedCreateSquareChatMember(BaseModel):
     chat: Optional["SquareChat"] = Field(alias="1", default=None)
@@ -2287,6 +2546,7 @@ class SquareEventNotifiedCreateSquareChatMember(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedCreateSquareMember(BaseModel):
     square: Optional["Square"] = Field(alias="1", default=None)
@@ -2298,12 +2558,14 @@ class SquareEventNotifiedCreateSquareMember(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedDeleteSquareChat(BaseModel):
     squareChat: Optional["SquareChat"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedDestroyMessage(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2312,6 +2574,7 @@ class SquareEventNotifiedDestroyMessage(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedInviteIntoSquareChat(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2321,6 +2584,7 @@ class SquareEventNotifiedInviteIntoSquareChat(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedJoinSquareChat(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2328,6 +2592,7 @@ class SquareEventNotifiedJoinSquareChat(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedKickoutFromSquare(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2336,6 +2601,7 @@ class SquareEventNotifiedKickoutFromSquare(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedLeaveSquareChat(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2345,6 +2611,7 @@ class SquareEventNotifiedLeaveSquareChat(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedMarkAsRead(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2353,6 +2620,7 @@ class SquareEventNotifiedMarkAsRead(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedRemoveBot(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2362,6 +2630,7 @@ class SquareEventNotifiedRemoveBot(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedShutdownSquare(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2369,6 +2638,7 @@ class SquareEventNotifiedShutdownSquare(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedSystemMessage(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2377,6 +2647,7 @@ class SquareEventNotifiedSystemMessage(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateLiveTalk(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2385,6 +2656,7 @@ class SquareEventNotifiedUpdateLiveTalk(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateLiveTalkInfo(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2393,6 +2665,7 @@ class SquareEventNotifiedUpdateLiveTalkInfo(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateMessageStatus(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2402,6 +2675,7 @@ class SquareEventNotifiedUpdateMessageStatus(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateReadonlyChat(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2409,6 +2683,7 @@ class SquareEventNotifiedUpdateReadonlyChat(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquare(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2416,6 +2691,7 @@ class SquareEventNotifiedUpdateSquare(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareAuthority(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2423,6 +2699,7 @@ class SquareEventNotifiedUpdateSquareAuthority(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareChat(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2431,6 +2708,7 @@ class SquareEventNotifiedUpdateSquareChat(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareChatAnnouncement(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2438,12 +2716,14 @@ class SquareEventNotifiedUpdateSquareChatAnnouncement(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareChatFeatureSet(BaseModel):
     squareChatFeatureSet: Optional["SquareChatFeatureSet"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareChatMaxMemberCount(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2452,6 +2732,7 @@ class SquareEventNotifiedUpdateSquareChatMaxMemberCount(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareChatMember(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2459,6 +2740,7 @@ class SquareEventNotifiedUpdateSquareChatMember(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareChatProfileImage(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2466,6 +2748,7 @@ class SquareEventNotifiedUpdateSquareChatProfileImage(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareChatProfileName(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2474,6 +2757,7 @@ class SquareEventNotifiedUpdateSquareChatProfileName(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareChatStatus(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2481,12 +2765,14 @@ class SquareEventNotifiedUpdateSquareChatStatus(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareFeatureSet(BaseModel):
     squareFeatureSet: Optional["SquareFeatureSet"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareMember(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2495,6 +2781,7 @@ class SquareEventNotifiedUpdateSquareMember(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareMemberProfile(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2502,6 +2789,7 @@ class SquareEventNotifiedUpdateSquareMemberProfile(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareMemberRelation(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2511,6 +2799,7 @@ class SquareEventNotifiedUpdateSquareMemberRelation(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareNoteStatus(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2518,6 +2807,7 @@ class SquareEventNotifiedUpdateSquareNoteStatus(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateSquareStatus(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -2525,12 +2815,14 @@ class SquareEventNotifiedUpdateSquareStatus(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateThread(BaseModel):
     squareThread: Optional["SquareThread"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateThreadMember(BaseModel):
     threadMember: Optional["SquareThreadMember"] = Field(alias="1", default=None)
@@ -2542,12 +2834,14 @@ class SquareEventNotifiedUpdateThreadMember(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateThreadRootMessage(BaseModel):
     squareThread: Optional["SquareThread"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateThreadRootMessageStatus(BaseModel):
     chatMid: Optional[str] = Field(alias="1", default=None)
@@ -2558,6 +2852,7 @@ class SquareEventNotifiedUpdateThreadRootMessageStatus(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventNotifiedUpdateThreadStatus(BaseModel):
     threadMid: Optional[str] = Field(alias="1", default=None)
@@ -2567,6 +2862,7 @@ class SquareEventNotifiedUpdateThreadStatus(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventPayload(BaseModel):
     receiveMessage: Optional["SquareEventReceiveMessage"] = Field(alias="1", default=None)
@@ -2630,6 +2926,7 @@ class SquareEventPayload(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventReceiveMessage(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2645,6 +2942,7 @@ class SquareEventReceiveMessage(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventSendMessage(BaseModel):
     squareChatMid: Optional[str] = Field(alias="1", default=None)
@@ -2658,6 +2956,7 @@ class SquareEventSendMessage(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareEventStatus(IntEnum):
     NORMAL = 1
@@ -2730,12 +3029,14 @@ class SquareException(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareExtraInfo(BaseModel):
     country: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareFeature(BaseModel):
     controlState: Optional["SquareFeatureControlState"] = Field(alias="1", default=None)
@@ -2743,6 +3044,7 @@ class SquareFeature(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareFeatureControlState(IntEnum):
     DISABLED = 1
@@ -2769,6 +3071,7 @@ class SquareFeatureSet(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareFeatureSetAttribute(IntEnum):
     CREATING_SECRET_SQUARE_CHAT = 1
@@ -2793,6 +3096,7 @@ class SquareJoinMethod(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareJoinMethodType(IntEnum):
     NONE = 0
@@ -2805,6 +3109,7 @@ class SquareJoinMethodValue(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareMember(BaseModel):
     squareMemberMid: Optional[str] = Field(alias="1", default=None)
@@ -2821,6 +3126,7 @@ class SquareMember(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareMemberAttribute(IntEnum):
     DISPLAY_NAME = 1
@@ -2836,6 +3142,7 @@ class SquareMemberRelation(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareMemberRelationState(IntEnum):
     NONE = 1
@@ -2859,6 +3166,7 @@ class SquareMemberSearchOption(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareMembershipState(IntEnum):
     JOIN_REQUESTED = 1
@@ -2879,6 +3187,7 @@ class SquareMessage(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareMessageReaction(BaseModel):
     type_: Optional["MessageReactionType"] = Field(alias="1", default=None)
@@ -2888,6 +3197,7 @@ class SquareMessageReaction(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareMessageReactionStatus(BaseModel):
     totalCount: int = Field(alias="1", default=0)
@@ -2896,6 +3206,7 @@ class SquareMessageReactionStatus(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareMessageState(IntEnum):
     SENT = 1
@@ -2913,6 +3224,7 @@ class SquareMessageStatus(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareMessageThreadInfo(BaseModel):
     chatThreadMid: Optional[str] = Field(alias="1", default=None)
@@ -2920,6 +3232,7 @@ class SquareMessageThreadInfo(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquarePreference(BaseModel):
     favoriteTimestamp: int = Field(alias="1", default=0)
@@ -2927,6 +3240,7 @@ class SquarePreference(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquarePreferenceAttribute(IntEnum):
     FAVORITE = 1
@@ -2937,6 +3251,7 @@ class SquareService_acceptSpeakers_args(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_acceptSpeakers_result(BaseModel):
     success: Optional["AcceptSpeakersResponse"] = Field(alias="0", default=None)
@@ -2944,12 +3259,14 @@ class SquareService_acceptSpeakers_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_acceptToChangeRole_args(BaseModel):
     request: Optional["AcceptToChangeRoleRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_acceptToChangeRole_result(BaseModel):
     success: Optional["AcceptToChangeRoleResponse"] = Field(alias="0", default=None)
@@ -2957,12 +3274,14 @@ class SquareService_acceptToChangeRole_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_acceptToListen_args(BaseModel):
     request: "AcceptToListenRequest" = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_acceptToListen_result(BaseModel):
     success: "AcceptToListenResponse" = Field(alias="0", default=None)
@@ -2970,12 +3289,14 @@ class SquareService_acceptToListen_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_acceptToSpeak_args(BaseModel):
     request: Optional["AcceptToSpeakRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_acceptToSpeak_result(BaseModel):
     success: Optional["AcceptToSpeakResponse"] = Field(alias="0", default=None)
@@ -2983,12 +3304,14 @@ class SquareService_acceptToSpeak_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_acquireLiveTalk_args(BaseModel):
     request: Optional["AcquireLiveTalkRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_acquireLiveTalk_result(BaseModel):
     success: Optional["AcquireLiveTalkResponse"] = Field(alias="0", default=None)
@@ -2996,12 +3319,14 @@ class SquareService_acquireLiveTalk_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_agreeToTerms_args(BaseModel):
     request: Optional["AgreeToTermsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_agreeToTerms_result(BaseModel):
     success: Optional["AgreeToTermsResponse"] = Field(alias="0", default=None)
@@ -3009,12 +3334,14 @@ class SquareService_agreeToTerms_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_approveSquareMembers_args(BaseModel):
     request: Optional["ApproveSquareMembersRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_approveSquareMembers_result(BaseModel):
     success: Optional["ApproveSquareMembersResponse"] = Field(alias="0", default=None)
@@ -3022,12 +3349,14 @@ class SquareService_approveSquareMembers_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_cancelToSpeak_args(BaseModel):
     request: Optional["CancelToSpeakRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_cancelToSpeak_result(BaseModel):
     success: Optional["CancelToSpeakResponse"] = Field(alias="0", default=None)
@@ -3035,12 +3364,14 @@ class SquareService_cancelToSpeak_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_checkJoinCode_args(BaseModel):
     request: Optional["CheckJoinCodeRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_checkJoinCode_result(BaseModel):
     success: Optional["CheckJoinCodeResponse"] = Field(alias="0", default=None)
@@ -3048,12 +3379,14 @@ class SquareService_checkJoinCode_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_createSquareChatAnnouncement_args(BaseModel):
     createSquareChatAnnouncementRequest: Optional["CreateSquareChatAnnouncementRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_createSquareChatAnnouncement_result(BaseModel):
     success: Optional["CreateSquareChatAnnouncementResponse"] = Field(alias="0", default=None)
@@ -3061,12 +3394,14 @@ class SquareService_createSquareChatAnnouncement_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_createSquareChat_args(BaseModel):
     request: Optional["CreateSquareChatRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_createSquareChat_result(BaseModel):
     success: Optional["CreateSquareChatResponse"] = Field(alias="0", default=None)
@@ -3074,12 +3409,14 @@ class SquareService_createSquareChat_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_createSquare_args(BaseModel):
     request: Optional["CreateSquareRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_createSquare_result(BaseModel):
     success: Optional["CreateSquareResponse"] = Field(alias="0", default=None)
@@ -3087,12 +3424,14 @@ class SquareService_createSquare_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_deleteSquareChatAnnouncement_args(BaseModel):
     deleteSquareChatAnnouncementRequest: Optional["DeleteSquareChatAnnouncementRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_deleteSquareChatAnnouncement_result(BaseModel):
     success: Optional["DeleteSquareChatAnnouncementResponse"] = Field(alias="0", default=None)
@@ -3100,12 +3439,14 @@ class SquareService_deleteSquareChatAnnouncement_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_deleteSquareChat_args(BaseModel):
     request: Optional["DeleteSquareChatRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_deleteSquareChat_result(BaseModel):
     success: Optional["DeleteSquareChatResponse"] = Field(alias="0", default=None)
@@ -3113,12 +3454,14 @@ class SquareService_deleteSquareChat_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_deleteSquare_args(BaseModel):
     request: Optional["DeleteSquareRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_deleteSquare_result(BaseModel):
     success: Optional["DeleteSquareResponse"] = Field(alias="0", default=None)
@@ -3126,12 +3469,14 @@ class SquareService_deleteSquare_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_destroyMessage_args(BaseModel):
     request: Optional["DestroyMessageRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_destroyMessage_result(BaseModel):
     success: Optional["DestroyMessageResponse"] = Field(alias="0", default=None)
@@ -3139,12 +3484,14 @@ class SquareService_destroyMessage_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_destroyMessages_args(BaseModel):
     request: Optional["DestroyMessagesRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_destroyMessages_result(BaseModel):
     success: Optional["DestroyMessagesResponse"] = Field(alias="0", default=None)
@@ -3152,12 +3499,14 @@ class SquareService_destroyMessages_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_fetchLiveTalkEvents_args(BaseModel):
     request: Optional["FetchLiveTalkEventsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_fetchLiveTalkEvents_result(BaseModel):
     success: Optional["FetchLiveTalkEventsResponse"] = Field(alias="0", default=None)
@@ -3165,12 +3514,14 @@ class SquareService_fetchLiveTalkEvents_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_fetchMyEvents_args(BaseModel):
     request: Optional["FetchMyEventsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_fetchMyEvents_result(BaseModel):
     success: Optional["FetchMyEventsResponse"] = Field(alias="0", default=None)
@@ -3178,12 +3529,14 @@ class SquareService_fetchMyEvents_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_fetchSquareChatEvents_args(BaseModel):
     request: Optional["FetchSquareChatEventsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_fetchSquareChatEvents_result(BaseModel):
     success: Optional["FetchSquareChatEventsResponse"] = Field(alias="0", default=None)
@@ -3191,12 +3544,14 @@ class SquareService_fetchSquareChatEvents_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_findLiveTalkByInvitationTicket_args(BaseModel):
     request: Optional["FindLiveTalkByInvitationTicketRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_findLiveTalkByInvitationTicket_result(BaseModel):
     success: Optional["FindLiveTalkByInvitationTicketResponse"] = Field(alias="0", default=None)
@@ -3204,12 +3559,14 @@ class SquareService_findLiveTalkByInvitationTicket_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_findSquareByEmid_args(BaseModel):
     findSquareByEmidRequest: Optional["FindSquareByEmidRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_findSquareByEmid_result(BaseModel):
     success: Optional["FindSquareByEmidResponse"] = Field(alias="0", default=None)
@@ -3217,12 +3574,14 @@ class SquareService_findSquareByEmid_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_findSquareByInvitationTicketV2_args(BaseModel):
     request: Optional["FindSquareByInvitationTicketV2Request"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_findSquareByInvitationTicketV2_result(BaseModel):
     success: Optional["FindSquareByInvitationTicketV2Response"] = Field(alias="0", default=None)
@@ -3230,12 +3589,14 @@ class SquareService_findSquareByInvitationTicketV2_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_findSquareByInvitationTicket_args(BaseModel):
     request: Optional["FindSquareByInvitationTicketRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_findSquareByInvitationTicket_result(BaseModel):
     success: Optional["FindSquareByInvitationTicketResponse"] = Field(alias="0", default=None)
@@ -3243,12 +3604,14 @@ class SquareService_findSquareByInvitationTicket_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_forceEndLiveTalk_args(BaseModel):
     request: Optional["ForceEndLiveTalkRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_forceEndLiveTalk_result(BaseModel):
     success: Optional["ForceEndLiveTalkResponse"] = Field(alias="0", default=None)
@@ -3256,12 +3619,14 @@ class SquareService_forceEndLiveTalk_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getCategories_args(BaseModel):
     request: Optional["GetSquareCategoriesRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getCategories_result(BaseModel):
     success: Optional["GetSquareCategoriesResponse"] = Field(alias="0", default=None)
@@ -3269,12 +3634,14 @@ class SquareService_getCategories_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getGoogleAdOptions_args(BaseModel):
     request: Optional["GetGoogleAdOptionsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getGoogleAdOptions_result(BaseModel):
     success: Optional["GetGoogleAdOptionsResponse"] = Field(alias="0", default=None)
@@ -3282,12 +3649,14 @@ class SquareService_getGoogleAdOptions_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getInvitationTicketUrl_args(BaseModel):
     request: Optional["GetInvitationTicketUrlRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getInvitationTicketUrl_result(BaseModel):
     success: Optional["GetInvitationTicketUrlResponse"] = Field(alias="0", default=None)
@@ -3295,12 +3664,14 @@ class SquareService_getInvitationTicketUrl_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getJoinableSquareChats_args(BaseModel):
     request: Optional["GetJoinableSquareChatsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getJoinableSquareChats_result(BaseModel):
     success: Optional["GetJoinableSquareChatsResponse"] = Field(alias="0", default=None)
@@ -3308,12 +3679,14 @@ class SquareService_getJoinableSquareChats_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getJoinedSquareChats_args(BaseModel):
     request: Optional["GetJoinedSquareChatsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getJoinedSquareChats_result(BaseModel):
     success: Optional["GetJoinedSquareChatsResponse"] = Field(alias="0", default=None)
@@ -3321,12 +3694,14 @@ class SquareService_getJoinedSquareChats_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getJoinedSquares_args(BaseModel):
     request: Optional["GetJoinedSquaresRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getJoinedSquares_result(BaseModel):
     success: Optional["GetJoinedSquaresResponse"] = Field(alias="0", default=None)
@@ -3334,12 +3709,14 @@ class SquareService_getJoinedSquares_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getLiveTalkInfoForNonMember_args(BaseModel):
     request: Optional["GetLiveTalkInfoForNonMemberRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getLiveTalkInfoForNonMember_result(BaseModel):
     success: Optional["GetLiveTalkInfoForNonMemberResponse"] = Field(alias="0", default=None)
@@ -3347,12 +3724,14 @@ class SquareService_getLiveTalkInfoForNonMember_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getLiveTalkInvitationUrl_args(BaseModel):
     request: Optional["GetLiveTalkInvitationUrlRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getLiveTalkInvitationUrl_result(BaseModel):
     success: Optional["GetLiveTalkInvitationUrlResponse"] = Field(alias="0", default=None)
@@ -3360,12 +3739,14 @@ class SquareService_getLiveTalkInvitationUrl_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getLiveTalkSpeakersForNonMember_args(BaseModel):
     request: Optional["GetLiveTalkSpeakersForNonMemberRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getLiveTalkSpeakersForNonMember_result(BaseModel):
     success: Optional["GetLiveTalkSpeakersForNonMemberResponse"] = Field(alias="0", default=None)
@@ -3373,12 +3754,14 @@ class SquareService_getLiveTalkSpeakersForNonMember_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getMessageReactions_args(BaseModel):
     request: Optional["GetMessageReactionsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getMessageReactions_result(BaseModel):
     success: Optional["GetMessageReactionsResponse"] = Field(alias="0", default=None)
@@ -3386,12 +3769,14 @@ class SquareService_getMessageReactions_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getNoteStatus_args(BaseModel):
     request: Optional["GetNoteStatusRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getNoteStatus_result(BaseModel):
     success: Optional["GetNoteStatusResponse"] = Field(alias="0", default=None)
@@ -3399,12 +3784,14 @@ class SquareService_getNoteStatus_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getPopularKeywords_args(BaseModel):
     request: Optional["GetPopularKeywordsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getPopularKeywords_result(BaseModel):
     success: Optional["GetPopularKeywordsResponse"] = Field(alias="0", default=None)
@@ -3412,12 +3799,14 @@ class SquareService_getPopularKeywords_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareAuthorities_args(BaseModel):
     request: Optional["GetSquareAuthoritiesRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareAuthorities_result(BaseModel):
     success: Optional["GetSquareAuthoritiesResponse"] = Field(alias="0", default=None)
@@ -3425,12 +3814,14 @@ class SquareService_getSquareAuthorities_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareAuthority_args(BaseModel):
     request: Optional["GetSquareAuthorityRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareAuthority_result(BaseModel):
     success: Optional["GetSquareAuthorityResponse"] = Field(alias="0", default=None)
@@ -3438,12 +3829,14 @@ class SquareService_getSquareAuthority_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatAnnouncements_args(BaseModel):
     getSquareChatAnnouncementsRequest: Optional["GetSquareChatAnnouncementsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatAnnouncements_result(BaseModel):
     success: Optional["GetSquareChatAnnouncementsResponse"] = Field(alias="0", default=None)
@@ -3451,12 +3844,14 @@ class SquareService_getSquareChatAnnouncements_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatEmid_args(BaseModel):
     request: Optional["GetSquareChatEmidRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatEmid_result(BaseModel):
     success: Optional["GetSquareChatEmidResponse"] = Field(alias="0", default=None)
@@ -3464,12 +3859,14 @@ class SquareService_getSquareChatEmid_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatFeatureSet_args(BaseModel):
     request: Optional["GetSquareChatFeatureSetRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatFeatureSet_result(BaseModel):
     success: Optional["GetSquareChatFeatureSetResponse"] = Field(alias="0", default=None)
@@ -3477,12 +3874,14 @@ class SquareService_getSquareChatFeatureSet_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatMember_args(BaseModel):
     request: Optional["GetSquareChatMemberRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatMember_result(BaseModel):
     success: Optional["GetSquareChatMemberResponse"] = Field(alias="0", default=None)
@@ -3490,12 +3889,14 @@ class SquareService_getSquareChatMember_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatMembers_args(BaseModel):
     request: Optional["GetSquareChatMembersRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatMembers_result(BaseModel):
     success: Optional["GetSquareChatMembersResponse"] = Field(alias="0", default=None)
@@ -3503,12 +3904,14 @@ class SquareService_getSquareChatMembers_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatStatus_args(BaseModel):
     request: Optional["GetSquareChatStatusRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChatStatus_result(BaseModel):
     success: Optional["GetSquareChatStatusResponse"] = Field(alias="0", default=None)
@@ -3516,12 +3919,14 @@ class SquareService_getSquareChatStatus_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChat_args(BaseModel):
     request: Optional["GetSquareChatRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareChat_result(BaseModel):
     success: Optional["GetSquareChatResponse"] = Field(alias="0", default=None)
@@ -3529,12 +3934,14 @@ class SquareService_getSquareChat_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareEmid_args(BaseModel):
     request: Optional["GetSquareEmidRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareEmid_result(BaseModel):
     success: Optional["GetSquareEmidResponse"] = Field(alias="0", default=None)
@@ -3542,12 +3949,14 @@ class SquareService_getSquareEmid_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareFeatureSet_args(BaseModel):
     request: Optional["GetSquareFeatureSetRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareFeatureSet_result(BaseModel):
     success: Optional["GetSquareFeatureSetResponse"] = Field(alias="0", default=None)
@@ -3555,12 +3964,14 @@ class SquareService_getSquareFeatureSet_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareInfoByChatMid_args(BaseModel):
     request: Optional["GetSquareInfoByChatMidRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareInfoByChatMid_result(BaseModel):
     success: Optional["GetSquareInfoByChatMidResponse"] = Field(alias="0", default=None)
@@ -3568,12 +3979,14 @@ class SquareService_getSquareInfoByChatMid_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareMemberRelation_args(BaseModel):
     request: Optional["GetSquareMemberRelationRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareMemberRelation_result(BaseModel):
     success: Optional["GetSquareMemberRelationResponse"] = Field(alias="0", default=None)
@@ -3581,12 +3994,14 @@ class SquareService_getSquareMemberRelation_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareMemberRelations_args(BaseModel):
     request: Optional["GetSquareMemberRelationsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareMemberRelations_result(BaseModel):
     success: Optional["GetSquareMemberRelationsResponse"] = Field(alias="0", default=None)
@@ -3594,12 +4009,14 @@ class SquareService_getSquareMemberRelations_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareMember_args(BaseModel):
     request: Optional["GetSquareMemberRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareMember_result(BaseModel):
     success: Optional["GetSquareMemberResponse"] = Field(alias="0", default=None)
@@ -3607,12 +4024,14 @@ class SquareService_getSquareMember_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareMembersBySquare_args(BaseModel):
     request: Optional["GetSquareMembersBySquareRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareMembersBySquare_result(BaseModel):
     success: Optional["GetSquareMembersBySquareResponse"] = Field(alias="0", default=None)
@@ -3620,12 +4039,14 @@ class SquareService_getSquareMembersBySquare_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareMembers_args(BaseModel):
     request: Optional["GetSquareMembersRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareMembers_result(BaseModel):
     success: Optional["GetSquareMembersResponse"] = Field(alias="0", default=None)
@@ -3633,12 +4054,14 @@ class SquareService_getSquareMembers_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareStatus_args(BaseModel):
     request: Optional["GetSquareStatusRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareStatus_result(BaseModel):
     success: Optional["GetSquareStatusResponse"] = Field(alias="0", default=None)
@@ -3646,12 +4069,14 @@ class SquareService_getSquareStatus_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareThreadMid_args(BaseModel):
     request: Optional["GetSquareThreadMidRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareThreadMid_result(BaseModel):
     success: Optional["GetSquareThreadMidResponse"] = Field(alias="0", default=None)
@@ -3659,12 +4084,14 @@ class SquareService_getSquareThreadMid_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareThread_args(BaseModel):
     request: Optional["GetSquareThreadRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquareThread_result(BaseModel):
     success: Optional["GetSquareThreadResponse"] = Field(alias="0", default=None)
@@ -3672,12 +4099,14 @@ class SquareService_getSquareThread_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquare_args(BaseModel):
     request: Optional["GetSquareRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getSquare_result(BaseModel):
     success: Optional["GetSquareResponse"] = Field(alias="0", default=None)
@@ -3685,12 +4114,14 @@ class SquareService_getSquare_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getUserSettings_args(BaseModel):
     request: Optional["GetUserSettingsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_getUserSettings_result(BaseModel):
     success: Optional["GetUserSettingsResponse"] = Field(alias="0", default=None)
@@ -3698,12 +4129,14 @@ class SquareService_getUserSettings_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_hideSquareMemberContents_args(BaseModel):
     request: Optional["HideSquareMemberContentsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_hideSquareMemberContents_result(BaseModel):
     success: Optional["HideSquareMemberContentsResponse"] = Field(alias="0", default=None)
@@ -3711,12 +4144,14 @@ class SquareService_hideSquareMemberContents_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteIntoSquareChat_args(BaseModel):
     request: Optional["InviteIntoSquareChatRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteIntoSquareChat_result(BaseModel):
     success: Optional["InviteIntoSquareChatResponse"] = Field(alias="0", default=None)
@@ -3724,12 +4159,14 @@ class SquareService_inviteIntoSquareChat_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteToChangeRole_args(BaseModel):
     request: Optional["InviteToChangeRoleRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteToChangeRole_result(BaseModel):
     success: Optional["InviteToChangeRoleResponse"] = Field(alias="0", default=None)
@@ -3737,12 +4174,14 @@ class SquareService_inviteToChangeRole_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteToListen_args(BaseModel):
     request: "InviteToListenRequest" = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteToListen_result(BaseModel):
     success: "InviteToListenResponse" = Field(alias="0", default=None)
@@ -3750,12 +4189,14 @@ class SquareService_inviteToListen_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteToLiveTalk_args(BaseModel):
     request: Optional["InviteToLiveTalkRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteToLiveTalk_result(BaseModel):
     success: Optional["InviteToLiveTalkResponse"] = Field(alias="0", default=None)
@@ -3763,12 +4204,14 @@ class SquareService_inviteToLiveTalk_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteToSpeak_args(BaseModel):
     request: Optional["InviteToSpeakRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteToSpeak_result(BaseModel):
     success: Optional["InviteToSpeakResponse"] = Field(alias="0", default=None)
@@ -3776,12 +4219,14 @@ class SquareService_inviteToSpeak_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteToSquare_args(BaseModel):
     request: Optional["InviteToSquareRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_inviteToSquare_result(BaseModel):
     success: Optional["InviteToSquareResponse"] = Field(alias="0", default=None)
@@ -3789,12 +4234,14 @@ class SquareService_inviteToSquare_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_joinLiveTalk_args(BaseModel):
     request: Optional["JoinLiveTalkRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_joinLiveTalk_result(BaseModel):
     success: Optional["JoinLiveTalkResponse"] = Field(alias="0", default=None)
@@ -3802,12 +4249,14 @@ class SquareService_joinLiveTalk_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_joinSquareChat_args(BaseModel):
     request: Optional["JoinSquareChatRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_joinSquareChat_result(BaseModel):
     success: Optional["JoinSquareChatResponse"] = Field(alias="0", default=None)
@@ -3815,12 +4264,14 @@ class SquareService_joinSquareChat_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_joinSquareThread_args(BaseModel):
     request: Optional["JoinSquareThreadRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_joinSquareThread_result(BaseModel):
     success: Optional["JoinSquareThreadResponse"] = Field(alias="0", default=None)
@@ -3828,12 +4279,14 @@ class SquareService_joinSquareThread_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_joinSquare_args(BaseModel):
     request: Optional["JoinSquareRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_joinSquare_result(BaseModel):
     success: Optional["JoinSquareResponse"] = Field(alias="0", default=None)
@@ -3841,12 +4294,14 @@ class SquareService_joinSquare_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_kickOutLiveTalkParticipants_args(BaseModel):
     request: Optional["KickOutLiveTalkParticipantsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_kickOutLiveTalkParticipants_result(BaseModel):
     success: Optional["KickOutLiveTalkParticipantsResponse"] = Field(alias="0", default=None)
@@ -3854,12 +4309,14 @@ class SquareService_kickOutLiveTalkParticipants_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_leaveSquareChat_args(BaseModel):
     request: Optional["LeaveSquareChatRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_leaveSquareChat_result(BaseModel):
     success: Optional["LeaveSquareChatResponse"] = Field(alias="0", default=None)
@@ -3867,12 +4324,14 @@ class SquareService_leaveSquareChat_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_leaveSquareThread_args(BaseModel):
     request: Optional["LeaveSquareThreadRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_leaveSquareThread_result(BaseModel):
     success: Optional["LeaveSquareThreadResponse"] = Field(alias="0", default=None)
@@ -3880,12 +4339,14 @@ class SquareService_leaveSquareThread_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_leaveSquare_args(BaseModel):
     request: Optional["LeaveSquareRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_leaveSquare_result(BaseModel):
     success: Optional["LeaveSquareResponse"] = Field(alias="0", default=None)
@@ -3893,12 +4354,14 @@ class SquareService_leaveSquare_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_manualRepair_args(BaseModel):
     request: Optional["ManualRepairRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_manualRepair_result(BaseModel):
     success: Optional["ManualRepairResponse"] = Field(alias="0", default=None)
@@ -3906,12 +4369,14 @@ class SquareService_manualRepair_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_markAsRead_args(BaseModel):
     request: Optional["MarkAsReadRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_markAsRead_result(BaseModel):
     success: Optional["MarkAsReadResponse"] = Field(alias="0", default=None)
@@ -3919,12 +4384,14 @@ class SquareService_markAsRead_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_markChatsAsRead_args(BaseModel):
     request: Optional["MarkChatsAsReadRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_markChatsAsRead_result(BaseModel):
     success: Optional["MarkChatsAsReadResponse"] = Field(alias="0", default=None)
@@ -3932,12 +4399,14 @@ class SquareService_markChatsAsRead_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_markThreadsAsRead_args(BaseModel):
     request: Optional["MarkThreadsAsReadRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_markThreadsAsRead_result(BaseModel):
     success: Optional["MarkThreadsAsReadResponse"] = Field(alias="0", default=None)
@@ -3945,12 +4414,14 @@ class SquareService_markThreadsAsRead_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reactToMessage_args(BaseModel):
     request: Optional["ReactToMessageRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reactToMessage_result(BaseModel):
     success: Optional["ReactToMessageResponse"] = Field(alias="0", default=None)
@@ -3958,12 +4429,14 @@ class SquareService_reactToMessage_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_refreshSubscriptions_args(BaseModel):
     request: Optional["RefreshSubscriptionsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_refreshSubscriptions_result(BaseModel):
     success: Optional["RefreshSubscriptionsResponse"] = Field(alias="0", default=None)
@@ -3971,12 +4444,14 @@ class SquareService_refreshSubscriptions_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_rejectSpeakers_args(BaseModel):
     request: Optional["RejectSpeakersRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_rejectSpeakers_result(BaseModel):
     success: Optional["RejectSpeakersResponse"] = Field(alias="0", default=None)
@@ -3984,12 +4459,14 @@ class SquareService_rejectSpeakers_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_rejectSquareMembers_args(BaseModel):
     request: Optional["RejectSquareMembersRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_rejectSquareMembers_result(BaseModel):
     success: Optional["RejectSquareMembersResponse"] = Field(alias="0", default=None)
@@ -3997,12 +4474,14 @@ class SquareService_rejectSquareMembers_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_rejectToSpeak_args(BaseModel):
     request: Optional["RejectToSpeakRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_rejectToSpeak_result(BaseModel):
     success: Optional["RejectToSpeakResponse"] = Field(alias="0", default=None)
@@ -4010,12 +4489,14 @@ class SquareService_rejectToSpeak_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_removeLiveTalkSubscription_args(BaseModel):
     request: Optional["RemoveLiveTalkSubscriptionRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_removeLiveTalkSubscription_result(BaseModel):
     success: Optional["RemoveLiveTalkSubscriptionResponse"] = Field(alias="0", default=None)
@@ -4023,12 +4504,14 @@ class SquareService_removeLiveTalkSubscription_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_removeSubscriptions_args(BaseModel):
     request: Optional["RemoveSubscriptionsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_removeSubscriptions_result(BaseModel):
     success: Optional["RemoveSubscriptionsResponse"] = Field(alias="0", default=None)
@@ -4036,12 +4519,14 @@ class SquareService_removeSubscriptions_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportLiveTalkSpeaker_args(BaseModel):
     request: Optional["ReportLiveTalkSpeakerRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportLiveTalkSpeaker_result(BaseModel):
     success: Optional["ReportLiveTalkSpeakerResponse"] = Field(alias="0", default=None)
@@ -4049,12 +4534,14 @@ class SquareService_reportLiveTalkSpeaker_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportLiveTalk_args(BaseModel):
     request: Optional["ReportLiveTalkRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportLiveTalk_result(BaseModel):
     success: Optional["ReportLiveTalkResponse"] = Field(alias="0", default=None)
@@ -4062,12 +4549,14 @@ class SquareService_reportLiveTalk_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportMessageSummary_args(BaseModel):
     request: Optional["ReportMessageSummaryRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportMessageSummary_result(BaseModel):
     success: Optional["ReportMessageSummaryResponse"] = Field(alias="0", default=None)
@@ -4075,12 +4564,14 @@ class SquareService_reportMessageSummary_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportSquareChat_args(BaseModel):
     request: Optional["ReportSquareChatRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportSquareChat_result(BaseModel):
     success: Optional["ReportSquareChatResponse"] = Field(alias="0", default=None)
@@ -4088,12 +4579,14 @@ class SquareService_reportSquareChat_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportSquareMember_args(BaseModel):
     request: Optional["ReportSquareMemberRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportSquareMember_result(BaseModel):
     success: Optional["ReportSquareMemberResponse"] = Field(alias="0", default=None)
@@ -4101,12 +4594,14 @@ class SquareService_reportSquareMember_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportSquareMessage_args(BaseModel):
     request: Optional["ReportSquareMessageRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportSquareMessage_result(BaseModel):
     success: Optional["ReportSquareMessageResponse"] = Field(alias="0", default=None)
@@ -4114,12 +4609,14 @@ class SquareService_reportSquareMessage_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportSquare_args(BaseModel):
     request: Optional["ReportSquareRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_reportSquare_result(BaseModel):
     success: Optional["ReportSquareResponse"] = Field(alias="0", default=None)
@@ -4127,12 +4624,14 @@ class SquareService_reportSquare_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_requestToListen_args(BaseModel):
     request: "RequestToListenRequest" = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_requestToListen_result(BaseModel):
     success: "RequestToListenResponse" = Field(alias="0", default=None)
@@ -4140,12 +4639,14 @@ class SquareService_requestToListen_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_requestToSpeak_args(BaseModel):
     request: Optional["RequestToSpeakRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_requestToSpeak_result(BaseModel):
     success: Optional["RequestToSpeakResponse"] = Field(alias="0", default=None)
@@ -4153,12 +4654,14 @@ class SquareService_requestToSpeak_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_searchSquareChatMembers_args(BaseModel):
     request: Optional["SearchSquareChatMembersRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_searchSquareChatMembers_result(BaseModel):
     success: Optional["SearchSquareChatMembersResponse"] = Field(alias="0", default=None)
@@ -4166,12 +4669,14 @@ class SquareService_searchSquareChatMembers_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_searchSquareChatMentionables_args(BaseModel):
     request: Optional["SearchSquareChatMentionablesRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_searchSquareChatMentionables_result(BaseModel):
     success: Optional["SearchSquareChatMentionablesResponse"] = Field(alias="0", default=None)
@@ -4179,12 +4684,14 @@ class SquareService_searchSquareChatMentionables_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_searchSquareMembers_args(BaseModel):
     request: Optional["SearchSquareMembersRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_searchSquareMembers_result(BaseModel):
     success: Optional["SearchSquareMembersResponse"] = Field(alias="0", default=None)
@@ -4192,12 +4699,14 @@ class SquareService_searchSquareMembers_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_searchSquares_args(BaseModel):
     request: Optional["SearchSquaresRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_searchSquares_result(BaseModel):
     success: Optional["SearchSquaresResponse"] = Field(alias="0", default=None)
@@ -4205,12 +4714,14 @@ class SquareService_searchSquares_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_sendMessage_args(BaseModel):
     request: Optional["SendMessageRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_sendMessage_result(BaseModel):
     success: Optional["SendMessageResponse"] = Field(alias="0", default=None)
@@ -4218,12 +4729,14 @@ class SquareService_sendMessage_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_sendSquareThreadMessage_args(BaseModel):
     request: Optional["SendSquareThreadMessageRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_sendSquareThreadMessage_result(BaseModel):
     success: Optional["SendSquareThreadMessageResponse"] = Field(alias="0", default=None)
@@ -4231,12 +4744,14 @@ class SquareService_sendSquareThreadMessage_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_syncSquareMembers_args(BaseModel):
     request: Optional["SyncSquareMembersRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_syncSquareMembers_result(BaseModel):
     success: Optional["SyncSquareMembersResponse"] = Field(alias="0", default=None)
@@ -4244,12 +4759,14 @@ class SquareService_syncSquareMembers_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_unhideSquareMemberContents_args(BaseModel):
     request: Optional["UnhideSquareMemberContentsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_unhideSquareMemberContents_result(BaseModel):
     success: Optional["UnhideSquareMemberContentsResponse"] = Field(alias="0", default=None)
@@ -4257,12 +4774,14 @@ class SquareService_unhideSquareMemberContents_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_unsendMessage_args(BaseModel):
     request: Optional["UnsendMessageRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_unsendMessage_result(BaseModel):
     success: Optional["UnsendMessageResponse"] = Field(alias="0", default=None)
@@ -4270,12 +4789,14 @@ class SquareService_unsendMessage_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateLiveTalkAttrs_args(BaseModel):
     request: Optional["UpdateLiveTalkAttrsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateLiveTalkAttrs_result(BaseModel):
     success: Optional["UpdateLiveTalkAttrsResponse"] = Field(alias="0", default=None)
@@ -4283,12 +4804,14 @@ class SquareService_updateLiveTalkAttrs_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareAuthority_args(BaseModel):
     request: Optional["UpdateSquareAuthorityRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareAuthority_result(BaseModel):
     success: Optional["UpdateSquareAuthorityResponse"] = Field(alias="0", default=None)
@@ -4296,12 +4819,14 @@ class SquareService_updateSquareAuthority_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareChatMember_args(BaseModel):
     request: Optional["UpdateSquareChatMemberRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareChatMember_result(BaseModel):
     success: Optional["UpdateSquareChatMemberResponse"] = Field(alias="0", default=None)
@@ -4309,12 +4834,14 @@ class SquareService_updateSquareChatMember_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareChat_args(BaseModel):
     request: Optional["UpdateSquareChatRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareChat_result(BaseModel):
     success: Optional["UpdateSquareChatResponse"] = Field(alias="0", default=None)
@@ -4322,12 +4849,14 @@ class SquareService_updateSquareChat_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareFeatureSet_args(BaseModel):
     request: Optional["UpdateSquareFeatureSetRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareFeatureSet_result(BaseModel):
     success: Optional["UpdateSquareFeatureSetResponse"] = Field(alias="0", default=None)
@@ -4335,12 +4864,14 @@ class SquareService_updateSquareFeatureSet_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareMemberRelation_args(BaseModel):
     request: Optional["UpdateSquareMemberRelationRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareMemberRelation_result(BaseModel):
     success: Optional["UpdateSquareMemberRelationResponse"] = Field(alias="0", default=None)
@@ -4348,12 +4879,14 @@ class SquareService_updateSquareMemberRelation_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareMember_args(BaseModel):
     request: Optional["UpdateSquareMemberRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareMember_result(BaseModel):
     success: Optional["UpdateSquareMemberResponse"] = Field(alias="0", default=None)
@@ -4361,12 +4894,14 @@ class SquareService_updateSquareMember_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareMembers_args(BaseModel):
     request: Optional["UpdateSquareMembersRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquareMembers_result(BaseModel):
     success: Optional["UpdateSquareMembersResponse"] = Field(alias="0", default=None)
@@ -4374,12 +4909,14 @@ class SquareService_updateSquareMembers_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquare_args(BaseModel):
     request: Optional["UpdateSquareRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateSquare_result(BaseModel):
     success: Optional["UpdateSquareResponse"] = Field(alias="0", default=None)
@@ -4387,12 +4924,14 @@ class SquareService_updateSquare_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateUserSettings_args(BaseModel):
     request: Optional["UpdateUserSettingsRequest"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareService_updateUserSettings_result(BaseModel):
     success: Optional["UpdateUserSettingsResponse"] = Field(alias="0", default=None)
@@ -4400,6 +4939,7 @@ class SquareService_updateUserSettings_result(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareState(IntEnum):
     ALIVE = 0
@@ -4414,6 +4954,7 @@ class SquareStatus(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareThread(BaseModel):
     threadMid: Optional[str] = Field(alias="1", default=None)
@@ -4427,6 +4968,7 @@ class SquareThread(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareThreadMember(BaseModel):
     squareMemberMid: Optional[str] = Field(alias="1", default=None)
@@ -4437,6 +4979,7 @@ class SquareThreadMember(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SquareThreadMembershipState(IntEnum):
     JOINED = 1
@@ -4455,6 +4998,7 @@ class SquareUserSettings(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SubscriptionState(BaseModel):
     subscriptionId: int = Field(alias="1", default=0)
@@ -4462,6 +5006,7 @@ class SubscriptionState(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SyncSquareMembersRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -4469,18 +5014,21 @@ class SyncSquareMembersRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class SyncSquareMembersResponse(BaseModel):
     updatedSquareMembers: List["SquareMember"] = Field(alias="1", default_factory=list)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class TermsAgreement(BaseModel):
     aiQnABot: Optional[Any] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class TermsAgreementExtraInfo(BaseModel):
     termsType: Optional[Any] = Field(alias="1", default=None)
@@ -4489,12 +5037,14 @@ class TermsAgreementExtraInfo(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class TextButton(BaseModel):
     text: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class TextMessageAnnouncementContents(BaseModel):
     messageId: Optional[str] = Field(alias="1", default=None)
@@ -4504,24 +5054,28 @@ class TextMessageAnnouncementContents(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class TryAgainLaterExtraInfo(BaseModel):
     blockSecs: int = Field(alias="1", default=0)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UnhideSquareMemberContentsRequest(BaseModel):
     squareMemberMid: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UnhideSquareMemberContentsResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UnsendMessageRequest(BaseModel):
     squareChatMid: Optional[str] = Field(alias="2", default=None)
@@ -4530,12 +5084,14 @@ class UnsendMessageRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UnsendMessageResponse(BaseModel):
     unsentMessage: Optional["SquareMessage"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateLiveTalkAttrsRequest(BaseModel):
     updatedAttrs: List["LiveTalkAttribute"] = Field(alias="1", default_factory=list)
@@ -4543,12 +5099,14 @@ class UpdateLiveTalkAttrsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateLiveTalkAttrsResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareAuthorityRequest(BaseModel):
     updateAttributes: List["SquareAuthorityAttribute"] = Field(alias="2", default_factory=list)
@@ -4556,6 +5114,7 @@ class UpdateSquareAuthorityRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareAuthorityResponse(BaseModel):
     updatdAttributes: List[int] = Field(alias="1", default_factory=list)
@@ -4563,6 +5122,7 @@ class UpdateSquareAuthorityResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareChatMemberRequest(BaseModel):
     updatedAttrs: List["SquareChatMemberAttribute"] = Field(alias="2", default_factory=list)
@@ -4570,12 +5130,14 @@ class UpdateSquareChatMemberRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareChatMemberResponse(BaseModel):
     updatedChatMember: Optional["SquareChatMember"] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareChatRequest(BaseModel):
     updatedAttrs: List["SquareChatAttribute"] = Field(alias="2", default_factory=list)
@@ -4583,6 +5145,7 @@ class UpdateSquareChatRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareChatResponse(BaseModel):
     updatedAttrs: List[int] = Field(alias="1", default_factory=list)
@@ -4590,6 +5153,7 @@ class UpdateSquareChatResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareFeatureSetRequest(BaseModel):
     updateAttributes: List["SquareFeatureSetAttribute"] = Field(alias="2", default_factory=list)
@@ -4597,6 +5161,7 @@ class UpdateSquareFeatureSetRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareFeatureSetResponse(BaseModel):
     updateAttributes: List[int] = Field(alias="1", default_factory=list)
@@ -4604,6 +5169,7 @@ class UpdateSquareFeatureSetResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareMemberRelationRequest(BaseModel):
     squareMid: Optional[str] = Field(alias="2", default=None)
@@ -4613,6 +5179,7 @@ class UpdateSquareMemberRelationRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareMemberRelationResponse(BaseModel):
     squareMid: Optional[str] = Field(alias="1", default=None)
@@ -4622,6 +5189,7 @@ class UpdateSquareMemberRelationResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareMemberRequest(BaseModel):
     updatedAttrs: List["SquareMemberAttribute"] = Field(alias="2", default_factory=list)
@@ -4630,6 +5198,7 @@ class UpdateSquareMemberRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareMemberResponse(BaseModel):
     updatedAttrs: List[int] = Field(alias="1", default_factory=list)
@@ -4638,6 +5207,7 @@ class UpdateSquareMemberResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareMembersRequest(BaseModel):
     updatedAttrs: List["SquareMemberAttribute"] = Field(alias="2", default_factory=list)
@@ -4645,6 +5215,7 @@ class UpdateSquareMembersRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareMembersResponse(BaseModel):
     updatedAttrs: List[int] = Field(alias="1", default_factory=list)
@@ -4653,6 +5224,7 @@ class UpdateSquareMembersResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareRequest(BaseModel):
     updatedAttrs: List["SquareAttribute"] = Field(alias="2", default_factory=list)
@@ -4660,6 +5232,7 @@ class UpdateSquareRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateSquareResponse(BaseModel):
     updatedAttrs: List[int] = Field(alias="1", default_factory=list)
@@ -4667,6 +5240,7 @@ class UpdateSquareResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateUserSettingsRequest(BaseModel):
     updatedAttrs: List[Any] = Field(alias="1", default_factory=list)
@@ -4674,12 +5248,14 @@ class UpdateUserSettingsRequest(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UpdateUserSettingsResponse(BaseModel):
     pass
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UrlButton(BaseModel):
     text: Optional[str] = Field(alias="1", default=None)
@@ -4687,9 +5263,11 @@ class UrlButton(BaseModel):
 
     class Config:
         populate_by_name = True
+        defer_build = True
 
 class UserRestrictionExtraInfo(BaseModel):
     linkUrl: Optional[str] = Field(alias="1", default=None)
 
     class Config:
         populate_by_name = True
+        defer_build = True
@@ -8,10 +8,21 @@ from __future__ import annotations
 
 from typing import List, Optional, Dict, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class UserInfo(BaseModel):
+class _TimelineModel(BaseModel):
+    """
+    Base for timeline models.
+
+    Schemas are built on first use, not at import. Unknown keys in feed
+    payloads are dropped. Models stay mutable; callers edit posts in place.
+    """
+
+    model_config = ConfigDict(defer_build=True, extra="ignore", populate_by_name=True)
+
+
+class UserInfo(_TimelineModel):
     """Post author information."""
 
     mid: str
@@ -21,7 +32,7 @@ class UserInfo(BaseModel):
     writerMid: Optional[str] = None
 
 
-class ReadPermission(BaseModel):
+class ReadPermission(_TimelineModel):
     """Read permission settings."""
 
     type: str = "ALL"
@@ -30,7 +41,7 @@ class ReadPermission(BaseModel):
     homeID: Optional[str] = None
 
 
-class GroupHome(BaseModel):
+class GroupHome(_TimelineModel):
     """Group/Square home info."""
 
     groupId: str
@@ -39,14 +50,14 @@ class GroupHome(BaseModel):
     groupType: Optional[str] = None
 
 
-class UrlInfo(BaseModel):
+class UrlInfo(_TimelineModel):
     """URL info for post."""
 
     type: str = "INTERNAL"
     targetUrl: str = ""
 
 
-class PostInfo(BaseModel):
+class PostInfo(_TimelineModel):
     """Post metadata."""
 
     appSn: int = 0
@@ -79,7 +90,7 @@ class PostInfo(BaseModel):
     updatedTime: int = 0
 
 
-class TextStyle(BaseModel):
+class TextStyle(_TimelineModel):
     """Text styling options."""
 
     textSizeMode: str = "NORMAL"
@@ -87,13 +98,13 @@ class TextStyle(BaseModel):
     textAnimation: str = "NONE"
 
 
-class MediaStyle(BaseModel):
+class MediaStyle(_TimelineModel):
     """Media display options."""
 
     displayType: str = "GRID_1_A"
 
 
-class ContentsStyle(BaseModel):
+class ContentsStyle(_TimelineModel):
     """Content styling container."""
 
     textStyle: Optional[TextStyle] = Field(default_factory=TextStyle)
@@ -101,7 +112,7 @@ class ContentsStyle(BaseModel):
     mediaStyle: Optional[MediaStyle] = Field(default_factory=MediaStyle)
 
 
-class Sticker(BaseModel):
+class Sticker(_TimelineModel):
     """Sticker in post."""
 
     id: str
@@ -112,7 +123,7 @@ class Sticker(BaseModel):
     stickerResourceType: str = "ANIMATION"
 
 
-class Location(BaseModel):
+class Location(_TimelineModel):
     """Location in post."""
 
     latitude: float
@@ -120,7 +131,7 @@ class Location(BaseModel):
     name: str
 
 
-class Media(BaseModel):
+class Media(_TimelineModel):
     """Media item in post."""
 
     objectId: str
@@ -128,7 +139,7 @@ class Media(BaseModel):
     obsFace: str = "[]"
 
 
-class Contents(BaseModel):
+class Contents(_TimelineModel):
     """Post contents."""
 
     contentsStyle: Optional[ContentsStyle] = Field(default_factory=ContentsStyle)
@@ -140,7 +151,7 @@ class Contents(BaseModel):
     sharedPostId: Optional[str] = None
 
 
-class CpInfo(BaseModel):
+class CpInfo(_TimelineModel):
     """Content provider info (line-square, etc.)."""
 
     # line-square specific
@@ -150,7 +161,7 @@ class CpInfo(BaseModel):
     announced: bool = False
 
 
-class Post(BaseModel):
+class Post(_TimelineModel):
     """A timeline/note post."""
 
     userInfo: UserInfo
@@ -160,7 +171,7 @@ class Post(BaseModel):
     statisticInfo: Dict[str, Any] = Field(default_factory=dict)
 
 
-class FeedInfo(BaseModel):
+class FeedInfo(_TimelineModel):
     """Feed entry info."""
 
     type: str
@@ -169,50 +180,50 @@ class FeedInfo(BaseModel):
     score: Optional[int] = None
 
 
-class Feed(BaseModel):
+class Feed(_TimelineModel):
     """A single feed entry containing post."""
 
     feedInfo: FeedInfo
     post: Post
 
 
-class FeedPost(BaseModel):
+class FeedPost(_TimelineModel):
     """Feed container for single post (create/get response)."""
 
     post: Post
 
 
-class ListResult(BaseModel):
+class ListResult(_TimelineModel):
     """Result for list_post."""
 
     feeds: List[Feed] = Field(default_factory=list)
 
 
-class CreateResult(BaseModel):
+class CreateResult(_TimelineModel):
     """Result for create_post."""
 
     feed: FeedPost
 
 
-class GetResult(BaseModel):
+class GetResult(_TimelineModel):
     """Result for get_post."""
 
     feed: FeedPost
 
 
-class DeleteResult(BaseModel):
+class DeleteResult(_TimelineModel):
     """Result for delete_post."""
 
     pass
 
 
-class ShareResult(BaseModel):
+class ShareResult(_TimelineModel):
     """Result for share_post."""
 
     pass
 
 
-class ListPostResponse(BaseModel):
+class ListPostResponse(_TimelineModel):
     """Response from list_post."""
 
     code: int
@@ -220,7 +231,7 @@ class ListPostResponse(BaseModel):
     result: ListResult
 
 
-class CreatePostResponse(BaseModel):
+class CreatePostResponse(_TimelineModel):
     """Response from create_post."""
 
     code: int
@@ -228,7 +239,7 @@ class CreatePostResponse(BaseModel):
     result: CreateResult
 
 
-class GetPostResponse(BaseModel):
+class GetPostResponse(_TimelineModel):
     """Response from get_post."""
 
     code: int
@@ -236,7 +247,7 @@ class GetPostResponse(BaseModel):
     result: GetResult
 
 
-class DeletePostResponse(BaseModel):
+class DeletePostResponse(_TimelineModel):
     """Response from delete_post."""
 
     code: int
@@ -244,7 +255,7 @@ class DeletePostResponse(BaseModel):
     result: Optional[DeleteResult] = None
 
 
-class SharePostResponse(BaseModel):
+class SharePostResponse(_TimelineModel):
     """Response from share_post."""
 
     code: int
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""msgspec mirror of the list_post response models.
+
+Decoding a feed page straight into these structs is several times faster than
+Pydantic validation. Used by `Timeline.list_post(..., fast=True)`; requires
+the optional `msgspec` dependency. Field names and defaults match
+`linepy.models.timeline`, and `ListPostResponseFast.to_pydantic()` converts
+back when the Pydantic model is needed.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+from .timeline import ListPostResponse
+
+
+class UserInfo(msgspec.Struct, kw_only=True):
+    mid: str
+    nickname: str
+    userValid: bool = True
+    role: str = ""
+    writerMid: Optional[str] = None
+
+
+class ReadPermission(msgspec.Struct, kw_only=True):
+    type: str = "ALL"
+    gids: List[str] = msgspec.field(default_factory=list)
+    count: Optional[int] = None
+    homeID: Optional[str] = None
+
+
+class GroupHome(msgspec.Struct, kw_only=True):
+    groupId: str
+    name: str
+    pictureUrl: Optional[str] = None
+    groupType: Optional[str] = None
+
+
+class UrlInfo(msgspec.Struct, kw_only=True):
+    type: str = "INTERNAL"
+    targetUrl: str = ""
+
+
+class PostInfo(msgspec.Struct, kw_only=True):
+    appSn: int = 0
+    homeId: str = ""
+    postId: str
+    status: str = "NORMAL"
+    likeCount: int = 0
+    commentCount: int = 0
+    liked: bool = False
+    url: Optional[UrlInfo] = None
+    readPermission: ReadPermission = msgspec.field(default_factory=ReadPermission)
+    allowShare: bool = True
+    allowLikeShare: bool = False
+    allowComment: bool = True
+    allowPreviewComment: bool = True
+    allowPhotoComment: bool = True
+    allowLike: bool = True
+    allowRecall: bool = True
+    allowFriendRequest: bool = True
+    allowCommentLike: bool = True
+    allowLikeProfiles: bool = True
+    enableCommentApproval: bool = False
+    hasSharedToPost: bool = False
+    commentLinkPermission: str = "ALL"
+    likeLinkPermission: str = "ALL"
+    groupHome: Optional[GroupHome] = None
+    editableContents: List[str] = msgspec.field(default_factory=list)
+    allowEdit: bool = True
+    createdTime: int = 0
+    updatedTime: int = 0
+
+
+class TextStyle(msgspec.Struct, kw_only=True):
+    textSizeMode: str = "NORMAL"
+    backgroundColor: str = "#FFFFFF"
+    textAnimation: str = "NONE"
+
+
+class MediaStyle(msgspec.Struct, kw_only=True):
+    displayType: str = "GRID_1_A"
+
+
+class ContentsStyle(msgspec.Struct, kw_only=True):
+    textStyle: Optional[TextStyle] = msgspec.field(default_factory=TextStyle)
+    stickerStyle: Dict[str, Any] = msgspec.field(default_factory=dict)
+    mediaStyle: Optional[MediaStyle] = msgspec.field(default_factory=MediaStyle)
+
+
+class Sticker(msgspec.Struct, kw_only=True):
+    id: str
+    packageId: str
+    packageVersion: int = 1
+    hasAnimation: bool = True
+    hasSound: bool = True
+    stickerResourceType: str = "ANIMATION"
+
+
+class Location(msgspec.Struct, kw_only=True):
+    latitude: float
+    longitude: float
+    name: str
+
+
+class Media(msgspec.Struct, kw_only=True):
+    objectId: str
+    type: str
+    obsFace: str = "[]"
+
+
+class Contents(msgspec.Struct, kw_only=True):
+    contentsStyle: Optional[ContentsStyle] = msgspec.field(
+        default_factory=ContentsStyle
+    )
+    stickers: List[Sticker] = msgspec.field(default_factory=list)
+    locations: List[Location] = msgspec.field(default_factory=list)
+    media: List[Media] = msgspec.field(default_factory=list)
+    text: Optional[str] = None
+    textMeta: List[Any] = msgspec.field(default_factory=list)
+    sharedPostId: Optional[str] = None
+
+
+class Post(msgspec.Struct, kw_only=True):
+    userInfo: UserInfo
+    postInfo: PostInfo
+    contents: Contents
+    cpInfo: Dict[str, Any] = msgspec.field(default_factory=dict)
+    statisticInfo: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class FeedInfo(msgspec.Struct, kw_only=True):
+    type: str
+    id: str
+    status: str
+    score: Optional[int] = None
+
+
+class Feed(msgspec.Struct, kw_only=True):
+    feedInfo: FeedInfo
+    post: Post
+
+
+class ListResult(msgspec.Struct, kw_only=True):
+    feeds: List[Feed] = msgspec.field(default_factory=list)
+
+
+class ListPostResponseFast(msgspec.Struct, kw_only=True):
+    """Response from list_post, decoded with msgspec."""
+
+    code: int
+    message: str
+    result: ListResult
+
+    def to_pydantic(self) -> ListPostResponse:
+        """Convert to the Pydantic ListPostResponse."""
+        return ListPostResponse.model_validate(msgspec.to_builtins(self))
@@ -6,21 +6,126 @@ Specifically optimized for Square (OpenChat).
 """
 
 import base64
+import functools
 import json
 import os
 import time
-from typing import Optional, Union, Dict, Any
+from contextlib import contextmanager
+from typing import Optional, Union, Dict, Any, Iterator, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class ObsBase:
+    """
+    OBS upload client.
+
+    Uploads go through the client's RequestClient._http, so they share its
+    HTTP/2 keep-alive connection pool with regular API calls.
+    """
+
     OBS_DOMAIN = "obs.line-apps.com"
+    SQUARE_CHAT_UPLOAD_URL = f"https://{OBS_DOMAIN}/r/g2/m/reqseq"
+    UPLOAD_CHUNK_SIZE = 64 * 1024
 
     def __init__(self, client):
         self.client = client
+        self._static_headers: Optional[Dict[str, str]] = None
+        self._static_headers_key: Optional[Tuple[Any, ...]] = None
+        self._param_templates: Dict[str, Dict[str, str]] = {}
+
+    def _base_headers(self) -> Dict[str, str]:
+        """
+        Get a fresh copy of the per-session upload headers.
+
+        The dict is cached and only rebuilt when the auth token or mid
+        changes (e.g. after a token refresh).
+        """
+        key = (self.client.auth_token, self.client.mid)
+        if self._static_headers is None or key != self._static_headers_key:
+            self._static_headers = {
+                "X-Line-Access": self.client.auth_token,
+                "X-Line-Application": self.client.app_name,
+                "X-Line-Mid": self.client.mid,
+                "Content-Type": "application/octet-stream",
+                "User-Agent": self.client.request.user_agent,
+            }
+            self._static_headers_key = key
+        return self._static_headers.copy()
+
+    def _square_chat_params(self, content_type: str) -> Dict[str, str]:
+        """
+        Get a fresh copy of the Square chat upload params for content_type.
+
+        reqseq/tomid/name are placeholders the caller must fill in; keeping
+        them in the template preserves the key order of the encoded JSON.
+        """
+        template = self._param_templates.get(content_type)
+        if template is None:
+            template = {
+                "ver": "2.0",
+                "type": content_type,
+                "oid": "reqseq",
+                "reqseq": "",
+                "tomid": "",
+                "name": "",
+            }
+            # Content Type specific params
+            if content_type in ("image", "gif"):
+                template["cat"] = "original"
+            if content_type in ("video", "audio"):
+                # Fallback duration if not provided
+                template["duration"] = "1000"
+            self._param_templates[content_type] = template
+        return template.copy()
 
-    def _gen_obs_params(self, params: Dict[str, Any]) -> str:
+    @staticmethod
+    def _gen_obs_params(params: Dict[str, Any]) -> str:
         """Generate X-Obs-Params header value (Base64 encoded JSON)"""
-        json_str = json.dumps(params)
-        return base64.b64encode(json_str.encode("utf-8")).decode("utf-8")
+        if ORJSON_AVAILABLE:
+            raw = orjson.dumps(params)
+        else:
+            # orjson writes raw UTF-8; match it so the header does not
+            # depend on whether the fast extra is installed
+            raw = json.dumps(
+                params, separators=(",", ":"), ensure_ascii=False
+            ).encode("utf-8")
+        return base64.b64encode(raw).decode("ascii")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _member_image_obs_params(filename: str) -> str:
+        """X-Obs-Params for a member image upload (depends only on filename)."""
+        return ObsBase._gen_obs_params(
+            {
+                "ver": "2.0",
+                "type": "image",
+                "name": filename,
+                # For profile image, oid/reqseq might not be strictly required in params
+                # if the path itself determines the resource, but let's keep it minimal.
+            }
+        )
+
+    @contextmanager
+    def _open_body(
+        self, path_or_bytes: Union[str, bytes]
+    ) -> Iterator[Tuple[Any, int]]:
+        """
+        Open upload body.
+
+        Files are streamed from disk in UPLOAD_CHUNK_SIZE chunks instead of
+        being read into memory. Yields (content, content_length).
+        """
+        if not isinstance(path_or_bytes, str):
+            yield path_or_bytes, len(path_or_bytes)
+            return
+
+        size = os.path.getsize(path_or_bytes)
+        with open(path_or_bytes, "rb") as f:
+            yield iter(lambda: f.read(self.UPLOAD_CHUNK_SIZE), b""), size
 
     def _get_duration(self, path: str) -> int:
         """
@@ -54,58 +159,37 @@ class ObsBase:
         # 1. Get Reqseq
         reqseq = self.client.token_manager.get_next_reqseq("obs")
 
-        # 2. Read Data
+        # 2. Resolve filename (file data is streamed on send)
         if isinstance(path_or_bytes, str):
             if not filename:
                 filename = os.path.basename(path_or_bytes)
-            with open(path_or_bytes, "rb") as f:
-                data = f.read()
-        else:
-            data = path_or_bytes
-            if not filename:
-                filename = f"file_{int(time.time())}"
+        elif not filename:
+            filename = f"file_{int(time.time())}"
 
         # 3. Prepare Params
-        params = {
-            "ver": "2.0",
-            "type": content_type,
-            "oid": "reqseq",
-            "reqseq": str(reqseq),
-            "tomid": square_chat_mid,
-            "name": filename
-        }
-
-        # Content Type specific params
-        if content_type in ["image", "gif"]:
-            params["cat"] = "original"
-
-        if content_type in ["video", "audio"]:
-            if duration:
-                params["duration"] = str(duration)
-            else:
-                # Fallback duration if not provided
-                params["duration"] = "1000"
+        params = self._square_chat_params(content_type)
+        params["reqseq"] = str(reqseq)
+        params["tomid"] = square_chat_mid
+        params["name"] = filename
+        if duration and content_type in ("video", "audio"):
+            params["duration"] = str(duration)
 
         # 4. Headers
-        headers = {
-            "X-Line-Access": self.client.auth_token,
-            "X-Line-Application": self.client.app_name,
-            "X-Line-Mid": self.client.mid,
-            "Content-Type": "application/octet-stream",
-            "X-Obs-Params": self._gen_obs_params(params),
-            "User-Agent": self.client.request.user_agent
-        }
+        headers = self._base_headers()
+        headers["X-Obs-Params"] = self._gen_obs_params(params)
 
         # 5. Send Request
         # Use underlying httpx client directly to get response headers
-        url = f"https://{self.OBS_DOMAIN}/r/g2/m/reqseq"
+        url = self.SQUARE_CHAT_UPLOAD_URL
 
         try:
-            response = self.client.request._http.post(
-                url,
-                content=data,
-                headers=headers
-            )
+            with self._open_body(path_or_bytes) as (content, size):
+                headers["Content-Length"] = str(size)
+                response = self.client.request._http.post(
+                    url,
+                    content=content,
+                    headers=headers
+                )
             response.raise_for_status()
 
             # 6. Extract Object ID and Hash
@@ -132,45 +216,28 @@ class ObsBase:
         path: /r/g2/member/{member_mid}
         """
 
-        # 1. Read Data
+        # 1. Resolve filename (file data is streamed on send)
         if isinstance(path_or_bytes, str):
             if not filename:
                 filename = os.path.basename(path_or_bytes)
-            with open(path_or_bytes, "rb") as f:
-                data = f.read()
-        else:
-            data = path_or_bytes
-            if not filename:
-                filename = f"image_{int(time.time())}.jpg"
-
-        # 2. Prepare Params
-        params = {
-            "ver": "2.0",
-            "type": "image",
-            "name": filename,
-            # For profile image, oid/reqseq might not be strictly required in params
-            # if the path itself determines the resource, but let's keep it minimal.
-        }
-
-        # 3. Headers
-        headers = {
-            "X-Line-Access": self.client.auth_token,
-            "X-Line-Application": self.client.app_name,
-            "X-Line-Mid": self.client.mid,
-            "Content-Type": "application/octet-stream",
-            "X-Obs-Params": self._gen_obs_params(params),
-            "User-Agent": self.client.request.user_agent
-        }
-
-        # 4. URL
+        elif not filename:
+            filename = f"image_{int(time.time())}.jpg"
+
+        # 2. Headers
+        headers = self._base_headers()
+        headers["X-Obs-Params"] = self._member_image_obs_params(filename)
+
+        # 3. URL
         url = f"https://{self.OBS_DOMAIN}/r/g2/member/{member_mid}"
 
         try:
-            response = self.client.request._http.post(
-                url,
-                content=data,
-                headers=headers
-            )
+            with self._open_body(path_or_bytes) as (content, size):
+                headers["Content-Length"] = str(size)
+                response = self.client.request._http.post(
+                    url,
+                    content=content,
+                    headers=headers
+                )
             response.raise_for_status()
 
             obj_id = response.headers.get("x-obs-oid", "")
@@ -2,40 +2,76 @@
 Polling Manager for LINEPY
 
 High-frequency polling alternative to LEGY Push connection.
-Each chat gets its own worker thread for maximum throughput.
+Chats are polled concurrently on a bounded thread pool
+(or as asyncio tasks, see AsyncPollingManager).
 """
 
+import asyncio
+import inspect
+import random
 import threading
-import queue
 import time
 import logging
-from typing import List, Callable, Optional, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, List, Callable, Optional, Dict, Any, Tuple
 
 logger = logging.getLogger("linepy.polling")
 
+# Pushed onto the event queue by DispatchWorker.stop()
+_SHUTDOWN = object()
 
-class ChatWorker(threading.Thread):
+RATE_LIMIT_BACKOFF = 2.0
+MAX_ERROR_BACKOFF = 30.0
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    error_str = str(error).lower()
+    return "429" in error_str or "too many" in error_str or "rate" in error_str
+
+
+def _error_backoff(err_count: int, rate_limited: bool = False) -> float:
+    """
+    Seconds to sleep after err_count consecutive failures.
+
+    Doubles from 0.1s up to MAX_ERROR_BACKOFF (rate limits start at
+    RATE_LIMIT_BACKOFF), plus up to 10% jitter so chats don't retry in step.
     """
-    Worker thread for a single chat.
-    Continuously fetches events via fetchSquareChatEvents.
+    backoff = min(0.1 * (2 ** min(err_count, 9)), MAX_ERROR_BACKOFF)
+    if rate_limited:
+        backoff = max(backoff, RATE_LIMIT_BACKOFF)
+    return backoff + random.uniform(0, backoff * 0.1)
+
+
+class ChatState:
+    """
+    Polling state for a single chat.
+
+    Holds the sync/continuation tokens and error backoff; fetch_once is run
+    on PollingManager's thread pool, at most one call per chat at a time.
     """
 
     def __init__(
         self,
         client,
         chat_mid: str,
-        event_queue: queue.Queue,
+        event_queue: Deque[Tuple[int, Any]],
+        event_signal: threading.Event,
         token_manager,
         fetch_type: int = 2,
     ):
-        super().__init__(daemon=True)
         self.client = client
         self.chat_mid = chat_mid
         self.event_queue = event_queue
+        self.event_signal = event_signal
         self.token_manager = token_manager
         self.fetch_type = fetch_type
 
-        self._running = False
+        self._log_id = chat_mid[:8]
+        self._err_count = 0
+        # Scheduler bookkeeping (only touched under PollingManager._lock)
+        self.busy = False
+        self.next_fetch = 0.0
 
         # Load sync token from storage
         self.sync_token: Optional[str] = None
@@ -44,48 +80,45 @@ class ChatWorker(threading.Thread):
             self.sync_token = token_manager.get_square_sync_token(chat_mid)
             self.continuation_token = token_manager.get_square_continuation_token(chat_mid)
             if self.sync_token:
-                logger.debug("[%s] Loaded token from storage", chat_mid[:8])
-
-    def run(self):
-        self._running = True
-        logger.info("[%s] ChatWorker started", self.chat_mid[:8])
+                logger.debug("[%s] Loaded token from storage", self._log_id)
 
-        # Initialize token if not loaded
-        if not self.sync_token:
-            self._init_token()
-
-        # Main loop
-        while self._running:
-            try:
-                self._fetch_once()
-            except Exception as e:
-                # Check for rate limit (429)
-                error_str = str(e).lower()
-                if "429" in error_str or "too many" in error_str or "rate" in error_str:
-                    logger.warning("[%s] Rate limited, sleeping 2s", self.chat_mid[:8])
-                    time.sleep(2)
-                else:
-                    # Other errors: brief pause then continue
-                    time.sleep(0.1)
-
-        logger.info("[%s] ChatWorker stopped", self.chat_mid[:8])
-
-    def stop(self):
-        self._running = False
+    def poll(self) -> float:
+        """Fetch once; return the delay before this chat should be polled again."""
+        try:
+            self._fetch_once()
+        except Exception as e:
+            self._err_count += 1
+            rate_limited = _is_rate_limited(e)
+            delay = _error_backoff(self._err_count, rate_limited)
+            if rate_limited:
+                logger.warning("[%s] Rate limited, sleeping %.1fs", self._log_id, delay)
+            else:
+                logger.debug("[%s] Fetch failed (%s), retrying in %.1fs",
+                             self._log_id, e, delay)
+            return delay
+        self._err_count = 0
+        return 0.0
 
     def _init_token(self):
-        """Fetch initial sync token (limit=1 to get latest position)."""
+        """
+        Fetch initial sync token (limit=1 to get latest position).
+
+        Raises on failure (including a response without a token), so poll()
+        backs off instead of retrying immediately.
+        """
         try:
             res = self.client.square.fetchSquareChatEvents(
                 self.chat_mid, limit=1, fetchType=self.fetch_type
             )
-            if hasattr(res, 'syncToken') and res.syncToken:
-                self.sync_token = res.syncToken
-                if self.token_manager:
-                    self.token_manager.set_square_sync_token(self.chat_mid, self.sync_token)
-                logger.debug("[%s] Initialized token", self.chat_mid[:8])
+            if not res.syncToken:
+                raise RuntimeError("initial fetch returned no sync token")
         except Exception as e:
-            logger.warning("[%s] Failed to init token: %s", self.chat_mid[:8], e)
+            logger.warning("[%s] Failed to init token: %s", self._log_id, e)
+            raise
+        self.sync_token = res.syncToken
+        if self.token_manager:
+            self.token_manager.set_square_sync_token(self.chat_mid, self.sync_token)
+        logger.debug("[%s] Initialized token", self._log_id)
 
     def _fetch_once(self):
         """Fetch events once and push to queue."""
@@ -101,114 +134,130 @@ class ChatWorker(threading.Thread):
             fetchType=self.fetch_type,
         )
 
-        # Update sync token
-        if hasattr(res, 'syncToken') and res.syncToken:
-            self.sync_token = res.syncToken
+        # FetchSquareChatEventsResponse always has these fields (None when
+        # unset), so read them directly instead of probing with hasattr
+        sync_token = res.syncToken
+        if sync_token:
+            self.sync_token = sync_token
             if self.token_manager:
-                self.token_manager.set_square_sync_token(self.chat_mid, self.sync_token)
+                self.token_manager.set_square_sync_token(self.chat_mid, sync_token)
 
-        # Update continuation token
-        if hasattr(res, 'continuationToken'):
-            self.continuation_token = res.continuationToken
-            if self.token_manager and res.continuationToken:
-                self.token_manager.set_square_continuation_token(
-                    self.chat_mid, res.continuationToken
-                )
+        continuation_token = res.continuationToken
+        self.continuation_token = continuation_token
+        if self.token_manager and continuation_token:
+            self.token_manager.set_square_continuation_token(
+                self.chat_mid, continuation_token
+            )
 
-        # Push events to queue
-        events = getattr(res, 'events', [])
-        for event in events:
-            # (service_type, event)
-            self.event_queue.put((3, event))  # 3 = Square
+        # Push events to queue as one batch (single wakeup per fetch)
+        events = res.events
+        if events:
+            # (service_type, event), 3 = Square
+            self.event_queue.extend([(3, event) for event in events])
+            self.event_signal.set()
 
 
 class DispatchWorker(threading.Thread):
     """
     Worker thread that dispatches events to the callback.
     Pulls events from the queue and calls on_event.
+
+    The queue is a plain deque (append/popleft are atomic under the GIL);
+    producers set event_signal after appending to wake the dispatcher.
+    The thread sleeps until then, and stop() queues a _SHUTDOWN sentinel.
     """
 
-    def __init__(self, event_queue: queue.Queue, on_event: Callable):
+    def __init__(
+        self,
+        event_queue: Deque[Tuple[int, Any]],
+        event_signal: threading.Event,
+        on_event: Callable,
+    ):
         super().__init__(daemon=True)
         self.event_queue = event_queue
+        self.event_signal = event_signal
         self.on_event = on_event
-        self._running = False
 
     def run(self):
-        self._running = True
         logger.info("DispatchWorker started")
 
-        while self._running:
-            try:
-                service_type, event = self.event_queue.get(timeout=0.1)
-                if self.on_event:
-                    try:
-                        self.on_event(service_type, event)
-                    except Exception as e:
-                        logger.exception("Error in on_event callback: %s", e)
-            except queue.Empty:
+        while True:
+            if not self.event_queue:
+                self.event_signal.wait()
+                # Clear before re-checking the queue so no wakeup is lost
+                self.event_signal.clear()
                 continue
-
-        logger.info("DispatchWorker stopped")
+            # Drain everything queued so far (single consumer, so len() items
+            # are guaranteed to be there)
+            popleft = self.event_queue.popleft
+            batch = [popleft() for _ in range(len(self.event_queue))]
+            for item in batch:
+                if item is _SHUTDOWN:
+                    logger.info("DispatchWorker stopped")
+                    return
+                if not self.on_event:
+                    continue
+                service_type, event = item
+                try:
+                    self.on_event(service_type, event)
+                except Exception as e:
+                    logger.exception("Error in on_event callback: %s", e)
 
     def stop(self):
-        self._running = False
+        self.event_queue.append(_SHUTDOWN)
+        self.event_signal.set()
 
 
 class PollingManager:
     """
     Manages high-frequency polling for Square events.
 
-    Creates one ChatWorker thread per watched chat.
+    Watched chats are polled on a shared thread pool (one in-flight fetch per
+    chat, at most max_workers at once) driven by a single scheduler thread.
     All events are funneled through a single DispatchWorker.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, max_workers: int = 32):
         self.client = client
         self.token_manager = getattr(client, 'token_manager', None)
 
         self.watched_chats: List[str] = []
         self.on_event: Optional[Callable[[int, Any], None]] = None
         self.fetch_type: int = 2
+        # Pool threads are created on demand, so fewer chats use fewer threads
+        self.max_workers = max_workers
 
         self._running = False
-        self._workers: Dict[str, ChatWorker] = {}
+        self._chats: Dict[str, ChatState] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._scheduler: Optional[threading.Thread] = None
         self._dispatcher: Optional[DispatchWorker] = None
-        self._event_queue: queue.Queue = queue.Queue()
+        self._event_queue: Deque[Tuple[int, Any]] = deque()
+        self._event_signal = threading.Event()
 
     def add_watched_chat(self, chat_mid: str):
-        """Add a chat to watch list and start worker if running."""
-        logger.debug("[%s] add_watched_chat called, running=%s, in_workers=%s, in_watched=%s",
-                     chat_mid[:8], self._running, chat_mid in self._workers, chat_mid in self.watched_chats)
+        """Add a chat to watch list and start polling it if running."""
+        logger.debug("[%s] add_watched_chat called, running=%s, in_chats=%s, in_watched=%s",
+                     chat_mid[:8], self._running, chat_mid in self._chats, chat_mid in self.watched_chats)
 
         # Add to watched list if not present
         if chat_mid not in self.watched_chats:
             self.watched_chats.append(chat_mid)
 
-        # If running and worker doesn't exist, create one
-        if self._running and chat_mid not in self._workers:
-            logger.info("[%s] Creating new ChatWorker", chat_mid[:8])
-            worker = ChatWorker(
-                self.client,
-                chat_mid,
-                self._event_queue,
-                self.token_manager,
-                self.fetch_type,
-            )
-            self._workers[chat_mid] = worker
-            worker.start()
-        elif chat_mid in self._workers:
-            logger.debug("[%s] Worker already exists", chat_mid[:8])
+        if self._running:
+            self._add_chat(chat_mid)
+            self._wakeup.set()
 
     def remove_watched_chat(self, chat_mid: str):
         """Remove a chat from watch list."""
         if chat_mid in self.watched_chats:
             self.watched_chats.remove(chat_mid)
 
-        # Stop the worker if running
-        if chat_mid in self._workers:
-            self._workers[chat_mid].stop()
-            del self._workers[chat_mid]
+        # An in-flight fetch finishes, but the chat is not scheduled again
+        with self._lock:
+            self._chats.pop(chat_mid, None)
 
     def start(
         self,
@@ -235,27 +284,28 @@ class PollingManager:
         self.fetch_type = fetch_type
 
         self._running = True
-        self._event_queue = queue.Queue()
+        self._event_queue = deque()
+        self._event_signal = threading.Event()
+        self._wakeup.clear()
 
         # Start dispatcher
-        self._dispatcher = DispatchWorker(self._event_queue, self.on_event)
+        self._dispatcher = DispatchWorker(
+            self._event_queue, self._event_signal, self.on_event
+        )
         self._dispatcher.start()
 
-        # Start chat workers
         for chat_mid in self.watched_chats:
-            worker = ChatWorker(
-                self.client,
-                chat_mid,
-                self._event_queue,
-                self.token_manager,
-                self.fetch_type,
-            )
-            self._workers[chat_mid] = worker
-            worker.start()
+            self._add_chat(chat_mid)
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="linepy-poll"
+        )
+        self._scheduler = threading.Thread(target=self._schedule, daemon=True)
+        self._scheduler.start()
 
         logger.info(
-            "Polling started: %d chat worker(s), 1 dispatcher",
-            len(self._workers)
+            "Polling started: %d chat(s), up to %d worker(s), 1 dispatcher",
+            len(self._chats), self.max_workers
         )
 
     def stop(self):
@@ -264,22 +314,289 @@ class PollingManager:
             return
 
         self._running = False
-
-        # Stop all chat workers
-        for worker in self._workers.values():
-            worker.stop()
+        self._wakeup.set()
 
         # Stop dispatcher
         if self._dispatcher:
             self._dispatcher.stop()
 
-        # Wait for threads to finish
-        for worker in self._workers.values():
-            worker.join(timeout=1.0)
+        # Wait for threads to finish (in-flight fetches are not waited on)
+        if self._scheduler:
+            self._scheduler.join(timeout=1.0)
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
         if self._dispatcher:
             self._dispatcher.join(timeout=1.0)
 
-        self._workers.clear()
+        with self._lock:
+            self._chats.clear()
+        self._pool = None
+        self._scheduler = None
         self._dispatcher = None
 
         logger.info("Polling stopped")
+
+    def _add_chat(self, chat_mid: str):
+        with self._lock:
+            if chat_mid in self._chats:
+                logger.debug("[%s] Chat already polled", chat_mid[:8])
+                return
+            self._chats[chat_mid] = ChatState(
+                self.client,
+                chat_mid,
+                self._event_queue,
+                self._event_signal,
+                self.token_manager,
+                self.fetch_type,
+            )
+
+    def _schedule(self):
+        """Submit a fetch for every idle chat that is due, round-robin."""
+        while self._running:
+            # Clear before scanning so a completion during the scan is not lost
+            self._wakeup.clear()
+            now = time.monotonic()
+            next_due: Optional[float] = None
+            with self._lock:
+                for state in self._chats.values():
+                    if state.busy:
+                        continue
+                    if state.next_fetch <= now:
+                        state.busy = True
+                        try:
+                            self._pool.submit(self._run_chat, state)
+                        except RuntimeError:
+                            # Pool shut down by stop()
+                            return
+                    elif next_due is None or state.next_fetch < next_due:
+                        next_due = state.next_fetch
+            self._wakeup.wait(None if next_due is None else next_due - now)
+
+    def _run_chat(self, state: ChatState):
+        delay = state.poll() if self._running else 0.0
+        with self._lock:
+            state.busy = False
+            state.next_fetch = time.monotonic() + delay
+        self._wakeup.set()
+
+
+class AsyncPollingManager:
+    """
+    asyncio-based alternative to PollingManager.
+
+    Instead of one OS thread per chat, every watched chat is an asyncio task
+    on a single event loop (run in one background thread). Requests go
+    through RequestClient.request_async, so all chats share one HTTP/2
+    connection. Same public interface as PollingManager.
+
+    on_event may be a plain function or a coroutine function; it is called
+    from the event loop thread.
+    """
+
+    def __init__(self, client, max_pending: int = 1000):
+        self.client = client
+        self.token_manager = getattr(client, 'token_manager', None)
+
+        self.watched_chats: List[str] = []
+        self.on_event: Optional[Callable[[int, Any], Any]] = None
+        self.fetch_type: int = 2
+        self.max_pending = max_pending
+
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._start_error: Optional[Exception] = None
+
+    def add_watched_chat(self, chat_mid: str):
+        """Add a chat to watch list and start its task if running."""
+        if chat_mid not in self.watched_chats:
+            self.watched_chats.append(chat_mid)
+        if self._running and self._loop:
+            self._loop.call_soon_threadsafe(self._spawn, chat_mid)
+
+    def remove_watched_chat(self, chat_mid: str):
+        """Remove a chat from watch list."""
+        if chat_mid in self.watched_chats:
+            self.watched_chats.remove(chat_mid)
+        if self._running and self._loop:
+            self._loop.call_soon_threadsafe(self._cancel, chat_mid)
+
+    def start(
+        self,
+        watched_chats: List[str] = None,
+        on_event: Optional[Callable[[int, Any], Any]] = None,
+        fetch_type: int = 2,
+    ):
+        """
+        Start polling.
+
+        Args:
+            watched_chats: List of chat MIDs to watch
+            on_event: Callback function(service_type, event), sync or async
+            fetch_type: 1=Default, 2=PrefetchByServer (recommended)
+        """
+        if self._running:
+            logger.warning("Polling is already running")
+            return
+
+        if watched_chats:
+            self.watched_chats = watched_chats
+        if on_event:
+            self.on_event = on_event
+        self.fetch_type = fetch_type
+
+        self._running = True
+        self._start_error = None
+        started = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(started,), daemon=True)
+        self._thread.start()
+        started.wait()
+
+        if self._start_error is not None:
+            # Setup failed before the loop was ready; surface it here
+            self._thread.join()
+            self._thread = None
+            self._loop = None
+            self._running = False
+            error, self._start_error = self._start_error, None
+            raise error
+
+        logger.info("Async polling started: %d chat task(s)", len(self.watched_chats))
+
+    def stop(self):
+        """Stop polling."""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._loop and self._stop_event:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+        if self._thread:
+            self._thread.join(timeout=5.0)
+        self._thread = None
+
+        logger.info("Polling stopped")
+
+    # ========== Event loop side ==========
+
+    def _run(self, started: threading.Event):
+        try:
+            asyncio.run(self._main(started))
+        except Exception as e:
+            if started.is_set():
+                raise
+            self._start_error = e
+        finally:
+            started.set()
+
+    async def _main(self, started: threading.Event):
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+
+        dispatcher = asyncio.create_task(self._dispatch())
+        for chat_mid in list(self.watched_chats):
+            self._spawn(chat_mid)
+        started.set()
+
+        try:
+            await self._stop_event.wait()
+        finally:
+            tasks = list(self._tasks.values()) + [dispatcher]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._tasks.clear()
+            await self.client.request.aclose()
+            self._loop = None
+
+    def _spawn(self, chat_mid: str):
+        if chat_mid not in self._tasks:
+            self._tasks[chat_mid] = asyncio.create_task(self._watch_chat(chat_mid))
+
+    def _cancel(self, chat_mid: str):
+        task = self._tasks.pop(chat_mid, None)
+        if task:
+            task.cancel()
+
+    async def _watch_chat(self, chat_mid: str):
+        """Poll one chat until cancelled (async counterpart of ChatState)."""
+        square = self.client.square
+        log_id = chat_mid[:8]
+        err_count = 0
+        sync_token: Optional[str] = None
+        continuation_token: Optional[str] = None
+        if self.token_manager:
+            sync_token = self.token_manager.get_square_sync_token(chat_mid)
+            continuation_token = self.token_manager.get_square_continuation_token(chat_mid)
+
+        logger.info("[%s] Chat task started", log_id)
+        while True:
+            try:
+                if not sync_token:
+                    # Fetch initial sync token (limit=1 to get latest position)
+                    res = await square.fetchSquareChatEventsAsync(
+                        chat_mid, limit=1, fetchType=self.fetch_type
+                    )
+                    if not res.syncToken:
+                        # Backed off below like any other failure
+                        raise RuntimeError("initial fetch returned no sync token")
+                    sync_token = res.syncToken
+                    if self.token_manager:
+                        self.token_manager.set_square_sync_token(chat_mid, sync_token)
+                    err_count = 0
+                    continue
+
+                res = await square.fetchSquareChatEventsAsync(
+                    squareChatMid=chat_mid,
+                    syncToken=sync_token,
+                    continuationToken=continuation_token,
+                    limit=50,
+                    fetchType=self.fetch_type,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                err_count += 1
+                rate_limited = _is_rate_limited(e)
+                delay = _error_backoff(err_count, rate_limited)
+                if rate_limited:
+                    logger.warning("[%s] Rate limited, sleeping %.1fs", log_id, delay)
+                else:
+                    logger.debug("[%s] Fetch failed (%s), retrying in %.1fs",
+                                 log_id, e, delay)
+                await asyncio.sleep(delay)
+                continue
+            err_count = 0
+
+            if res.syncToken:
+                sync_token = res.syncToken
+                if self.token_manager:
+                    self.token_manager.set_square_sync_token(chat_mid, sync_token)
+
+            continuation_token = res.continuationToken
+            if self.token_manager and continuation_token:
+                self.token_manager.set_square_continuation_token(
+                    chat_mid, continuation_token
+                )
+
+            # Back-pressure: blocks this chat when the dispatcher falls behind
+            for event in res.events or ():
+                await self._queue.put((3, event))  # 3 = Square
+
+    async def _dispatch(self):
+        while True:
+            service_type, event = await self._queue.get()
+            if not self.on_event:
+                continue
+            try:
+                result = self.on_event(service_type, event)
+                if inspect.isawaitable(result):
+                    await result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception("Error in on_event callback: %s", e)
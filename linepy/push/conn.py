@@ -5,27 +5,39 @@ LEGY Push Connection for LINEPY
 HTTP/2 接続管理（同期版）
 """
 
+import functools
 import logging
+import selectors
 import socket
 import ssl
-import struct
 import time
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 try:
     import h2.connection
     from h2.config import H2Configuration
     from h2.events import DataReceived, StreamEnded, StreamReset, PingAckReceived
+    from h2.settings import Settings, SettingCodes
+    from hyperframe.frame import PingFrame
     H2_AVAILABLE = True
 except ImportError:
     H2_AVAILABLE = False
 
+try:
+    import numba
+    import numpy as np
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from ..request import SOCKET_OPTIONS
 from .data import (
+    _HDR,
+    _PUSH_ACK_IDS,
+    _PUSH_HDR,
     LegyH2PingFrame,
     LegyH2PingFrameType,
     LegyH2PushFrame,
-    LegyH2PushFrameType,
-    LegyH2SignOnResponseFrame,
 )
 
 if TYPE_CHECKING:
@@ -33,6 +45,60 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("linepy.push")
 
+RECV_BUFFER_SIZE = 256 * 1024
+PING_INTERVAL = 30   # seconds between H2 keep-alive PINGs
+IDLE_TIMEOUT = 120   # seconds without any data before reconnecting
+# Timers run on time.monotonic_ns(): integer compares, immune to clock jumps
+PING_INTERVAL_NS = PING_INTERVAL * 1_000_000_000
+IDLE_TIMEOUT_NS = IDLE_TIMEOUT * 1_000_000_000
+SOCKET_RCVBUF = 1 << 20
+# Receive window advertised to the server, so push bursts are not stalled
+# waiting for WINDOW_UPDATEs (the HTTP/2 default is 64 KiB). h2 only emits a
+# WINDOW_UPDATE once half the window is consumed, so a large window also means
+# few of them on the wire. MAX_FRAME_SIZE is
+# left at 16 KiB: h2 only applies a raised limit on the receive_data call
+# after the SETTINGS ACK, so a large frame in the same read would be rejected.
+H2_WINDOW_SIZE = 1 << 24
+
+# LEGY packet layouts live in data.py. Lone big-endian u16 fields are read by
+# indexing the two bytes, which beats both Struct and int.from_bytes on CPython.
+_EMPTY_PAYLOAD = memoryview(b"")
+
+if H2_AVAILABLE:
+    # Keep-alive PING is always the same frame, so it is serialized once and
+    # written straight to the socket instead of going through h2 each time
+    _H2_KEEPALIVE_PING = PingFrame(0, opaque_data=b"KEEP_ALI").serialize()
+
+
+@functools.lru_cache(maxsize=1024)
+def _ping_ack_bytes(ping_id: int) -> bytes:
+    """Complete LEGY ping ACK packet (type 1) for ping_id."""
+    return LegyH2PingFrame(LegyH2PingFrameType.ACK, ping_id).ack_packet()
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _scan_packets(buf, pos):
+        """
+        Walk the complete LEGY packets in buf (a uint8 array) from pos.
+
+        Returns an (n, 3) array of (packet_type, payload_start, payload_end).
+        """
+        end = buf.shape[0]
+        out = np.empty((max((end - pos) // 3, 0), 3), np.int64)
+        n = 0
+        while end - pos >= 3:
+            stop = pos + 3 + (((np.int64(buf[pos]) << 8) | np.int64(buf[pos + 1])) & 0x7FFF)
+            if stop > end:
+                break
+            out[n, 0] = buf[pos + 2]
+            out[n, 1] = pos + 3
+            out[n, 2] = stop
+            n += 1
+            pos = stop
+        return out[:n]
+
 
 class PushConnection:
     """
@@ -41,23 +107,53 @@ class PushConnection:
     サーバーとのHTTP/2接続を管理し、Push通知を受信する。
     """
 
-    def __init__(self, manager: "PushManager"):
+    def __init__(self, manager: "PushManager", recv_buffer_size: int = RECV_BUFFER_SIZE):
         if not H2_AVAILABLE:
             raise ImportError("h2 library required. Install with: pip install h2")
 
         self.manager = manager
+        self._recv_buffer_size = recv_buffer_size
         self.conn: Optional[h2.connection.H2Connection] = None
-        self.writer: Optional[ssl.SSLSocket] = None
+        # Raw TCP socket; TLS runs in memory through _tls and its BIOs
+        self.writer: Optional[socket.socket] = None
+        self._tls: Optional[ssl.SSLObject] = None
+        self._tls_in: Optional[ssl.MemoryBIO] = None
+        self._tls_out: Optional[ssl.MemoryBIO] = None
+        # Bound methods for the per-packet send path, set by _bind_io()
+        self._data_to_send = None
+        self._send_h2 = None
+        self._tls_write = None
+        self._tls_out_read = None
+        self._sock_sendall = None
         self.h2_headers = []
 
         self.is_not_finished = False
-        self.buffer = b""
-        self.not_fin_payloads = {}
-
-        self._last_send_time = 0.0
-        self._last_ping_send_time = 0.0
+        # Receive buffer; bytes before _buf_pos are already parsed
+        self.buffer = bytearray()
+        self._buf_pos = 0
+        self.not_fin_payloads: Dict[int, bytearray] = {}
+        # Push ACK packet with service type/push id patched in per ACK.
+        # h2 serializes send_data() input immediately, so reusing it is safe.
+        self._push_ack_tmpl = bytearray(
+            LegyH2PushFrame(service_type=0, push_id=0).ack_packet()
+        )
+
+        self._last_send_ns = 0
+        self._last_ping_ns = 0
+        self._last_recv_ns = 0
         self._awaiting_pong = False
         self._closed = False
+        # Debug logging on/off, sampled at connect(); guards hot-path logs
+        self._debug = False
+        self._wakeup_w: Optional[socket.socket] = None
+
+        # read_loop dispatch for the non-DATA events; a handler returning
+        # True ends the response stream
+        self._event_handlers = {
+            StreamEnded: self._on_stream_ended,
+            StreamReset: self._on_stream_reset,
+            PingAckReceived: self._on_pong,
+        }
 
     @property
     def client(self):
@@ -73,17 +169,31 @@ class PushConnection:
             path: Request path (e.g., /PUSH/1/subs?m=...)
             headers: HTTP headers to send
         """
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+
         ctx = ssl.create_default_context()
         ctx.set_alpn_protocols(["h2"])
 
         sock = socket.create_connection((host, port))
-        self.writer = ctx.wrap_socket(sock, server_hostname=host)
+        for level, option, value in SOCKET_OPTIONS:
+            sock.setsockopt(level, option, value)
+        # Kernel buffer sized to match the larger recv() reads
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
+        except OSError as e:
+            logger.debug("Could not set SO_RCVBUF: %s", e)
 
         # タイムアウトを設定（ブロッキング回避）
-        self.writer.settimeout(5.0)
+        sock.settimeout(5.0)
+        self.writer = sock
 
-        config = H2Configuration(client_side=True)
-        self.conn = h2.connection.H2Connection(config=config)
+        # TLS is driven through memory BIOs: raw reads land in _tls_in and
+        # are decrypted in one pass per read, so a partial record never
+        # blocks inside recv()
+        self._tls_in = ssl.MemoryBIO()
+        self._tls_out = ssl.MemoryBIO()
+        self._tls = ctx.wrap_bio(self._tls_in, self._tls_out, server_hostname=host)
+        self._do_handshake()
 
         self.h2_headers = [
             (":method", "POST"),
@@ -94,118 +204,203 @@ class PushConnection:
         for key, value in headers.items():
             self.h2_headers.append((key.lower(), value))
 
-        self.conn.initiate_connection()
+        self.conn = self._new_h2_connection()
+        self._bind_io()
         self.conn.send_headers(1, self.h2_headers)
         self.send_data_to_socket()
 
-        logger.debug("Connected to %s:%d%s", host, port, path)
+        if self._debug:
+            logger.debug("Connected to %s:%d%s", host, port, path)
+
+    @staticmethod
+    def _new_h2_connection() -> "h2.connection.H2Connection":
+        """Create an initiated client H2Connection with a large receive window."""
+        conn = h2.connection.H2Connection(config=H2Configuration(client_side=True))
+        conn.local_settings = Settings(
+            client=True,
+            initial_values={SettingCodes.INITIAL_WINDOW_SIZE: H2_WINDOW_SIZE},
+        )
+        conn.initiate_connection()
+        # The connection-level window is not covered by SETTINGS
+        increment = H2_WINDOW_SIZE - conn.inbound_flow_control_window
+        if increment > 0:
+            conn.increment_flow_control_window(increment)
+        return conn
+
+    def _do_handshake(self):
+        """Complete the TLS handshake over the raw socket."""
+        while True:
+            try:
+                self._tls.do_handshake()
+                break
+            except ssl.SSLWantReadError:
+                self._flush_tls()
+                data = self.writer.recv(self._recv_buffer_size)
+                if not data:
+                    raise ConnectionError("Connection closed during TLS handshake")
+                self._tls_in.write(data)
+        self._flush_tls()
+
+    def _flush_tls(self):
+        """Send whatever TLS records are waiting in the outgoing BIO."""
+        out = self._tls_out.read()
+        if out:
+            self._last_send_ns = time.monotonic_ns()
+            self.writer.sendall(out)
+
+    def _read_tls(self) -> Tuple[bytes, bool]:
+        """
+        Decrypt everything buffered in the incoming BIO.
+
+        Returns (data, eof); eof is True once the server sent close_notify.
+        """
+        chunks = []
+        eof = False
+        while True:
+            try:
+                chunk = self._tls.read(self._recv_buffer_size)
+            except ssl.SSLWantReadError:
+                break  # Rest of the record has not arrived yet
+            except ssl.SSLZeroReturnError:
+                eof = True
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks), eof
+
+    def _bind_io(self):
+        """Cache the bound methods used on every send once connected."""
+        self._data_to_send = self.conn.data_to_send
+        self._send_h2 = self.conn.send_data
+        self._tls_write = self._tls.write
+        self._tls_out_read = self._tls_out.read
+        self._sock_sendall = self.writer.sendall
 
     def send_data_to_socket(self):
         """Send pending data to server."""
-        if self.conn and self.writer:
-            send_data = self.conn.data_to_send()
-            if send_data:
-                self._last_send_time = time.time()
-                self.writer.sendall(send_data)
-        else:
+        data_to_send = self._data_to_send
+        if data_to_send is None:
             raise RuntimeError("Connection not established")
+        send_data = data_to_send()
+        if send_data:
+            self._tls_write(send_data)
+        # Also flushes TLS-level records (e.g. post-handshake messages)
+        out = self._tls_out_read()
+        if out:
+            self._last_send_ns = time.monotonic_ns()
+            self._sock_sendall(out)
 
     def write_bytes(self, data: bytes, flush: bool = False):
         """Write raw bytes to stream."""
-        if self.conn:
-            self.conn.send_data(stream_id=1, data=data, end_stream=False)
-            if flush:
-                self.send_data_to_socket()
-        else:
+        send_h2 = self._send_h2
+        if send_h2 is None:
             raise RuntimeError("Connection not established")
+        send_h2(1, data, False)  # stream 1, end_stream=False
+        if flush:
+            self.send_data_to_socket()
+
+    def write_request(self, packet_type: int, payload: bytes, flush: bool = False):
+        """
+        Write a packet to the stream.
 
-    def write_request(self, packet_type: int, payload: bytes, flush: bool = True):
-        """Write a packet to the stream."""
+        Not sent until send_data_to_socket() (or flush=True); read_loop
+        flushes once per batch of received events.
+        """
         data = self.build_packet(packet_type, payload)
         self.write_bytes(data, flush=flush)
 
-    def write_ping(self, ping_id: int):
-        """Send a Ping response (Packet Type 1)."""
-        # Type 1, Payload: 0x01 + 2-byte ID
-        payload = bytes([1]) + struct.pack("!H", ping_id)
-        self.write_request(1, payload, flush=True)
+    def write_ping(self, ping_id: int, flush: bool = False):
+        """Queue a Ping response (Packet Type 1)."""
+        # Type 1, Payload: 0x01 + 2-byte ID; ping ids cycle, so cached
+        self.write_bytes(_ping_ack_bytes(ping_id), flush=flush)
 
     def build_packet(self, packet_type: int, payload: bytes) -> bytes:
         """Build LEGY packet with header."""
-        size = len(payload)
-        header = struct.pack("!HB", size & 32767, packet_type)
-        return header + payload
+        # pack + concatenate measured faster than pack_into a preallocated
+        # bytearray (which needs an extra bytes() copy)
+        return _HDR.pack(len(payload) & 0x7FFF, packet_type) + payload
 
     def send_h2_ping(self):
         """Send HTTP/2 PING frame for keep-alive."""
-        if self.conn:
-            self.conn.ping(b'KEEP_ALI')
-            self.send_data_to_socket()
-            self._last_ping_send_time = time.time()
-            logger.debug("Sent H2 PING")
+        if self.conn and self.writer:
+            # Flush anything h2 has queued, then the pre-serialized PING
+            self._tls.write(self.conn.data_to_send() + _H2_KEEPALIVE_PING)
+            self._flush_tls()
+            self._last_ping_ns = self._last_send_ns
+            if self._debug:
+                logger.debug("Sent H2 PING")
 
     def read_loop(self):
         """
         Read loop for handling incoming data.
         Blocks until connection is closed.
-        """
-        self._last_receive_time = time.time()
 
+        Waits on a selector with a deadline taken from the keep-alive and
+        idle timers, rather than waking every few seconds on socket.timeout.
+        """
+        now = time.monotonic_ns()
+        self._last_recv_ns = now
+        # First keep-alive PING goes out immediately; sends before the loop
+        # (handshake, request headers) do not count as piggyback traffic
+        self._last_ping_ns = now - PING_INTERVAL_NS
+        self._last_send_ns = 0
+
+        selector = selectors.DefaultSelector()
+        selector.register(self.writer, selectors.EVENT_READ)
+        # close() writes to this pair so select() returns right away
+        wakeup_r, self._wakeup_w = socket.socketpair()
+        selector.register(wakeup_r, selectors.EVENT_READ)
         try:
             response_stream_ended = False
             while not response_stream_ended and not self._closed:
+                if not self._check_timers(time.monotonic_ns()):
+                    break
+
+                ready = selector.select(self._next_timer_delay(time.monotonic_ns()))
+                if not any(key.fileobj is self.writer for key, _ in ready):
+                    continue
+
                 try:
-                    # Read raw data from socket
-                    data = self.writer.recv(65536)
-                    self._last_receive_time = time.time()
-                except socket.timeout:
-                    # タイムアウト（正常なアイドル状態含む）
-                    now = time.time()
-
-                    # Keep-Alive Ping (every 30s)
-                    if now - self._last_ping_send_time > 30:
-                        if self._awaiting_pong:
-                            # 前回のPingに対する応答がない -> 切断
-                            logger.warning("Ping timeout (no PONG received). Reconnecting...")
-                            break
-
-                        try:
-                            self.send_h2_ping()
-                            self._awaiting_pong = True
-                        except Exception as e:
-                            logger.warning("Failed to send keep-alive ping: %s", e)
-                            break
-
-                    # 最後の受信から一定時間以上経過していたら切断とみなす
-                    idle_time = now - self._last_receive_time
-                    if idle_time > 120:  # 2分間パケットなし
-                         logger.warning("Connection timed out (idle for %.1fs)", idle_time)
-                         break
+                    # Read raw (still encrypted) data from socket
+                    raw = self.writer.recv(self._recv_buffer_size)
+                except (socket.timeout, BlockingIOError):
                     continue
+                self._last_recv_ns = time.monotonic_ns()
 
-                if not data:
+                if not raw:
                     logger.debug("Socket closed by server")
                     break
 
-                # Process H2 events
-                events = self.conn.receive_data(data)
-                for event in events:
-                    if isinstance(event, DataReceived):
-                        self.conn.acknowledge_received_data(
-                            event.flow_controlled_length, event.stream_id
-                        )
+                self._tls_in.write(raw)
+                data, tls_eof = self._read_tls()
+                if tls_eof:
+                    logger.debug("TLS session closed by server")
+                    response_stream_ended = True
+                if not data:
+                    # Only part of a TLS record so far
+                    continue
+
+                # Process H2 events. DATA only ever arrives on stream 1, so
+                # flow-control credit is returned once per read rather than
+                # once per frame.
+                acked = 0
+                handlers = self._event_handlers
+                for event in self.conn.receive_data(data):
+                    event_type = type(event)
+                    # DATA is by far the most frequent event; keep it inline
+                    if event_type is DataReceived:
+                        acked += event.flow_controlled_length
                         if event.data:
                             self._on_data_received(event.data)
-                    elif isinstance(event, StreamEnded):
+                        continue
+                    handler = handlers.get(event_type)
+                    if handler is not None and handler(event):
                         response_stream_ended = True
                         break
-                    elif isinstance(event, StreamReset):
-                        logger.warning("Stream reset by server: %s", event.error_code)
-                        raise RuntimeError(f"Stream reset: {event.error_code}")
-                    elif isinstance(event, PingAckReceived):
-                        self._awaiting_pong = False
-                        logger.debug("Received H2 PONG")
 
+                if acked:
+                    self.conn.acknowledge_received_data(acked, 1)
                 self.send_data_to_socket()
 
             self.conn.close_connection()
@@ -214,82 +409,183 @@ class PushConnection:
             if not self._closed:
                 logger.warning("Connection error: %s", e)
         finally:
+            selector.close()
+            wakeup_r.close()
+            wakeup_w, self._wakeup_w = self._wakeup_w, None
+            wakeup_w.close()
             self.close()
 
+    def _on_stream_ended(self, event: "StreamEnded") -> bool:
+        return True
+
+    def _on_stream_reset(self, event: "StreamReset") -> bool:
+        logger.warning("Stream reset by server: %s", event.error_code)
+        raise RuntimeError(f"Stream reset: {event.error_code}")
+
+    def _on_pong(self, event: "PingAckReceived") -> bool:
+        self._awaiting_pong = False
+        if self._debug:
+            logger.debug("Received H2 PONG")
+        return False
+
+    def _ping_base_ns(self) -> int:
+        """
+        Start of the current keep-alive interval.
+
+        Traffic in both directions since the last PING already shows the
+        peer is alive, so the PING is pushed back behind it (piggybacked).
+        """
+        return max(self._last_ping_ns, min(self._last_send_ns, self._last_recv_ns))
+
+    def _next_timer_delay(self, now: int) -> float:
+        """Seconds until the next keep-alive ping or idle timeout is due."""
+        ping_due = self._ping_base_ns() + PING_INTERVAL_NS
+        idle_due = self._last_recv_ns + IDLE_TIMEOUT_NS
+        return max(0, min(ping_due, idle_due) - now) / 1e9
+
+    def _check_timers(self, now: int) -> bool:
+        """Run keep-alive/idle checks; returns False when the connection is dead."""
+        # Keep-Alive Ping (after 30s without PING or two-way traffic)
+        if now - self._ping_base_ns() >= PING_INTERVAL_NS:
+            if self._awaiting_pong:
+                # 前回のPingに対する応答がない -> 切断
+                logger.warning("Ping timeout (no PONG received). Reconnecting...")
+                return False
+
+            try:
+                self.send_h2_ping()
+                self._awaiting_pong = True
+            except Exception as e:
+                logger.warning("Failed to send keep-alive ping: %s", e)
+                return False
+
+        # 最後の受信から一定時間以上経過していたら切断とみなす
+        idle_ns = now - self._last_recv_ns
+        if idle_ns >= IDLE_TIMEOUT_NS:  # 2分間パケットなし
+            logger.warning("Connection timed out (idle for %.1fs)", idle_ns / 1e9)
+            return False
+        return True
+
     def _on_data_received(self, data: bytes):
         """Handle incoming H2 data stream."""
-        self.buffer += data
+        buf = self.buffer
+        buf.extend(data)
+        end = len(buf)
+
+        with memoryview(buf) as mv:
+            if NUMBA_AVAILABLE:
+                for packet_type, start, stop in self._scan(mv):
+                    self._buf_pos = stop
+                    self._on_packet_received(packet_type, mv[start:stop])
+
+            while end - self._buf_pos >= 3:
+                # Parse Header: 2 bytes size, 1 byte type
+                size_h, packet_type = _HDR.unpack_from(mv, self._buf_pos)
+                start = self._buf_pos + 3
+                if not size_h:
+                    # Type-only packet: nothing to slice
+                    self._buf_pos = start
+                    self._on_packet_received(packet_type, _EMPTY_PAYLOAD)
+                    continue
 
-        while len(self.buffer) >= 3:
-            # Parse Header: 2 bytes size, 1 byte type
-            size_h, packet_type = struct.unpack("!HB", self.buffer[:3])
-            size = size_h & 32767
+                # Bit 15 is not part of the size
+                size = size_h & 0x7FFF
+                if end < start + size:
+                    break  # Wait for more data
 
-            if len(self.buffer) < 3 + size:
-                break  # Wait for more data
+                self._buf_pos = start + size
 
-            payload = self.buffer[3 : 3 + size]
-            self.buffer = self.buffer[3 + size :]
+                # Zero-copy view; not bound to a local so no export of the
+                # buffer outlives this call (it must be resizable afterwards)
+                self._on_packet_received(packet_type, mv[start : start + size])
 
-            self._on_packet_received(packet_type, payload)
+        # Drop parsed bytes once they dominate the buffer, instead of
+        # reslicing after every packet
+        if self._buf_pos >= end:
+            buf.clear()
+            self._buf_pos = 0
+        elif self._buf_pos > 65536 or self._buf_pos >= end // 2:
+            del buf[: self._buf_pos]
+            self._buf_pos = 0
 
-    def _on_packet_received(self, packet_type: int, payload: bytes):
-        """Handle a complete packet."""
+    def _scan(self, mv: memoryview) -> list:
+        """Locate complete packets with the JIT-compiled header walk."""
+        # The numpy view is dropped on return so the buffer stays resizable
+        return _scan_packets(np.frombuffer(mv, dtype=np.uint8), self._buf_pos).tolist()
+
+    def _on_packet_received(self, packet_type: int, payload: memoryview):
+        """
+        Handle a complete packet.
+
+        payload is a view into the receive buffer; anything handed to the
+        manager must be copied out with bytes() first.
+        """
 
         if packet_type == 1:  # Ping
             # Payload: [1-byte type, 2-byte id]
+            if not payload:
+                return
             ping_type = payload[0]
             if len(payload) >= 3:
-                ping_id, = struct.unpack("!H", payload[1:3])
+                ping_id = (payload[1] << 8) | payload[2]
             else:
                 ping_id = 0
 
             if ping_type == 2:  # Server Ping
-                packet = LegyH2PingFrame(1, ping_id)  # Type 1 is ACK
-                self.write_bytes(packet.ack_packet())
+                self.write_ping(ping_id)  # Type 1 is ACK
                 self.manager.on_ping(ping_id)
             # else: PONG - no action needed
 
         elif packet_type == 2:  # Sign-on Request (Echo back)
-            logger.debug("Sign-on request echo received")
+            if self._debug:
+                logger.debug("Sign-on request echo received")
 
         elif packet_type == 3:  # Sign-on response
             if len(payload) < 2:
                 return
-            req, = struct.unpack("!H", payload[0:2])
-            request_id = req & 32767
-            is_fin = (req & 32768) != 0
+            req = (payload[0] << 8) | payload[1]
+            request_id = req & 0x7FFF
+            is_fin = (req & 0x8000) != 0
             response_payload = payload[2:]
 
             if is_fin:
-                if request_id in self.not_fin_payloads:
-                    response_payload = self.not_fin_payloads[request_id] + response_payload
-                    del self.not_fin_payloads[request_id]
-                self.manager.on_sign_on_response(request_id, is_fin, response_payload)
+                pending = self.not_fin_payloads.pop(request_id, None)
+                if pending is not None:
+                    pending += response_payload
+                    response_payload = pending
+                self.manager.on_sign_on_response(request_id, is_fin, bytes(response_payload))
             else:
-                if request_id not in self.not_fin_payloads:
-                    self.not_fin_payloads[request_id] = b""
-                self.not_fin_payloads[request_id] += response_payload
+                # Chunks are accumulated in place (amortized O(n))
+                self.not_fin_payloads.setdefault(request_id, bytearray()).extend(
+                    response_payload
+                )
 
         elif packet_type == 4:  # Push
             if len(payload) < 6:
                 return
-            push_type = payload[0]
-            service_type = payload[1]
-            push_id, = struct.unpack("!i", payload[2:6])
-            push_payload = payload[6:]
-
-            packet = LegyH2PushFrame(push_type, service_type, push_id, push_payload)
+            push_type, service_type, push_id = _PUSH_HDR.unpack_from(payload)
 
-            if packet.push_type in [LegyH2PushFrameType.NONE, LegyH2PushFrameType.ACK_REQUIRED]:
-                if packet.push_type == LegyH2PushFrameType.ACK_REQUIRED:
-                    self.write_bytes(packet.ack_packet())
+            # Compared as plain ints; the frame object is only built for the
+            # manager, and the ACK is patched into a reusable template
+            if push_type == 2 or push_type == 0:  # ACK_REQUIRED / NONE
+                if push_type == 2:
+                    _PUSH_ACK_IDS.pack_into(self._push_ack_tmpl, 4, service_type, push_id)
+                    self.write_bytes(self._push_ack_tmpl)
 
-                self.manager.on_push(packet)
+                self.manager.on_push(
+                    LegyH2PushFrame(push_type, service_type, push_id, bytes(payload[6:]))
+                )
 
     def close(self):
         """Close the connection."""
         self._closed = True
+        wakeup_w = self._wakeup_w
+        if wakeup_w is not None:
+            # Wake a read_loop blocked in select() on another thread
+            try:
+                wakeup_w.send(b"\0")
+            except OSError:
+                pass
         if self.conn and self.writer:
             self.conn.close_connection()
             self.send_data_to_socket()
@@ -6,9 +6,17 @@ HTTP/2 Push フレームのデータ構造定義
 """
 
 import struct
+from dataclasses import dataclass
 from enum import IntEnum
 from typing import Optional, Union
 
+# Pre-compiled LEGY packet layouts (shared with conn.py)
+_HDR = struct.Struct("!HB")         # payload size, packet type
+_PING_PACKET = struct.Struct("!HBBH")  # header + ping type, ping id
+_PUSH_HDR = struct.Struct("!BBi")   # push type, service type, push id
+_PUSH_ACK_PACKET = struct.Struct("!HBBBi")  # header + push type, service type, push id
+_PUSH_ACK_IDS = struct.Struct("!Bi")  # service type, push id (offset 4 of the ACK)
+
 
 class LegyH2PingFrameType(IntEnum):
     NONE = 0
@@ -25,16 +33,21 @@ class LegyH2PushFrameType(IntEnum):
 class LegyH2Frame:
     """Base class for LEGY H2 frames."""
 
+    # Frames are created per received packet; slots avoid a dict per instance
+    __slots__ = ("frame_type",)
+
     def __init__(self, frame_type: int):
         self.frame_type = frame_type
 
     def request_packet(self, payload: bytes) -> bytes:
-        return struct.pack("!H", len(payload)) + bytes([self.frame_type]) + payload
+        return _HDR.pack(len(payload), self.frame_type) + payload
 
 
 class LegyH2StatusFrame(LegyH2Frame):
     """Status frame (type 0)."""
 
+    __slots__ = ("is_foreground", "server_ping_interval")
+
     def __init__(
         self,
         is_foreground: Optional[bool] = None,
@@ -48,24 +61,35 @@ class LegyH2StatusFrame(LegyH2Frame):
 class LegyH2PingFrame(LegyH2Frame):
     """Ping frame (type 1)."""
 
+    __slots__ = ("ping_type", "ping_id")
+
     def __init__(
         self,
         ping_type: Optional[Union[LegyH2PingFrameType, int]] = None,
         ping_id: Optional[int] = None,
     ):
         super().__init__(1)
-        self.ping_type = LegyH2PingFrameType(ping_type) if ping_type else LegyH2PingFrameType.NONE
+        # Kept as a plain int: IntEnum construction is slow on the receive path
+        self.ping_type = int(ping_type) if ping_type else 0
         self.ping_id = ping_id
 
+    @property
+    def ping_type_enum(self) -> LegyH2PingFrameType:
+        return LegyH2PingFrameType(self.ping_type)
+
     def ack_packet(self) -> bytes:
-        return self.request_packet(
-            bytes([self.ping_type.value]) + struct.pack("!H", self.ping_id or 0)
+        # Header and body in a single pack (one allocation)
+        return _PING_PACKET.pack(
+            _PING_PACKET.size - _HDR.size, self.frame_type,
+            self.ping_type, self.ping_id or 0,
         )
 
 
 class LegyH2SignOnRequestFrame(LegyH2Frame):
     """Sign-on request frame (type 2)."""
 
+    __slots__ = ("request_id", "service_type", "request_payload")
+
     def __init__(
         self,
         request_id: Optional[int] = None,
@@ -81,6 +105,8 @@ class LegyH2SignOnRequestFrame(LegyH2Frame):
 class LegyH2SignOnResponseFrame(LegyH2Frame):
     """Sign-on response frame (type 3)."""
 
+    __slots__ = ("request_id", "is_fin", "response_payload")
+
     def __init__(
         self,
         request_id: Optional[int] = None,
@@ -96,6 +122,8 @@ class LegyH2SignOnResponseFrame(LegyH2Frame):
 class LegyH2PushFrame(LegyH2Frame):
     """Push frame (type 4)."""
 
+    __slots__ = ("push_type", "service_type", "push_id", "push_payload")
+
     def __init__(
         self,
         push_type: Optional[Union[LegyH2PushFrameType, int]] = None,
@@ -104,20 +132,42 @@ class LegyH2PushFrame(LegyH2Frame):
         push_payload: Optional[bytes] = None,
     ):
         super().__init__(4)
-        self.push_type = LegyH2PushFrameType(push_type) if push_type else LegyH2PushFrameType.NONE
+        # Kept as a plain int: IntEnum construction is slow on the receive path
+        self.push_type = int(push_type) if push_type else 0
         self.service_type = service_type
         self.push_id = push_id
         self.push_payload = push_payload
 
+    @property
+    def push_type_enum(self) -> LegyH2PushFrameType:
+        return LegyH2PushFrameType(self.push_type)
+
     def ack_packet(self) -> bytes:
         if self.service_type is not None and self.push_id is not None:
-            return self.request_packet(
-                bytes([LegyH2PushFrameType.ACK.value, self.service_type])
-                + struct.pack("!i", self.push_id)
+            return _PUSH_ACK_PACKET.pack(
+                _PUSH_ACK_PACKET.size - _HDR.size, self.frame_type,
+                LegyH2PushFrameType.ACK, self.service_type, self.push_id,
             )
         raise ValueError("service_type and push_id required for ack")
 
 
+@dataclass(slots=True)
+class SignOnRequest:
+    """A sign-on request awaiting its response, keyed by request id."""
+
+    service_type: int
+    method_name: str
+    result: Optional[bytes] = None
+
+
+@dataclass(slots=True)
+class WatchedChat:
+    """Fetch position of one watched square chat."""
+
+    sync_token: Optional[str] = None
+    continuation_token: Optional[str] = None
+
+
 # Service Types
 class ServiceType(IntEnum):
     STATUS = 0
@@ -5,23 +5,89 @@ LEGY Push Manager for LINEPY
 Push接続の管理とイベント処理
 """
 
+import functools
+import itertools
 import logging
+import random
 import struct
 import threading
 import time
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+import traceback
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
 
-from .data import LegyH2PushFrame, ServiceType
-from .conn import PushConnection
+from ..thrift import CompactReader, CompactWriter, gen_header_compact, write_thrift
+from .data import LegyH2PushFrame, ServiceType, SignOnRequest, WatchedChat
+from .conn import RECV_BUFFER_SIZE, PushConnection
 
 if TYPE_CHECKING:
     from ..base import BaseClient
 
 logger = logging.getLogger("linepy.push")
 
-
-def gen_service_mask(services: List[int]) -> int:
+# Reconnect backoff (seconds): full jitter over an exponentially growing cap
+RECONNECT_BASE_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+# A connection that stayed up this long resets the backoff
+STABLE_CONNECTION_TIME = 60.0
+# Max concurrent per-chat HTTP fetches
+FETCH_WORKERS = 16
+# Min seconds between push-triggered keep-alive fetchMyEvents calls
+KEEPALIVE_MIN_INTERVAL = 5.0
+# noop() is only sent after this many seconds without a successful call
+NOOP_IDLE_INTERVAL = 180.0
+# Seconds between refreshes of the active Square subscription
+SUBSCRIPTION_REFRESH_INTERVAL = 180.0
+
+# Status frame (type 0) payload: [0, Flag(0), PingInterval(30)]
+STATUS_PING_INTERVAL = 30
+_STATUS_PAYLOAD = bytes([0, 0, STATUS_PING_INTERVAL])
+# Sign-on path for the Square service (m=255: full event mask)
+_SQUARE_FETCH_MY_EVENTS_PATH = "fetchMyEvents?" + urlencode({"m": 255})
+# fetchMyEvents sign-on request, pre-serialized around its two variable
+# fields. Built with subscriptionId=0 and syncToken="", each of which
+# encodes to a single 0x00 byte right after its field header.
+_FME_TEMPLATE = write_thrift(
+    [[12, 1, [[10, 1, 0], [11, 2, ""], [8, 3, 100]]]], "fetchMyEvents", 4
+)
+_FME_ID_AT = len(gen_header_compact("fetchMyEvents")) + 2  # after struct + i64 headers
+_FME_PREFIX = _FME_TEMPLATE[:_FME_ID_AT]
+_FME_MID = _FME_TEMPLATE[_FME_ID_AT + 1:_FME_ID_AT + 2]  # syncToken field header
+_FME_SUFFIX = _FME_TEMPLATE[_FME_ID_AT + 3:]  # limit field and struct stops
+# Sign-on request header: request id, service type, 0, request length
+_SIGNON_HDR = struct.Struct("!HBBH")
+# Sign-on requests kept while awaiting a response (oldest evicted first)
+MAX_PENDING_SIGN_ON = 64
+
+
+def gen_service_mask(services: Sequence[int]) -> int:
     """Generate service mask for /PUSH endpoint."""
+    return _gen_service_mask(tuple(sorted(services)))
+
+
+def _peek_compact_i64_field1(buf: bytes) -> Optional[int]:
+    """
+    Read an i64 field 1 sitting at the very start of a compact struct.
+
+    Returns None when the payload does not start that way (or is cut
+    short), in which case the caller falls back to CompactReader.
+    """
+    if len(buf) < 2 or buf[0] != 0x16:  # field delta 1, compact type I64
+        return None
+    result = shift = 0
+    for i in range(1, min(len(buf), 11)):
+        byte = buf[i]
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return (result >> 1) ^ -(result & 1)  # zigzag
+        shift += 7
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _gen_service_mask(services: Tuple[int, ...]) -> int:
     mask = 0
     for s in services:
         mask |= 1 << (s - 1)
@@ -40,59 +106,97 @@ class PushManager:
         push.start()
     """
 
-    def __init__(self, client: "BaseClient"):
+    def __init__(self, client: "BaseClient", recv_buffer_size: int = RECV_BUFFER_SIZE):
         self.client = client
-        self.connections: List[PushConnection] = []
+        # The one live connection; every service is multiplexed over it
+        self.connection: Optional[PushConnection] = None
+        # Max bytes per socket read in PushConnection.read_loop
+        self.recv_buffer_size = recv_buffer_size
 
         # State
         self._running = False
         self._ping_interval = 30
         self._current_ping_id = 0
         self._access_token: Optional[str] = None
+        self._reconnect_delay = RECONNECT_BASE_DELAY
+        self._reconnect_max = RECONNECT_MAX_DELAY
+        # Fixed for a session; computed once in start()
+        self._service_mask = 0
+        self._push_path: Optional[str] = None
 
         # Sync tokens
         self.event_sync_token: Optional[str] = None
         self.subscription_id: Optional[int] = None
-        self.subscription_ids: Dict[int, float] = {}
+        # (subscription id, last refresh monotonic time); each square init
+        # replaces it
+        self._active_subscription: Optional[Tuple[int, float]] = None
+        self._subscription_refresh_interval = SUBSCRIPTION_REFRESH_INTERVAL
 
         # Request tracking
-        self.sign_on_requests: Dict[int, List] = {}
+        self.sign_on_requests: "OrderedDict[int, SignOnRequest]" = OrderedDict()
+        # Request ids are 15 bits on the wire (bit 15 is the fin flag in
+        # responses), so they cycle through 1..32767. next() on it is atomic.
+        self._next_req_id = itertools.cycle(range(1, 0x8000))
 
         # Callbacks
         self.on_event: Optional[Callable[[int, Any], None]] = None
 
         # Watched square chats (for fetchSquareChatEvents)
-        self.watched_chats: List[str] = []
-        self.chat_sync_tokens: Dict[str, str] = {}
-        self.chat_continuation_tokens: Dict[str, str] = {}
+        # One entry per chat, in watch order; fetch passes look each up once
+        self.chat_states: Dict[str, WatchedChat] = {}
         self.square_fetch_type: int = 1  # Default 1
 
         # Thread
         self._thread: Optional[threading.Thread] = None
+        # Runs push-triggered fetches and noop calls; created in start()
+        self._worker: Optional[ThreadPoolExecutor] = None
+        # Runs the HTTP calls of a fetch pass concurrently; created in start()
+        self._fetch_pool: Optional[ThreadPoolExecutor] = None
+        # Held by whoever owns the fetch worker: taken in on_push and
+        # released by _fetch_square_events when it runs out of work
         self._fetch_lock = threading.Lock()
+        # Set by on_push; cleared by the fetch worker at the start of a pass
+        self._fetch_pending = threading.Event()
+        # Keep-alive fetchMyEvents runs at most once per interval
+        self._last_keepalive_ts = 0.0
+        self._keepalive_min_interval = KEEPALIVE_MIN_INTERVAL
+        # Last successful API call on the session (monotonic seconds)
+        self._last_session_activity_ts = time.monotonic()
 
     def start(
         self,
         watched_chats: List[str] = [],
         on_event: Optional[Callable[[Any, Any], None]] = None,
         fetch_type: int = 1,
-        services: List[int] = [3, 8],
+        services: Sequence[int] = (3, 8),
     ):
         """Start Push connection loop."""
         if self._running:
             logger.warning("Push is already running")
             return
 
-        self.watched_chats = watched_chats
+        self.chat_states = {chat_mid: WatchedChat() for chat_mid in watched_chats}
         if on_event:
             self.on_event = on_event
         self.fetch_type = fetch_type
+        # Frozen so the reconnect loop never sees a caller's list change
+        services = tuple(services)
+        self._service_mask = gen_service_mask(services)
+        self._push_path = f"/PUSH/1/subs?m={self._service_mask}"
 
         # Initialize sync tokens
         self.event_sync_token = None
         self.subscription_id = 0
 
         self._running = True
+        # A push from the previous session may have left a fetch pending
+        self._fetch_pending.clear()
+        self._worker = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="linepy-push-worker"
+        )
+        self._fetch_pool = ThreadPoolExecutor(
+            max_workers=FETCH_WORKERS, thread_name_prefix="linepy-push-fetch"
+        )
 
         # Start main loop in a thread
         self._thread = threading.Thread(
@@ -106,32 +210,47 @@ class PushManager:
     def stop(self):
         """Stop push connection."""
         self._running = False
-        for conn in self.connections:
+        conn, self.connection = self.connection, None
+        if conn is not None:
             conn.close()
-        self.connections = []
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.shutdown(wait=False, cancel_futures=True)
+        fetch_pool, self._fetch_pool = self._fetch_pool, None
+        if fetch_pool is not None:
+            fetch_pool.shutdown(wait=False, cancel_futures=True)
         logger.info("Push stopped")
 
-    def _run_loop(self, services: List[int]):
+    def _run_loop(self, services: Tuple[int, ...]):
         """Main run loop with auto-reconnect."""
         while self._running and self.client.auth_token:
+            started = time.monotonic()
             try:
                 # Fetch sync tokens via HTTP first to avoid blocking the Push socket later
                 self._refresh_sync_tokens()
 
-                self.connections = []
+                self.connection = None
                 conn = self._initialize_connection(services)
                 self._init_and_read(conn, services)
             except Exception as e:
                 logger.warning("Push connection error: %s", e)
 
-            if self._running:
-                logger.debug("Reconnecting in 3 seconds...")
-                time.sleep(3)
+            if time.monotonic() - started >= STABLE_CONNECTION_TIME:
+                self._reconnect_delay = RECONNECT_BASE_DELAY
 
-    def _initialize_connection(self, services: List[int]) -> PushConnection:
+            if self._running:
+                # Exponential backoff with full jitter, so clients dropped
+                # together do not reconnect in lockstep
+                delay = min(self._reconnect_max, self._reconnect_delay * 2)
+                self._reconnect_delay = delay
+                wait = random.uniform(0, delay)
+                logger.debug("Reconnecting in %.1f seconds...", wait)
+                time.sleep(wait)
+
+    def _initialize_connection(self, services: Tuple[int, ...]) -> PushConnection:
         """Create and initialize a new connection."""
-        conn = PushConnection(self)
-        self.connections.append(conn)
+        conn = PushConnection(self, self.recv_buffer_size)
+        self.connection = conn
         self._access_token = self.client.auth_token
 
         headers = {
@@ -141,62 +260,84 @@ class PushManager:
             "accept": "application/octet-stream",
         }
 
-        mask = gen_service_mask(services)
         host = "gd2.line.naver.jp"  # TODO: configurable
-        path = f"/PUSH/1/subs?m={mask}"
+        if self._push_path is None:
+            self._service_mask = gen_service_mask(services)
+            self._push_path = f"/PUSH/1/subs?m={self._service_mask}"
 
-        logger.debug("Connecting to %s with mask=%d", host, mask)
-        conn.connect(host, 443, path, headers)
+        logger.debug("Connecting to %s with mask=%d", host, self._service_mask)
+        conn.connect(host, 443, self._push_path, headers)
 
         return conn
 
     def _refresh_sync_tokens(self):
         """Fetch initial sync tokens for watched chats."""
-        if not self.watched_chats:
+        if not self.chat_states:
             return
 
-        logger.debug("Refreshing sync tokens for %d chats", len(self.watched_chats))
-        for chat_mid in self.watched_chats:
+        logger.debug("Refreshing sync tokens for %d chats", len(self.chat_states))
+        chats = []
+        for chat_mid, state in list(self.chat_states.items()):
             # 既に sync_token がある場合はスキップ（再接続時の上書き防止）
-            if chat_mid in self.chat_sync_tokens:
+            if state.sync_token:
                 logger.debug("Skipping %s (already has token)", chat_mid[:12])
-                continue
+            else:
+                chats.append((chat_mid, state))
+        if not chats:
+            return
 
+        # Independent requests, so they are issued concurrently and merged here
+        futures = self._submit_fetches(
+            [(self._fetch_initial_sync_token, chat_mid) for chat_mid, _ in chats]
+        )
+        for (chat_mid, state), future in zip(chats, futures):
             try:
-                res = self.client.square.fetchSquareChatEvents(chat_mid, limit=1)
-                if hasattr(res, 'syncToken') and res.syncToken:
-                    self.chat_sync_tokens[chat_mid] = res.syncToken
-                    logger.debug("Token for %s: %s...", chat_mid[:12], res.syncToken[:10])
-            except Exception as e:
-                logger.warning("Failed to get sync token for %s: %s", chat_mid[:12], e)
+                token = future.result()
+            except CancelledError:
+                return  # Stopped meanwhile
+            if token:
+                state.sync_token = token
+                logger.debug("Token for %s: %s...", chat_mid[:12], token[:10])
+
+    def _fetch_initial_sync_token(self, chat_mid: str) -> Optional[str]:
+        """Fetch the current sync token of one chat (pool thread)."""
+        try:
+            res = self.client.square.fetchSquareChatEvents(chat_mid, limit=1)
+            self._last_session_activity_ts = time.monotonic()
+            if res.syncToken:
+                return res.syncToken
+        except Exception as e:
+            logger.warning("Failed to get sync token for %s: %s", chat_mid[:12], e)
+        return None
 
-    def _init_and_read(self, conn: PushConnection, services: List[int]):
+    def _init_and_read(self, conn: PushConnection, services: Tuple[int, ...]):
         """Initialize services and start reading."""
 
         # Send Status Frame (Type 0)
-        # Payload: [0, Flag(0), PingInterval(30)]
-        ping_interval = 30
-        status_payload = bytes([0, 0, ping_interval])
-        conn.write_request(0, status_payload)
-        logger.debug("Sent Status Frame: interval=%ds", ping_interval)
+        conn.write_request(0, _STATUS_PAYLOAD)
+        logger.debug("Sent Status Frame: interval=%ds", STATUS_PING_INTERVAL)
 
-        # Initialize each service
+        # Initialize each service. All sign-on requests share this one
+        # connection; they are only buffered here, so there is nothing to
+        # gain from issuing them from separate threads.
         for service in services:
             if service == ServiceType.SQUARE:  # 3
                 self._init_square_service(conn)
             elif service in [ServiceType.TALK_FETCHOPS, ServiceType.TALK_SYNC]:  # 5, 8
                 self._init_talk_service(conn, service)
 
+        # Status frame and sign-on requests go out in one write
+        conn.send_data_to_socket()
+
         # Start read loop (blocks)
         conn.read_loop()
 
     def _init_square_service(self, conn: PushConnection):
         """Initialize Square (Service 3) context."""
-        # Use m=255 for full event mask
-        params = {"m": "255"}
-
         # Ensure subscription_id is set if not already
-        # CHRLINE forces new subscriptionID on every Init
+        # CHRLINE forces new subscriptionID on every Init. This is an id
+        # (epoch millis), so it stays on the wall clock; every elapsed-time
+        # check in this module uses time.monotonic().
         self.subscription_id = int(time.time() * 1000)
 
         request = self._build_fetch_my_events_request(
@@ -204,12 +345,12 @@ class PushManager:
             self.event_sync_token or ""
         )
 
-        # Build path with params
-        path = "fetchMyEvents?" + "&".join([f"{k}={v}" for k, v in params.items()])
-        self._send_sign_on_request(conn, ServiceType.SQUARE, request, path)
+        self._send_sign_on_request(
+            conn, ServiceType.SQUARE, request, _SQUARE_FETCH_MY_EVENTS_PATH
+        )
 
-        # Initialize subscription_ids for tracking refreshes
-        self.subscription_ids[self.subscription_id] = time.time()
+        # Track the active subscription for refreshes
+        self._active_subscription = (self.subscription_id, time.monotonic())
         logger.debug("Square service initialized (subscription=%d)", self.subscription_id)
 
     def _init_talk_service(self, conn: PushConnection, service_type: int):
@@ -218,17 +359,14 @@ class PushManager:
         logger.debug("Talk service %d (not implemented)", service_type)
 
     def _build_fetch_my_events_request(self, subscription_id: int, sync_token: str) -> bytes:
-        """Build fetchMyEvents request payload."""
-        from ..thrift import write_thrift
-
-        params = [
-            [12, 1, [
-                [10, 1, subscription_id],
-                [11, 2, sync_token],
-                [8, 3, 100],  # limit
-            ]]
-        ]
-        return bytes(write_thrift(params, "fetchMyEvents", 4))
+        """Build fetchMyEvents request payload (limit=100)."""
+        buf = bytearray(_FME_PREFIX)
+        writer = CompactWriter(buf)
+        writer.write_i64(subscription_id)
+        buf += _FME_MID
+        writer.write_binary(sync_token)
+        buf += _FME_SUFFIX
+        return bytes(buf)
 
     def _send_sign_on_request(
         self,
@@ -238,15 +376,14 @@ class PushManager:
         method_name: str
     ):
         """Send a sign-on request."""
-        request_id = len(self.sign_on_requests) + 1
+        request_id = next(self._next_req_id)
         logger.debug("Sending sign-on request #%d: service=%d", request_id, service_type)
 
-        payload = struct.pack("!H", request_id)
-        payload += bytes([service_type, 0])
-        payload += struct.pack("!H", len(request))
-        payload += request
+        payload = _SIGNON_HDR.pack(request_id, service_type, 0, len(request)) + request
 
-        self.sign_on_requests[request_id] = [service_type, method_name, None]
+        self.sign_on_requests[request_id] = SignOnRequest(service_type, method_name)
+        if len(self.sign_on_requests) > MAX_PENDING_SIGN_ON:
+            self.sign_on_requests.popitem(last=False)
         conn.write_request(2, payload)
 
     # ========== Callbacks from Connection ==========
@@ -257,45 +394,52 @@ class PushManager:
         logger.debug("Received LEGY PING id=%d", ping_id)
 
         # Check subscriptions that need refresh
-        now = time.time()
-        refresh_ids = []
-        for sub_id, last_time in list(self.subscription_ids.items()):
-            if (now - last_time) >= 3000:
-                self.subscription_ids[sub_id] = now
-                refresh_ids.append(sub_id)
-
-        if refresh_ids:
-            logger.debug("Refreshing subscriptions: %s", refresh_ids)
-
-        # Call noop every 3 pings (like linejs)
-        if ping_id % 3 == 0:
-            threading.Thread(
-                target=self._call_noop,
-                daemon=True
-            ).start()
+        active = self._active_subscription
+        if active is not None:
+            sub_id, last_time = active
+            now = time.monotonic()
+            if (now - last_time) >= self._subscription_refresh_interval:
+                self._active_subscription = (sub_id, now)
+                logger.debug("Refreshing subscription: %d", sub_id)
+
+        # Keep the session alive with noop only when nothing else has used
+        # it recently (linejs calls it every 3 pings unconditionally)
+        if time.monotonic() - self._last_session_activity_ts > NOOP_IDLE_INTERVAL:
+            self._submit(self._call_noop)
+
+    def _submit(self, fn: Callable[[], None]) -> Optional[Future]:
+        """Run fn on the worker pool; None when push is not running."""
+        worker = self._worker
+        if worker is None:
+            return None
+        try:
+            return worker.submit(fn)
+        except RuntimeError:
+            return None  # Shut down by stop() meanwhile
 
     def _call_noop(self):
         """Call talk.noop() to keep session alive."""
         try:
             self.client.talk.noop()
+            self._last_session_activity_ts = time.monotonic()
             logger.debug("Called noop()")
         except Exception as e:
             logger.warning("noop() failed: %s", e)
 
     def on_sign_on_response(self, request_id: int, is_fin: bool, data: bytes):
         """Handle sign-on response."""
-        if request_id not in self.sign_on_requests:
+        req = self.sign_on_requests.get(request_id)
+        if req is None:
             return
+        req.result = data
+        if is_fin:
+            del self.sign_on_requests[request_id]
 
-        service_type, method_name, _ = self.sign_on_requests[request_id]
-
-        if service_type == ServiceType.SQUARE:
+        if req.service_type == ServiceType.SQUARE:
             self._handle_square_response(data)
 
     def _handle_square_response(self, data: bytes):
         """Handle Square (fetchMyEvents) response."""
-        from ..thrift import read_thrift
-
         try:
             # Note: This is usually the initial fetch result
             logger.debug("Received Square response (%d bytes)", len(data))
@@ -308,147 +452,242 @@ class PushManager:
 
         if frame.service_type == ServiceType.SQUARE:  # 3
             # Extract subscriptionId from payload (like linejs L445-448)
-            if frame.push_payload and len(frame.push_payload) > 0:
-                try:
-                    from ..thrift import CompactReader
-                    proto = CompactReader(frame.push_payload)
-                    parsed = proto.read_struct()
-                    if 1 in parsed:  # Field 1 = subscriptionId
-                        self.subscription_id = parsed[1]
-                        logger.debug("Updated subscriptionId from push: %d", self.subscription_id)
-                except Exception as e:
-                    logger.debug("Failed to parse push payload: %s", e)
-
-            # Server notified us of new events, fetch them in a separate thread
-            threading.Thread(
-                target=self._fetch_square_events,
-                daemon=True
-            ).start()
+            if frame.push_payload:
+                # Field 1 = subscriptionId, normally the first field
+                sub_id = _peek_compact_i64_field1(frame.push_payload)
+                if sub_id is None:
+                    try:
+                        proto = CompactReader(frame.push_payload)
+                        sub_id = proto.read_struct().get(1)
+                    except Exception as e:
+                        logger.debug("Failed to parse push payload: %s", e)
+                if sub_id is not None:
+                    self.subscription_id = sub_id
+                    logger.debug("Updated subscriptionId from push: %d", self.subscription_id)
+
+            # Server notified us of new events, fetch them on the worker
+            # pool. A fetch already running picks this push up in one more
+            # pass instead.
+            self._fetch_pending.set()
+            if self._fetch_lock.acquire(blocking=False):
+                # The worker now owns the lock and releases it when done
+                future = self._submit(self._fetch_square_events)
+                if future is None:
+                    self._fetch_lock.release()
+                else:
+                    future.add_done_callback(self._on_fetch_done)
         elif frame.service_type == 8:
             logger.debug("Talk (Service 8) notification received")
 
+    def _submit_fetches(self, calls: List[Tuple[Callable[..., Any], ...]]) -> List[Future]:
+        """
+        Start (fn, *args) calls on the fetch pool.
+
+        Returns one future per call, or fewer (possibly none) once stop()
+        has shut the pool down.
+        """
+        pool = self._fetch_pool
+        futures = []
+        if pool is None:
+            return futures
+        try:
+            for fn, *args in calls:
+                futures.append(pool.submit(fn, *args))
+        except RuntimeError:
+            pass  # Shut down by stop() meanwhile
+        return futures
+
+    def _on_fetch_done(self, future: Future):
+        """Release the fetch lock for a fetch that stop() cancelled unrun."""
+        if future.cancelled():
+            self._fetch_lock.release()
+
     def _fetch_square_events(self):
-        """Fetch Square events via HTTP (triggered by push)."""
-        # ロックを取得
-        logger.debug("Requesting fetch lock...")
-        if not self._fetch_lock.acquire(blocking=False):
-            logger.debug("Fetch lock busy, skipping to avoid concurrency.")
+        """
+        Fetch Square events via HTTP (triggered by push).
+
+        Runs with _fetch_lock already held (acquired in on_push). Pushes that
+        arrive meanwhile only set _fetch_pending, and this loop makes one more
+        pass for them, so a burst of pushes costs a single extra fetch.
+        """
+        logger.debug("Fetch worker started.")
+        while True:
+            try:
+                while self._fetch_pending.is_set():
+                    self._fetch_pending.clear()
+                    self._fetch_square_events_once()
+            finally:
+                self._fetch_lock.release()
+                logger.debug("Fetch lock released.")
+
+            # A push may have come in between the last pass and the release;
+            # if on_push did not take the lock for it, carry on here
+            if not self._fetch_pending.is_set() or not self._fetch_lock.acquire(blocking=False):
+                return
+
+    def _fetch_square_events_once(self):
+        """One fetch pass: keep-alive fetchMyEvents plus every watched chat."""
+        now = time.monotonic()
+        keep_alive = bool(
+            self.subscription_id and self.event_sync_token
+            and now - self._last_keepalive_ts >= self._keepalive_min_interval
+        )
+        if keep_alive:
+            self._last_keepalive_ts = now
+
+        chats = list(self.chat_states.items())
+        if not keep_alive and not chats:
             return
 
-        logger.debug("Fetch lock acquired.")
-        try:
-            # --- Keep-Alive Hack: Call fetchMyEvents to maintain global subscription ---
-            # This mimics linejs behavior which uses fetchMyEvents for everything.
-            # We discard the events here but update the subscriptionId and syncToken.
-            if self.subscription_id and self.event_sync_token:
+        # All HTTP calls of the pass are independent and run concurrently.
+        # Chat results are applied here in watch-list order, so tokens,
+        # storage writes and on_event calls stay on this thread.
+        calls = [(self._fetch_chat_events, chat_mid, state) for chat_mid, state in chats]
+        if keep_alive:
+            calls.append((self._keep_subscription_alive,))
+        futures = self._submit_fetches(calls)
+        for (chat_mid, state), future in zip(chats, futures):
+            try:
+                result = future.result()
+            except CancelledError:
+                return  # Stopped meanwhile
+            error = result if isinstance(result, Exception) else None
+            if error is None:
                 try:
-                    logger.debug("Calling fetchMyEvents to keep subscription alive (sub=%d, sync=%s...)",
-                                 self.subscription_id, self.event_sync_token[:10])
-
-                    # fetchMyEvents(subscriptionId, syncToken, limit, continuationToken)
-                    # Note: Arguments order depends on the generated code. assuming standard order.
-                    # Based on square.py: fetchMyEvents(self, subscriptionId, syncToken=None, limit=None, continuationToken=None, fetchType=None)
-
-                    global_res = self.client.square.fetchMyEvents(
-                        subscriptionId=self.subscription_id,
-                        syncToken=self.event_sync_token,
-                        limit=10  # Small limit just for keep-alive
-                    )
-
-                    if hasattr(global_res, 'subscription'):
-                         if hasattr(global_res.subscription, 'subscriptionId'):
-                             new_sub = global_res.subscription.subscriptionId
-                             if new_sub != self.subscription_id:
-                                 self.subscription_id = new_sub
-                                 logger.info("Global Subscription ID updated to %d", new_sub)
-
-                    if hasattr(global_res, 'syncToken') and global_res.syncToken:
-                        self.event_sync_token = global_res.syncToken
-                        # logger.debug("Global SyncToken updated")
-
+                    self._apply_chat_events(chat_mid, state, *result)
                 except Exception as e:
-                    logger.warning("Keep-alive fetchMyEvents failed: %s", e)
-            # --------------------------------------------------------------------------
+                    error = e
+            if error is not None:
+                logger.warning("Error fetching events for %s: %s", chat_mid[:12], error)
+                logger.debug("".join(traceback.format_exception(error)))
+
+    def _keep_subscription_alive(self):
+        """
+        Keep-Alive Hack: Call fetchMyEvents to maintain global subscription.
+
+        This mimics linejs behavior which uses fetchMyEvents for everything.
+        We discard the events here but update the subscriptionId and syncToken
+        (state the per-chat fetches do not touch).
+        """
+        try:
+            logger.debug("Calling fetchMyEvents to keep subscription alive (sub=%d, sync=%s...)",
+                         self.subscription_id, self.event_sync_token[:10])
+
+            # fetchMyEvents(subscriptionId, syncToken, limit, continuationToken)
+            # Note: Arguments order depends on the generated code. assuming standard order.
+            # Based on square.py: fetchMyEvents(self, subscriptionId, syncToken=None, limit=None, continuationToken=None, fetchType=None)
+
+            global_res = self.client.square.fetchMyEvents(
+                subscriptionId=self.subscription_id,
+                syncToken=self.event_sync_token,
+                limit=10  # Small limit just for keep-alive
+            )
+            self._last_session_activity_ts = time.monotonic()
+
+            # FetchMyEventsResponse fields always exist (None when unset)
+            subscription = global_res.subscription
+            if subscription is not None:
+                new_sub = subscription.subscriptionId
+                if new_sub != self.subscription_id:
+                    self.subscription_id = new_sub
+                    logger.info("Global Subscription ID updated to %d", new_sub)
+
+            if global_res.syncToken:
+                self.event_sync_token = global_res.syncToken
+                # logger.debug("Global SyncToken updated")
 
-            if not self.watched_chats:
-                return
+        except Exception as e:
+            logger.warning("Keep-alive fetchMyEvents failed: %s", e)
 
-            for chat_mid in self.watched_chats:
-                try:
-                    sync_token = self.chat_sync_tokens.get(chat_mid)
-                    cont_token = self.chat_continuation_tokens.get(chat_mid)
-                    logger.debug("Fetch start for %s. Token: %s, Cont: %s",
-                                 chat_mid[:12], sync_token, cont_token[:10] if cont_token else None)
-
-                    # sync_token がない場合は、まず最新位置を取得する
-                    if not sync_token:
-                        logger.debug("No sync token, fetching limit=1 to init.")
-                        init_res = self.client.square.fetchSquareChatEvents(chat_mid, limit=1)
-                        if hasattr(init_res, 'syncToken') and init_res.syncToken:
-                            self.chat_sync_tokens[chat_mid] = init_res.syncToken
-                            logger.debug("Initialized Token: %s", init_res.syncToken)
-                        # 初期化時はcontinuationTokenもクリアすべきか？ -> 多分YES
-                        if chat_mid in self.chat_continuation_tokens:
-                            del self.chat_continuation_tokens[chat_mid]
-                        continue
-
-                    response = self.client.square.fetchSquareChatEvents(
-                        squareChatMid=chat_mid,
-                        syncToken=sync_token,
-                        continuationToken=cont_token,
-                        limit=50,
-                        fetchType=self.square_fetch_type
-                    )
-
-                    # Update sync token
-                    if hasattr(response, 'syncToken') and response.syncToken:
-                        new_token = response.syncToken
-                        self.chat_sync_tokens[chat_mid] = new_token
-                        if new_token != sync_token:
-                            logger.debug("Token UPDATED.")
-                            # Save to storage
-                            if hasattr(self.client, 'token_manager'):
-                                self.client.token_manager.set_square_sync_token(chat_mid, new_token)
-
-                    # Update continuation token
-                    if hasattr(response, 'continuationToken'):
-                         # Noneの場合もあるので注意。Noneならクリアするか、単に上書きするか。
-                         # linejsの実装: continuationToken = response.continuationToken
-                         # Noneなら次はないということなので、保持しているものを更新する
-                         self.chat_continuation_tokens[chat_mid] = response.continuationToken
-                         if hasattr(self.client, 'token_manager') and response.continuationToken:
-                             self.client.token_manager.set_square_continuation_token(chat_mid, response.continuationToken)
-
-                    # Process events
-                    events = response.events if hasattr(response, 'events') else []
-                    if events:
-                        first_ev = events[0]
-                        last_ev = events[-1]
-                        logger.debug(
-                            "Fetched %d events. \nFirst: SQEqSeq=%s Type=%s\nLast:  SQEqSeq=%s Type=%s",
-                            len(events),
-                            getattr(first_ev, 'squareEventId', '?'), getattr(first_ev, 'type', '?'),
-                            getattr(last_ev, 'squareEventId', '?'), getattr(last_ev, 'type', '?')
-                        )
-
-                    for event in events:
-                        if self.on_event:
-                            self.on_event(ServiceType.SQUARE, event)
+    def _fetch_chat_events(self, chat_mid: str, state: WatchedChat):
+        """
+        Fetch one watched chat (pool thread; no shared state is written).
 
-                except Exception as e:
-                    logger.warning("Error fetching events for %s: %s", chat_mid[:12], e)
-                    import traceback
-                    logger.debug(traceback.format_exc())
-        finally:
-            self._fetch_lock.release()
-            logger.debug("Fetch lock released.")
+        Returns (sync_token, response), where sync_token is None for the
+        limit=1 fetch that initializes a chat, or the exception raised.
+        """
+        try:
+            sync_token = state.sync_token
+            cont_token = state.continuation_token
+            logger.debug("Fetch start for %s. Token: %s, Cont: %s",
+                         chat_mid[:12], sync_token, cont_token[:10] if cont_token else None)
+
+            # sync_token がない場合は、まず最新位置を取得する
+            if not sync_token:
+                logger.debug("No sync token, fetching limit=1 to init.")
+                return None, self.client.square.fetchSquareChatEvents(chat_mid, limit=1)
+
+            return sync_token, self.client.square.fetchSquareChatEvents(
+                squareChatMid=chat_mid,
+                syncToken=sync_token,
+                continuationToken=cont_token,
+                limit=50,
+                fetchType=self.square_fetch_type
+            )
+        except Exception as e:
+            return e
 
+    def _apply_chat_events(
+        self, chat_mid: str, state: WatchedChat, sync_token: Optional[str], response: Any
+    ):
+        """Store tokens from a chat fetch and dispatch its events."""
+        self._last_session_activity_ts = time.monotonic()
+        # FetchSquareChatEventsResponse fields always exist (None when unset)
+        new_token = response.syncToken
+        if sync_token is None:
+            if new_token:
+                state.sync_token = new_token
+                logger.debug("Initialized Token: %s", new_token)
+            # 初期化時はcontinuationTokenもクリアすべきか？ -> 多分YES
+            state.continuation_token = None
+            return
+
+        token_manager = getattr(self.client, 'token_manager', None)
+
+        # Update sync token
+        if new_token:
+            state.sync_token = new_token
+            if new_token != sync_token:
+                logger.debug("Token UPDATED.")
+                # Save to storage
+                if token_manager is not None:
+                    token_manager.set_square_sync_token(chat_mid, new_token)
+
+        # Update continuation token
+        # Noneの場合もあるので注意。Noneならクリアするか、単に上書きするか。
+        # linejsの実装: continuationToken = response.continuationToken
+        # Noneなら次はないということなので、保持しているものを更新する
+        cont_token = response.continuationToken
+        state.continuation_token = cont_token
+        if token_manager is not None and cont_token:
+            token_manager.set_square_continuation_token(chat_mid, cont_token)
+
+        # Process events
+        events = response.events
+        if events and logger.isEnabledFor(logging.DEBUG):
+            first_ev = events[0]
+            last_ev = events[-1]
+            logger.debug(
+                "Fetched %d events. \nFirst: created=%s Type=%s\nLast:  created=%s Type=%s",
+                len(events),
+                first_ev.createdTime, first_ev.type,
+                last_ev.createdTime, last_ev.type,
+            )
+
+        on_event = self.on_event
+        if on_event:
+            for event in events:
+                on_event(ServiceType.SQUARE, event)
 
+    @property
+    def watched_chats(self) -> List[str]:
+        """Watched chat mids, in watch order."""
+        return list(self.chat_states)
 
     def add_watched_chat(self, chat_mid: str):
         """Add a chat to watch list."""
-        if chat_mid not in self.watched_chats:
-            self.watched_chats.append(chat_mid)
+        if chat_mid not in self.chat_states:
+            state = WatchedChat()
             logger.debug("Watching chat: %s", chat_mid[:12])
 
             # Load tokens from storage
@@ -457,17 +696,13 @@ class PushManager:
                 saved_cont = self.client.token_manager.get_square_continuation_token(chat_mid)
 
                 if saved_sync:
-                    self.chat_sync_tokens[chat_mid] = saved_sync
+                    state.sync_token = saved_sync
                     logger.debug("Loaded sync token for %s", chat_mid[:12])
                 if saved_cont:
-                    self.chat_continuation_tokens[chat_mid] = saved_cont
+                    state.continuation_token = saved_cont
                     logger.debug("Loaded continuation token for %s", chat_mid[:12])
+            self.chat_states[chat_mid] = state
 
     def remove_watched_chat(self, chat_mid: str):
         """Remove a chat from watch list."""
-        if chat_mid in self.watched_chats:
-            self.watched_chats.remove(chat_mid)
-            if chat_mid in self.chat_sync_tokens:
-                del self.chat_sync_tokens[chat_mid]
-            if chat_mid in self.chat_continuation_tokens:
-                del self.chat_continuation_tokens[chat_mid]
+        self.chat_states.pop(chat_mid, None)
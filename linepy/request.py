@@ -5,10 +5,51 @@ Handles all HTTP communication with LINE servers.
 Uses httpx for HTTP/2 support.
 """
 
-from typing import Optional, Dict, Any
+import functools
+import itertools
+import json
+import socket
+from typing import Any, Dict, Iterator, Optional
+
 import httpx
 
-from .thrift import ThriftReader, ThriftWriter, CompactReader
+from .thrift import CompactReader, ThriftReader, ThriftWriter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# httpx decodes br responses only when one of these is installed
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+# Options for every socket to LINE servers: no Nagle delay on small
+# Thrift requests, and TCP keep-alive probes to notice dead peers
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+# Probe timing is platform-specific (TCP_KEEPIDLE is Linux-only)
+SOCKET_OPTIONS += [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+]
+
+
+@functools.lru_cache(maxsize=64)
+def _url(host: str, path: str) -> str:
+    """Full URL for an endpoint (a handful of host/path pairs are reused)."""
+    return f"https://{host}{path}"
 
 
 class RequestClient:
@@ -40,21 +81,61 @@ class RequestClient:
         timeout: float = 30.0,
         long_timeout: float = 180.0,
     ):
-        self.device_name = device_name
+        self.device_name = device_name  # also builds _base_headers
         self.system_name = system_name
         self.timeout = timeout
         self.long_timeout = long_timeout
 
         self.auth_token: Optional[str] = None
-        self._http = httpx.Client(http2=True, timeout=timeout)
+        # Shared by Thrift calls and OBS uploads: HTTP/2 with pooled keep-alive
+        # connections so uploads don't pay a new TLS handshake each time
+        self._http = httpx.Client(
+            timeout=httpx.Timeout(timeout, connect=10.0),
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+                socket_options=SOCKET_OPTIONS,
+            ),
+        )
+
+        # Async client for asyncio-based polling (created on first use)
+        self._async_http: Optional[httpx.AsyncClient] = None
 
-        # Request sequence numbers
-        self._reqseq: Dict[str, int] = {}
+        # Request sequence counters, one per name; next() on a count is
+        # atomic, so concurrent callers never get the same number
+        self._reqseq: Dict[str, Iterator[int]] = {}
 
     def close(self):
         """Close HTTP client"""
         self._http.close()
 
+    async def aclose(self):
+        """Close async HTTP client (if it was created)"""
+        if self._async_http is not None:
+            await self._async_http.aclose()
+            self._async_http = None
+
+    @property
+    def device_name(self) -> str:
+        return self._device_name
+
+    @device_name.setter
+    def device_name(self, value: str):
+        self._device_name = value
+        # Headers that are the same for every call; _build_headers copies
+        # this instead of rebuilding the dict and the user agent each time
+        self._base_headers: Dict[str, str] = {
+            "Host": self.HOST,
+            "accept": "application/x-thrift",
+            "user-agent": self._get_user_agent(),
+            "x-line-application": value,
+            "content-type": "application/x-thrift",
+            "x-lal": "ja_JP",
+            "x-lpv": "1",
+            "x-lhm": "POST",
+            "accept-encoding": "br, gzip" if BROTLI_AVAILABLE else "gzip",
+        }
+
     @property
     def user_agent(self) -> str:
         """Get User-Agent header"""
@@ -77,17 +158,11 @@ class RequestClient:
         extra: Optional[Dict[str, str]] = None,
     ) -> Dict[str, str]:
         """Build request headers (matching linejs format)"""
-        headers = {
-            "Host": host or self.HOST,
-            "accept": "application/x-thrift",
-            "user-agent": self._get_user_agent(),
-            "x-line-application": self.device_name,
-            "content-type": "application/x-thrift",
-            "x-lal": "ja_JP",
-            "x-lpv": "1",
-            "x-lhm": method,
-            "accept-encoding": "gzip",
-        }
+        headers = self._base_headers.copy()
+        if host:
+            headers["Host"] = host
+        if method != "POST":
+            headers["x-lhm"] = method
 
         token = access_token or self.auth_token
         if token:
@@ -100,9 +175,10 @@ class RequestClient:
 
     def get_reqseq(self, name: str = "talk") -> int:
         """Get and increment request sequence number"""
-        seq = self._reqseq.get(name, 0)
-        self._reqseq[name] = seq + 1
-        return seq
+        counter = self._reqseq.get(name)
+        if counter is None:
+            counter = self._reqseq.setdefault(name, itertools.count())
+        return next(counter)
 
     def request(
         self,
@@ -113,6 +189,7 @@ class RequestClient:
         timeout: Optional[float] = None,
         protocol: int = 4,  # 3=binary, 4=compact
         extra_headers: Optional[Dict[str, str]] = None,
+        str_keys: bool = False,
     ) -> Any:
         """
         Send a Thrift request and parse response.
@@ -125,12 +202,13 @@ class RequestClient:
             timeout: Request timeout
             protocol: Thrift protocol (3=binary, 4=compact)
             extra_headers: Additional headers
+            str_keys: Key parsed structs/maps by str instead of int
 
         Returns:
             Parsed response data
         """
         target_host = host or self.HOST
-        url = f"https://{target_host}{path}"
+        url = _url(target_host, path)
         headers = self._build_headers(
             host=target_host,
             access_token=access_token,
@@ -146,11 +224,59 @@ class RequestClient:
         )
         response.raise_for_status()
 
-        # Parse response based on protocol
+        return self._parse_response(response.content, protocol, str_keys)
+
+    async def request_async(
+        self,
+        path: str,
+        data: bytes,
+        host: Optional[str] = None,
+        access_token: Optional[str] = None,
+        timeout: Optional[float] = None,
+        protocol: int = 4,
+        extra_headers: Optional[Dict[str, str]] = None,
+        str_keys: bool = False,
+    ) -> Any:
+        """
+        Async version of request().
+
+        Uses an httpx.AsyncClient (HTTP/2), so concurrent calls from one event
+        loop are multiplexed over a single connection. The client is bound to
+        the loop that first uses it; call aclose() from that loop when done.
+        """
+        if self._async_http is None:
+            self._async_http = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=10.0),
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True, socket_options=SOCKET_OPTIONS
+                ),
+            )
+
+        target_host = host or self.HOST
+        url = _url(target_host, path)
+        headers = self._build_headers(
+            host=target_host,
+            access_token=access_token,
+            method="POST",
+            extra=extra_headers,
+        )
+
+        response = await self._async_http.post(
+            url,
+            content=data,
+            headers=headers,
+            timeout=timeout or self.timeout,
+        )
+        response.raise_for_status()
+
+        return self._parse_response(response.content, protocol, str_keys)
+
+    def _parse_response(self, content: bytes, protocol: int, str_keys: bool = False) -> Any:
+        """Parse Thrift response body based on protocol"""
         if protocol == 4:
-            reader = CompactReader(response.content)
+            reader = CompactReader(content, str_keys=str_keys)
         else:
-            reader = ThriftReader(response.content)
+            reader = ThriftReader(content, str_keys=str_keys)
 
         return reader.parse_response()
 
@@ -170,7 +296,7 @@ class RequestClient:
         Returns:
             Raw response bytes
         """
-        url = f"https://{host or self.HOST}{path}"
+        url = _url(host or self.HOST, path)
         headers = self._build_headers(access_token=access_token, extra=extra_headers)
 
         if method == "GET":
@@ -203,7 +329,7 @@ class RequestClient:
         Returns:
             JSON response
         """
-        url = f"https://{host or self.HOST}{path}"
+        url = _url(host or self.HOST, path)
         headers = self._build_headers(
             access_token=access_token,
             extra={"content-type": "application/json"},
@@ -213,7 +339,15 @@ class RequestClient:
             headers["x-lhm"] = "GET"
             response = self._http.get(url, headers=headers)
         else:
-            response = self._http.post(url, json=data or {}, headers=headers)
+            if ORJSON_AVAILABLE:
+                content = orjson.dumps(data or {})
+            else:
+                content = json.dumps(
+                    data or {}, separators=(",", ":"), ensure_ascii=False
+                ).encode("utf-8")
+            response = self._http.post(url, content=content, headers=headers)
 
         response.raise_for_status()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(response.content)
         return response.json()
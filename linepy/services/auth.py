@@ -1,17 +1,45 @@
-from typing import Optional
+from typing import Optional, Tuple
 from .base import ServiceBase
+from ..thrift import CompactWriter, gen_header_compact, write_thrift
 from ..models.sync_structs import (
     RefreshAccessTokenRequest,
     RefreshAccessTokenResponse,
     ReportRefreshedAccessTokenRequest
 )
 
+
+def _token_request_template(method: str) -> Tuple[bytes, bytes]:
+    """
+    Pre-serialize a [[12, 1, [[11, 1, token]]]] request around its token.
+
+    Built with an empty token, whose length prefix is the single byte
+    right after the struct and string field headers.
+    """
+    template = write_thrift([[12, 1, [[11, 1, ""]]]], method, 4)
+    at = len(gen_header_compact(method)) + 2
+    return template[:at], template[at + 1:]
+
+
+def _fill_token_request(template: Tuple[bytes, bytes], token: str) -> bytes:
+    prefix, suffix = template
+    buf = bytearray(prefix)
+    CompactWriter(buf).write_binary(token)
+    buf += suffix
+    return bytes(buf)
+
+
+_REFRESH_TEMPLATE = _token_request_template("refresh")
+_REPORT_REFRESHED_TEMPLATE = _token_request_template("reportRefreshedAccessToken")
+
 class AuthService(ServiceBase):
     """Auth Service for token management."""
 
     # 標準のエンドポイント (必要に応じて設定)
     ENDPOINT = "/EXT/auth/tokenrefresh/v1"
     PROTOCOL = 4  # TCompactProtocol (推定)
+    # Token responses are a few hundred bytes; compressing them costs more
+    # than it saves
+    NO_COMPRESSION = {"accept-encoding": "identity"}
 
     def refresh(
         self,
@@ -26,22 +54,14 @@ class AuthService(ServiceBase):
         Returns:
             RefreshAccessTokenResponse containing new access token
         """
-        METHOD_NAME = "refresh"
-
-        # Build request struct: [[12, 1, [[11, 1, refresh_token]]]]
+        # Request struct: [[12, 1, [[11, 1, refresh_token]]]]
         # Struct ID 12, Field ID 1: RefreshAccessTokenRequest
         # RefreshAccessTokenRequest Field ID 1: refresh_token (String)
-        params = [
-            [12, 1, [
-                [11, 1, refresh_token]
-            ]]
-        ]
-
-        return self._call(
-            METHOD_NAME,
-            params,
+        return self._call_encoded(
+            _fill_token_request(_REFRESH_TEMPLATE, refresh_token),
             response_model=RefreshAccessTokenResponse,
-            endpoint="/EXT/auth/tokenrefresh/v1"
+            endpoint="/EXT/auth/tokenrefresh/v1",
+            extra_headers=self.NO_COMPRESSION,
         )
 
     def reportRefreshedAccessToken(
@@ -51,18 +71,10 @@ class AuthService(ServiceBase):
         """
         Report that access token was refreshed (if required).
         """
-        METHOD_NAME = "reportRefreshedAccessToken"
-
         # ReportRefreshedAccessTokenRequest
         # Field 1: access_token
-        params = [
-            [12, 1, [
-                [11, 1, access_token]
-            ]]
-        ]
-
-        return self._call(
-            METHOD_NAME,
-            params,
-            endpoint="/EXT/auth/tokenrefresh/v1"
+        return self._call_encoded(
+            _fill_token_request(_REPORT_REFRESHED_TEMPLATE, access_token),
+            endpoint="/EXT/auth/tokenrefresh/v1",
+            extra_headers=self.NO_COMPRESSION,
         )
@@ -36,10 +36,53 @@ class ServiceBase:
         method: str,
         params: Optional[List] = None,
         response_model: Optional[Type[T]] = None,
-        endpoint: Optional[str] = None
+        endpoint: Optional[str] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
     ) -> Any:
         """Make an API call"""
         from ..thrift import write_thrift
+
+        if params is None:
+            params = []
+
+        data = write_thrift(params, method, self.PROTOCOL)
+        return self._call_encoded(data, response_model, endpoint, extra_headers)
+
+    def _call_encoded(
+        self,
+        data: bytes,
+        response_model: Optional[Type[T]] = None,
+        endpoint: Optional[str] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Make an API call with an already serialized Thrift request"""
+        import httpx
+
+        target_endpoint = endpoint if endpoint is not None else self.ENDPOINT
+
+        try:
+            response = self.client.request.request(
+                path=target_endpoint,
+                data=data,
+                protocol=self.PROTOCOL,
+                extra_headers=extra_headers,
+                str_keys=response_model is not None,
+            )
+        except httpx.HTTPStatusError as e:
+            self._raise_http_error(e)
+
+        return self._handle_response(response, response_model)
+
+    async def _call_async(
+        self,
+        method: str,
+        params: Optional[List] = None,
+        response_model: Optional[Type[T]] = None,
+        endpoint: Optional[str] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Make an API call over the async HTTP client"""
+        from ..thrift import write_thrift
         import httpx
 
         if params is None:
@@ -50,29 +93,39 @@ class ServiceBase:
         data = write_thrift(params, method, self.PROTOCOL)
 
         try:
-            response = self.client.request.request(
+            response = await self.client.request.request_async(
                 path=target_endpoint,
                 data=data,
                 protocol=self.PROTOCOL,
+                extra_headers=extra_headers,
+                str_keys=response_model is not None,
             )
         except httpx.HTTPStatusError as e:
-            # HTTP error (4xx, 5xx)
-            from ..base import LineException
+            self._raise_http_error(e)
 
-            # Try to parse response body for more info
-            body = ""
-            try:
-                body = e.response.text[:500]  # First 500 chars
-            except:
-                pass
+        return self._handle_response(response, response_model)
 
-            raise LineException(
-                code=e.response.status_code,
-                message=f"HTTP {e.response.status_code}: {e.response.reason_phrase}",
-                metadata={"body": body, "url": str(e.request.url)},
-            )
+    def _raise_http_error(self, e) -> None:
+        """Convert HTTP error (4xx, 5xx) to LineException"""
+        from ..base import LineException
 
-        # Check for Thrift-level error
+        # Try to parse response body for more info
+        body = ""
+        try:
+            body = e.response.text[:500]  # First 500 chars
+        except:
+            pass
+
+        raise LineException(
+            code=e.response.status_code,
+            message=f"HTTP {e.response.status_code}: {e.response.reason_phrase}",
+            metadata={"body": body, "url": str(e.request.url)},
+        )
+
+    def _handle_response(
+        self, response: Any, response_model: Optional[Type[T]] = None
+    ) -> Any:
+        """Raise on Thrift-level error, otherwise validate response"""
         if isinstance(response, dict) and "error" in response:
             err = response["error"]
             from ..base import LineException
@@ -90,12 +143,8 @@ class ServiceBase:
     ) -> Union[T, Any]:
         """Validate and parse response data into Pydantic model."""
         if response_model and data is not None:
-            # Convert integer keys to string keys for Pydantic alias compatibility
-
-            # Convert integer keys to string keys for Pydantic alias compatibility
-            if isinstance(data, dict):
-                data = _convert_int_keys_to_str(data)
-
+            # _call asks the reader for string keys whenever a model is given,
+            # so the data already matches the models' string aliases
             return response_model.model_validate(data)
 
         return data
@@ -152,6 +152,33 @@ class SquareService(ServiceBase):
             METHOD_NAME, [[12, 1, params]], response_model=FetchSquareChatEventsResponse
         )
 
+    async def fetchSquareChatEventsAsync(
+        self,
+        squareChatMid: str,
+        syncToken: Optional[str] = None,
+        continuationToken: Optional[str] = None,
+        subscriptionId: int = 0,
+        limit: int = 100,
+        threadMid: Optional[str] = None,
+        fetchType: int = 1,
+    ) -> "FetchSquareChatEventsResponse":
+        """Fetch square chat events (async, see AsyncPollingManager)."""
+        METHOD_NAME = "fetchSquareChatEvents"
+        params = [
+            [10, 1, subscriptionId],
+            [11, 2, squareChatMid],
+            [11, 3, syncToken],
+            [8, 4, limit],
+            [8, 5, 1],  # direction
+            [8, 6, 1],  # inclusive
+            [11, 7, continuationToken],
+            [8, 8, fetchType],
+            [11, 9, threadMid],
+        ]
+        return await self._call_async(
+            METHOD_NAME, [[12, 1, params]], response_model=FetchSquareChatEventsResponse
+        )
+
     def sendSquareMessage(
         self,
         squareChatMid: str,
@@ -106,8 +106,8 @@ class CompactWriter:
     Based on linejs implementation.
     """
 
-    def __init__(self):
-        self._buffer = bytearray()
+    def __init__(self, buffer: Optional[bytearray] = None):
+        self._buffer = buffer if buffer is not None else bytearray()
         self._last_fid = 0
 
     def get_bytes(self) -> bytes:
@@ -266,24 +266,26 @@ def write_thrift(params: List, method_name: str, protocol: int = 4) -> bytes:
     debug_log(f"write_thrift: method={method_name}, protocol={protocol}")
     debug_log("params", params)
 
+    # Header and body go into one buffer, so there is no header+body concat
+    buf = bytearray()
     if protocol == 4:
-        header = gen_header_compact(method_name)
-        writer = CompactWriter()
+        buf += gen_header_compact(method_name)
     else:
-        header = gen_header_binary(method_name)
-        writer = CompactWriter()  # TODO: Implement binary writer
+        buf += gen_header_binary(method_name)
+    header_len = len(buf)
 
-    # Write struct
+    # Write struct (binary protocol also uses the compact writer)
+    # TODO: Implement binary writer
+    writer = CompactWriter(buf)
     _write_struct(writer, params)
 
     # Add field stop at the end if not already present
-    body = writer.get_bytes()
-    if not body or body[-1] != 0:
-        body += bytes([0x00])
+    if len(buf) == header_len or buf[-1] != 0:
+        buf.append(0x00)
 
-    result = header + body
-    debug_log("request bytes", result)
-    return result
+    if DEBUG:
+        debug_log("request bytes", bytes(buf))
+    return bytes(buf)
 
 
 def read_thrift(data: bytes, protocol: int = 4) -> Any:
@@ -485,14 +487,25 @@ def _write_value_raw(writer: CompactWriter, ftype: int, value: Any):
 # ========== Compact Protocol Reader ==========
 
 
+# str(fid) for the field ids seen in practice, so string-keyed reads
+# share one key object per id
+_FIELD_ID_STR = tuple(str(i) for i in range(256))
+
+
 class CompactReader:
-    """Thrift Compact Protocol Reader"""
+    """
+    Thrift Compact Protocol Reader
+
+    With str_keys=True, struct field ids and map keys are emitted as
+    strings, which is the form the Pydantic models' aliases expect.
+    """
 
-    def __init__(self, data: bytes):
+    def __init__(self, data: bytes, str_keys: bool = False):
         self.data = data
         self._pos = 0
         self._last_fid = 0
         self._bool_value = None
+        self._str_keys = str_keys
         debug_log(
             "CompactReader initialized with data",
             data[:100] if len(data) > 100 else data,
@@ -717,14 +730,17 @@ class CompactReader:
         else:
             raise Exception(f"Cannot read type {ftype}")
 
-    def read_struct(self) -> Dict[int, Any]:
+    def read_struct(self) -> Dict[Any, Any]:
         result = {}
         saved_fid = self._last_fid
         self._last_fid = 0
+        str_keys = self._str_keys
         while True:
             _, ftype, fid = self.read_field_begin()
             if ftype == TType.STOP:
                 break
+            if str_keys:
+                fid = _FIELD_ID_STR[fid] if 0 <= fid < 256 else str(fid)
             result[fid] = self.read_value(ftype)
         self._last_fid = saved_fid
         return result
@@ -732,10 +748,11 @@ class CompactReader:
     def read_map(self) -> Dict[Any, Any]:
         ktype, vtype, size = self.read_map_begin()
         result = {}
+        str_keys = self._str_keys
         for _ in range(size):
             key = self.read_value(ktype)
             val = self.read_value(vtype)
-            result[key] = val
+            result[str(key) if str_keys else key] = val
         return result
 
     def read_list(self) -> List[Any]:
@@ -759,11 +776,18 @@ class CompactReader:
         elif fid == 1:
             error = self.read_value(ftype)
             debug_log("Error response", error)
+            if isinstance(error, dict):
+                key = str if self._str_keys else int
+                code = error.get(key(1))
+                message = error.get(key(2))
+                metadata = error.get(key(3))
+            else:
+                code, message, metadata = None, str(error), None
             return {
                 "error": {
-                    "code": error.get(1) if isinstance(error, dict) else None,
-                    "message": error.get(2) if isinstance(error, dict) else str(error),
-                    "metadata": error.get(3) if isinstance(error, dict) else None,
+                    "code": code,
+                    "message": message,
+                    "metadata": metadata,
                     "_data": error,
                 }
             }
@@ -804,11 +828,12 @@ class ThriftWriter:
 class ThriftReader:
     """Legacy Binary Reader"""
 
-    def __init__(self, data: bytes):
+    def __init__(self, data: bytes, str_keys: bool = False):
         self.data = data
         self._pos = 0
+        self._str_keys = str_keys
 
     def parse_response(self) -> Any:
         # Use compact reader as fallback
-        reader = CompactReader(self.data)
+        reader = CompactReader(self.data, str_keys=self._str_keys)
         return reader.parse_response()
@@ -19,6 +19,14 @@ from .models.timeline import (
     SharePostResponse,
 )
 
+try:
+    import msgspec
+
+    from .models.timeline_fast import ListPostResponseFast
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -109,7 +117,7 @@ class Timeline:
             params: Query parameters
             data: Request body data
             method: HTTP method for x-lhm header
-            response_model: Pydantic model to parse response into
+            response_model: Pydantic model (or msgspec Struct) to parse response into
 
         Returns:
             Parsed Pydantic model or dict if no response_model
@@ -179,11 +187,13 @@ class Timeline:
                     f"Timeline request failed: {resp.status_code} {resp.text}"
                 )
 
-            json_data = resp.json()
-
             if response_model:
-                return response_model.model_validate(json_data)
-            return json_data
+                if MSGSPEC_AVAILABLE and issubclass(response_model, msgspec.Struct):
+                    return msgspec.json.decode(resp.content, type=response_model)
+                # Validate straight from the raw body; skips building an
+                # intermediate dict with json.loads
+                return response_model.model_validate_json(resp.content)
+            return resp.json()
 
     def create_post(
         self,
@@ -352,7 +362,8 @@ class Timeline:
         source_type: str = "TALKROOM",
         like_limit: int = 0,
         comment_limit: int = 0,
-    ) -> ListPostResponse:
+        fast: bool = False,
+    ) -> Union[ListPostResponse, "ListPostResponseFast"]:
         """
         List posts.
 
@@ -366,7 +377,12 @@ class Timeline:
             source_type: TALKROOM
             like_limit: Number of likes to fetch per post
             comment_limit: Number of comments to fetch per post
+            fast: Decode into msgspec ListPostResponseFast instead of the
+                Pydantic model (requires msgspec; use .to_pydantic() to convert)
         """
+        if fast and not MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec required. Install with: pip install msgspec")
+
         endpoint = "sn" if home_id.startswith("s") else "mh"
 
         params: Dict[str, Any] = {
@@ -380,8 +396,9 @@ class Timeline:
         if updated_time is not None:
             params["updatedTime"] = str(updated_time)
 
+        response_model = ListPostResponseFast if fast else ListPostResponse
         return self._request(
-            endpoint, "list.json", params, method="GET", response_model=ListPostResponse
+            endpoint, "list.json", params, method="GET", response_model=response_model
         )
 
     def delete_post(self, home_id: str, post_id: str) -> DeletePostResponse:
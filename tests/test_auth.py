@@ -0,0 +1,40 @@
+import unittest
+
+from linepy.services.auth import (
+    _REFRESH_TEMPLATE,
+    _REPORT_REFRESHED_TEMPLATE,
+    _fill_token_request,
+)
+from linepy.thrift import write_thrift
+
+# Lengths on both sides of the 1/2/3-byte varint boundaries
+TOKEN_LENGTHS = [0, 1, 127, 128, 129, 16383, 16384]
+
+TEMPLATES = [
+    ("refresh", _REFRESH_TEMPLATE),
+    ("reportRefreshedAccessToken", _REPORT_REFRESHED_TEMPLATE),
+]
+
+
+class TestTokenRequestTemplates(unittest.TestCase):
+    def assert_matches(self, method, template, token):
+        self.assertEqual(
+            _fill_token_request(template, token),
+            write_thrift([[12, 1, [[11, 1, token]]]], method, 4),
+        )
+
+    def test_templates_match_write_thrift(self):
+        for method, template in TEMPLATES:
+            for length in TOKEN_LENGTHS:
+                with self.subTest(method=method, length=length):
+                    self.assert_matches(method, template, "t" * length)
+
+    def test_templates_non_ascii_token(self):
+        token = "認証" * 25  # 150 UTF-8 bytes
+        for method, template in TEMPLATES:
+            with self.subTest(method=method):
+                self.assert_matches(method, template, token)
+
+
+if __name__ == "__main__":
+    unittest.main()
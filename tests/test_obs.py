@@ -0,0 +1,33 @@
+import base64
+import unittest
+from unittest.mock import patch
+
+from linepy import obs
+from linepy.obs import ObsBase
+
+PARAMS = {"ver": "2.0", "name": "写真 ünïcode.jpg", "type": "image", "size": 1234}
+
+
+def gen_with_stdlib(params) -> str:
+    with patch.object(obs, "ORJSON_AVAILABLE", False):
+        return ObsBase._gen_obs_params(params)
+
+
+class TestObsParams(unittest.TestCase):
+    def test_stdlib_fallback_is_compact_utf8(self):
+        raw = base64.b64decode(gen_with_stdlib(PARAMS))
+        self.assertEqual(
+            raw,
+            '{"ver":"2.0","name":"写真 ünïcode.jpg","type":"image","size":1234}'.encode(),
+        )
+
+    def test_orjson_and_stdlib_match_for_non_ascii(self):
+        if not obs.ORJSON_AVAILABLE:
+            self.skipTest("orjson is not installed")
+        with patch.object(obs, "ORJSON_AVAILABLE", True):
+            fast = ObsBase._gen_obs_params(PARAMS)
+        self.assertEqual(fast, gen_with_stdlib(PARAMS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import unittest
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from linepy import polling
+from linepy.polling import AsyncPollingManager, ChatState
+
+
+class FailingSquare:
+    """fetchSquareChatEvents that raises, or answers without a sync token."""
+
+    def __init__(self, error: bool):
+        self.error = error
+        self.calls = 0
+
+    def _fetch(self):
+        self.calls += 1
+        if self.error:
+            raise RuntimeError("server unavailable")
+        return SimpleNamespace(syncToken=None, continuationToken=None, events=[])
+
+    def fetchSquareChatEvents(self, *args, **kwargs):
+        return self._fetch()
+
+    async def fetchSquareChatEventsAsync(self, *args, **kwargs):
+        return self._fetch()
+
+
+def chat_state(square) -> ChatState:
+    return ChatState(
+        SimpleNamespace(square=square), "mchat", deque(), threading.Event(), None
+    )
+
+
+class TestInitTokenBackoff(unittest.TestCase):
+    def test_init_error_backs_off(self):
+        state = chat_state(FailingSquare(error=True))
+        self.assertGreater(state.poll(), 0.0)
+        self.assertGreater(state.poll(), 0.0)
+        self.assertEqual(state._err_count, 2)
+        self.assertIsNone(state.sync_token)
+
+    def test_init_without_token_backs_off(self):
+        state = chat_state(FailingSquare(error=False))
+        self.assertGreater(state.poll(), 0.0)
+        self.assertEqual(state._err_count, 1)
+
+    def test_async_init_without_token_backs_off(self):
+        square = FailingSquare(error=False)
+        manager = AsyncPollingManager(SimpleNamespace(square=square))
+
+        async def run():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(manager._watch_chat("mchat"), 0.3)
+
+        with patch.object(polling, "_error_backoff", return_value=0.1):
+            asyncio.run(run())
+        # One attempt per backoff period, not a tight loop
+        self.assertLessEqual(square.calls, 4)
+
+
+class TestAsyncStartFailure(unittest.TestCase):
+    def test_setup_error_reaches_caller(self):
+        manager = AsyncPollingManager(SimpleNamespace(square=FailingSquare(error=True)))
+        result = {}
+
+        def start():
+            try:
+                manager.start(watched_chats=["mchat"])
+            except Exception as e:
+                result["error"] = e
+
+        with patch.object(manager, "_spawn", side_effect=ValueError("bad chat")):
+            thread = threading.Thread(target=start, daemon=True)
+            thread.start()
+            thread.join(5)
+
+        self.assertFalse(thread.is_alive(), "start() blocked after a setup error")
+        self.assertIsInstance(result.get("error"), ValueError)
+        self.assertFalse(manager._running)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import struct
+import unittest
+
+from linepy.push.conn import PushConnection
+
+
+def packet(packet_type: int, payload: bytes, size_flags: int = 0) -> bytes:
+    return struct.pack("!HB", len(payload) | size_flags, packet_type) + payload
+
+
+def push(push_type: int, service_type: int, push_id: int, body: bytes = b"") -> bytes:
+    return packet(4, struct.pack("!BBi", push_type, service_type, push_id) + body)
+
+
+def server_ping(ping_id: int) -> bytes:
+    return packet(1, struct.pack("!BH", 2, ping_id))
+
+
+def sign_on(request_id: int, fin: bool, body: bytes) -> bytes:
+    return packet(3, struct.pack("!H", request_id | (0x8000 if fin else 0)) + body)
+
+
+class RecordingManager:
+    def __init__(self):
+        self.calls = []
+
+    def on_ping(self, ping_id):
+        self.calls.append(("ping", ping_id))
+
+    def on_sign_on_response(self, request_id, is_fin, data):
+        self.calls.append(("sign_on", request_id, is_fin, data))
+
+    def on_push(self, frame):
+        self.calls.append(
+            ("push", frame.push_type, frame.service_type, frame.push_id, frame.push_payload)
+        )
+
+
+class TestPushReceiveParser(unittest.TestCase):
+    def setUp(self):
+        self.manager = RecordingManager()
+        self.conn = PushConnection(self.manager)
+        self.writes = []
+        # The push ACK is a reused template, so copy what is written
+        self.conn.write_bytes = lambda data, flush=False: self.writes.append(bytes(data))
+
+    def feed(self, data: bytes, chunk: int = 0):
+        if not chunk:
+            self.conn._on_data_received(data)
+            return
+        for i in range(0, len(data), chunk):
+            self.conn._on_data_received(data[i : i + chunk])
+
+    def test_push_split_across_reads(self):
+        self.feed(push(2, 3, -5, b"payload"), chunk=1)
+        self.assertEqual(self.manager.calls, [("push", 2, 3, -5, b"payload")])
+        # ACK: size 6, type 4, ACK(1), service type, push id
+        self.assertEqual(self.writes, [struct.pack("!HBBBi", 6, 4, 1, 3, -5)])
+
+    def test_coalesced_packets(self):
+        data = (
+            server_ping(0x1234)
+            + push(0, 3, 7, b"x")
+            + sign_on(9, True, b"resp")
+            + push(2, 8, 2**31 - 1)
+        )
+        self.feed(data)
+        self.assertEqual(
+            self.manager.calls,
+            [
+                ("ping", 0x1234),
+                ("push", 0, 3, 7, b"x"),
+                ("sign_on", 9, True, b"resp"),
+                ("push", 2, 8, 2**31 - 1, b""),
+            ],
+        )
+        self.assertEqual(
+            self.writes,
+            [
+                struct.pack("!HBBH", 3, 1, 1, 0x1234),  # ping ACK
+                struct.pack("!HBBBi", 6, 4, 1, 8, 2**31 - 1),  # push ACK
+            ],
+        )
+
+    def test_zero_size_packets(self):
+        data = packet(2, b"") + packet(1, b"") + push(0, 3, 1) + packet(0, b"")
+        self.feed(data, chunk=2)
+        self.assertEqual(self.manager.calls, [("push", 0, 3, 1, b"")])
+        self.assertEqual(self.writes, [])
+        self.assertEqual(self.conn._buf_pos, 0)
+        self.assertEqual(len(self.conn.buffer), 0)
+
+    def test_size_ignores_bit_15(self):
+        self.feed(packet(4, struct.pack("!BBi", 0, 3, 4) + b"ab", size_flags=0x8000))
+        self.assertEqual(self.manager.calls, [("push", 0, 3, 4, b"ab")])
+
+    def test_chunked_sign_on_response(self):
+        data = (
+            sign_on(5, False, b"first-")
+            + sign_on(6, True, b"other")
+            + sign_on(5, False, b"second-")
+            + sign_on(5, True, b"last")
+        )
+        self.feed(data, chunk=7)
+        self.assertEqual(
+            self.manager.calls,
+            [
+                ("sign_on", 6, True, b"other"),
+                ("sign_on", 5, True, b"first-second-last"),
+            ],
+        )
+        self.assertEqual(self.conn.not_fin_payloads, {})
+
+    def test_compaction_keeps_partial_packet(self):
+        body = b"p" * 1000
+        packets = b"".join(push(0, 3, i, body) for i in range(80))  # > 64 KiB
+        tail = push(2, 3, 999, b"tail")
+        self.feed(packets + tail[:5])
+        self.assertEqual(len(self.manager.calls), 80)
+        # Parsed bytes were dropped; only the incomplete packet is left
+        self.assertEqual(self.conn._buf_pos, 0)
+        self.assertEqual(bytes(self.conn.buffer), tail[:5])
+
+        self.feed(tail[5:])
+        self.assertEqual(self.manager.calls[-1], ("push", 2, 3, 999, b"tail"))
+        self.assertEqual(self.manager.calls[:80], [("push", 0, 3, i, body) for i in range(80)])
+        self.assertEqual(self.writes, [struct.pack("!HBBBi", 6, 4, 1, 3, 999)])
+        self.assertEqual(len(self.conn.buffer), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import threading
+import unittest
+from types import SimpleNamespace
+
+from linepy.push.data import LegyH2PushFrame, ServiceType
+from linepy.push.manager import PushManager
+from linepy.thrift import write_thrift
+
+# Lengths on both sides of the 1/2/3-byte varint boundaries
+TOKEN_LENGTHS = [0, 1, 127, 128, 129, 16383, 16384]
+# zigzag(63) is the largest 1-byte varint, zigzag(-65) needs 2 bytes
+SUBSCRIPTION_IDS = [0, 1, -1, 63, 64, -64, -65, 1_760_000_000_000, 2**63 - 1, -(2**63)]
+
+
+def square_push() -> LegyH2PushFrame:
+    return LegyH2PushFrame(push_type=0, service_type=ServiceType.SQUARE, push_id=1)
+
+
+class TestPushFetchLock(unittest.TestCase):
+    def setUp(self):
+        # auth_token=None makes the connection loop exit right away
+        self.pm = PushManager(SimpleNamespace(auth_token=None))
+        self.fetched = threading.Event()
+        self.pm._fetch_square_events_once = self.fetched.set
+
+    def tearDown(self):
+        self.pm.stop()
+
+    def test_push_after_restart_with_cancelled_fetch(self):
+        """A fetch cancelled by stop() must not keep the fetch lock."""
+        self.pm.start(services=(3,))
+        # Occupy both worker threads so the push-triggered fetch queues
+        release = threading.Event()
+        busy = threading.Barrier(3)
+        for _ in range(2):
+            self.pm._submit(lambda: (busy.wait(), release.wait()))
+        busy.wait()
+
+        self.pm.on_push(square_push())
+        self.assertTrue(self.pm._fetch_lock.locked())
+        self.pm.stop()
+        release.set()
+
+        self.assertFalse(self.pm._fetch_lock.locked())
+        self.assertFalse(self.fetched.is_set())
+
+        self.pm.start(services=(3,))
+        self.pm.on_push(square_push())
+        self.assertTrue(self.fetched.wait(5))
+
+
+class TestFetchMyEventsTemplate(unittest.TestCase):
+    def test_template_matches_write_thrift(self):
+        pm = PushManager(SimpleNamespace(auth_token=None))
+        for subscription_id in SUBSCRIPTION_IDS:
+            for length in TOKEN_LENGTHS:
+                token = "t" * length
+                expected = write_thrift(
+                    [[12, 1, [[10, 1, subscription_id], [11, 2, token], [8, 3, 100]]]],
+                    "fetchMyEvents",
+                    4,
+                )
+                with self.subTest(subscription_id=subscription_id, length=length):
+                    self.assertEqual(
+                        pm._build_fetch_my_events_request(subscription_id, token), expected
+                    )
+
+    def test_template_non_ascii_token(self):
+        pm = PushManager(SimpleNamespace(auth_token=None))
+        token = "同期" * 50  # 300 UTF-8 bytes
+        expected = write_thrift(
+            [[12, 1, [[10, 1, 5], [11, 2, token], [8, 3, 100]]]], "fetchMyEvents", 4
+        )
+        self.assertEqual(pm._build_fetch_my_events_request(5, token), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import json
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from linepy import request
+from linepy.request import RequestClient
+
+DATA = {"displayName": "テスト ünïcode", "statusMessage": "", "count": 3}
+
+
+def sent_body(orjson: bool) -> bytes:
+    bodies = []
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        bodies.append(req.content)
+        return httpx.Response(200, json={})
+
+    client = RequestClient("DESKTOPWIN")
+    client._http = httpx.Client(transport=httpx.MockTransport(handler))
+    with patch.object(request, "ORJSON_AVAILABLE", orjson):
+        client.request_json("/api/profile", DATA)
+    return bodies[0]
+
+
+class TestRequestJsonBody(unittest.TestCase):
+    def test_stdlib_fallback_is_compact_utf8(self):
+        self.assertEqual(
+            sent_body(orjson=False),
+            json.dumps(DATA, separators=(",", ":"), ensure_ascii=False).encode(),
+        )
+        self.assertIn("テスト".encode(), sent_body(orjson=False))
+
+    def test_orjson_and_stdlib_match_for_non_ascii(self):
+        if not request.ORJSON_AVAILABLE:
+            self.skipTest("orjson is not installed")
+        self.assertEqual(sent_body(orjson=True), sent_body(orjson=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
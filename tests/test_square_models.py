@@ -0,0 +1,40 @@
+import re
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import linepy.models.square as square
+from linepy.models.square_struct_names import NAMES
+
+STRUCTS = Path(square.__file__).with_name("square_structs.py")
+
+
+class TestLazySquareModels(unittest.TestCase):
+    def test_names_match_generated_structs(self):
+        classes = re.findall(r"^class (\w+)\(", STRUCTS.read_text(), re.M)
+        self.assertEqual(list(NAMES), classes)
+
+    def test_star_imports_export_square_structs(self):
+        for module in ("linepy.models", "linepy.models.square"):
+            namespace = {}
+            exec(f"from {module} import *", namespace)
+            with self.subTest(module=module):
+                self.assertIn("SquareEvent", namespace)
+                self.assertIn("MessageStatusType", namespace)
+                self.assertTrue(namespace["SquareEvent"].__pydantic_complete__)
+
+    def test_import_and_dir_stay_lazy(self):
+        code = (
+            "import sys, linepy, linepy.models as m\n"
+            "assert 'SquareEvent' in dir(m) and 'SquareEvent' in dir(m.square)\n"
+            "print('linepy.models.square_structs' in sys.modules)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(out.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from linepy.services.base import _convert_int_keys_to_str
+from linepy.thrift import CompactReader, CompactWriter, _write_struct
+
+# Nested structs, int- and string-keyed maps, lists of structs, a bool
+# field and a field id outside the cached 0-255 range
+SUCCESS = [
+    [11, 1, "a"],
+    [8, 2, 5],
+    [12, 3, [[11, 1, "x"], [10, 300, 7], [13, 4, [8, 11, {1: "u", 2: "v"}]]]],
+    [15, 5, [12, [[[11, 1, "e1"]], [[8, 2, 3], [12, 3, [[11, 1, "deep"]]]]]]],
+    [13, 6, [11, 12, {"k": [[8, 1, 9]]}]],
+    [2, 7, True],
+]
+ERROR = [[8, 1, 42], [11, 2, "bad"], [13, 3, [11, 11, {"a": "b"}]]]
+
+
+def reply(params, error: bool = False) -> bytes:
+    """A compact reply message with params as the success or error field."""
+    buf = bytearray(b"\x82\x41\x00\x01m")
+    buf += b"\x1c" if error else b"\x0c\x00"
+    _write_struct(CompactWriter(buf), params)
+    return bytes(buf)
+
+
+class TestCompactReaderStrKeys(unittest.TestCase):
+    def test_success_matches_converted_int_keys(self):
+        data = reply(SUCCESS)
+        expected = _convert_int_keys_to_str(CompactReader(data).parse_response())
+        result = CompactReader(data, str_keys=True).parse_response()
+        self.assertEqual(result, expected)
+        self.assertEqual(result["3"]["300"], 7)
+
+    def test_error_fields(self):
+        data = reply(ERROR, error=True)
+        plain = CompactReader(data).parse_response()["error"]
+        error = CompactReader(data, str_keys=True).parse_response()["error"]
+        self.assertEqual(error["code"], 42)
+        self.assertEqual(error["message"], "bad")
+        self.assertEqual(error["metadata"], {"a": "b"})
+        self.assertEqual(error["_data"], _convert_int_keys_to_str(plain["_data"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from linepy.models.timeline import PostInfo
+
+
+class TestPostInfo(unittest.TestCase):
+    def test_numeric_fields_accept_lax_input(self):
+        """Counts and timestamps sent as strings or floats still parse."""
+        info = PostInfo.model_validate(
+            {
+                "postId": "p1",
+                "appSn": "123",
+                "likeCount": "4",
+                "commentCount": 2.0,
+                "createdTime": 1.7e12,
+                "updatedTime": "1700000000000",
+            }
+        )
+        self.assertEqual(info.appSn, 123)
+        self.assertEqual(info.likeCount, 4)
+        self.assertEqual(info.commentCount, 2)
+        self.assertEqual(info.createdTime, 1700000000000)
+        self.assertEqual(info.updatedTime, 1700000000000)
+
+
+if __name__ == "__main__":
+    unittest.main()
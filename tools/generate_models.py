@@ -558,6 +558,8 @@ class ThriftParser:
                     else:
                         all_types.add(name)
 
+        self.generated_names = sorted(all_types)
+
         # Generate code
         lines = []
         lines.append("# -*- coding: utf-8 -*-")
@@ -568,7 +570,7 @@ class ThriftParser:
         lines.append("from enum import IntEnum")
         lines.append("")
 
-        for name in sorted(list(all_types)):
+        for name in self.generated_names:
             if name in self.enums:
                 lines.append(f"class {name}(IntEnum):")
                 if not self.enums[name]["values"]:
@@ -621,10 +623,25 @@ class ThriftParser:
             lines.append("")
             lines.append("    class Config:")
             lines.append("        populate_by_name = True")
+            # Build schemas on first use; most structs are never validated
+            lines.append("        defer_build = True")
             lines.append("")
 
         return "\n".join(lines)
 
+    def generate_names(self) -> str:
+        """List the names emitted by generate_code, for lazy modules' __all__."""
+        lines = [
+            "# -*- coding: utf-8 -*-",
+            "# AUTO-GENERATED BY tools/generate_models.py",
+            "",
+            "NAMES = (",
+        ]
+        lines.extend(f'    "{name}",' for name in self.generated_names)
+        lines.append(")")
+        lines.append("")
+        return "\n".join(lines)
+
     def generate_service(self, service_name: str, endpoint: str = "/S4") -> str:
         model_submodule = service_name.lower().replace("service", "")
         lines = [
@@ -770,6 +787,9 @@ if __name__ == "__main__":
     parser.add_argument(
         "--service-output", type=str, help="Output file for the generated service"
     )
+    parser.add_argument(
+        "--names-output", help="Output file listing the generated model names"
+    )
     parser.add_argument("--endpoint", help="Service endpoint (e.g. /S4)")
     parser.add_argument("--service-source", help="Path to Python source file to extract method names from (for fallback)")
     args = parser.parse_args()
@@ -786,6 +806,11 @@ if __name__ == "__main__":
             f.write(code)
         print(f"Generated models to {args.output}")
 
+        if args.names_output:
+            with open(args.names_output, "w") as f:
+                f.write(thrift_parser.generate_names())
+            print(f"Generated model names to {args.names_output}")
+
     if args.service and args.service_output:
         code = thrift_parser.generate_service(args.service, endpoint=args.endpoint or "/S4")
         with open(args.service_output, "w") as f: